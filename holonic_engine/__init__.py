@@ -9,6 +9,9 @@ Core abstractions:
 __version__ = "0.1.0"
 __author__ = "NullCoward"
 
+import importlib
+from importlib.util import find_spec
+
 from .action import ActionParameter, ActionSignature, HolonAction
 from .agent import (
     HolonicObject,
@@ -25,16 +28,40 @@ from .serialization import (
     parse_ai_response,
     serialize_for_ai,
 )
-from .tokens import TokenCounter, count_tokens, is_available as tokens_available
+from .tokens import (
+    TokenCounter,
+    count_tokens,
+    count_tokens_async,
+    count_tokens_batch,
+    count_tokens_batch_async,
+    is_available as tokens_available,
+)
 from .logging import configure_logging, get_logger, logger as holonic_logger
 from .telemetry import HolonicTelemetry, get_telemetry, reset_telemetry, Timer
 
-# Storage is optional (requires sqlalchemy)
-try:
-    from .storage import HolonicStorage, SQLStorage, is_encryption_available, open_hln
-    _storage_available = True
-except ImportError:
-    _storage_available = False
+# Storage (requires sqlalchemy) and the interface (requires flask) are
+# optional and comparatively slow to import, so they load on first access
+_storage_available = find_spec("sqlalchemy") is not None
+_interface_available = find_spec("flask") is not None
+
+_LAZY_EXPORTS = {
+    "HolonicStorage": ".storage",
+    "SQLStorage": ".storage",
+    "is_encryption_available": ".storage",
+    "open_hln": ".storage",
+    "InterfaceHolon": ".interface",
+    "create_app": ".interface",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Core
@@ -66,6 +93,9 @@ __all__ = [
     # Tokens
     "TokenCounter",
     "count_tokens",
+    "count_tokens_async",
+    "count_tokens_batch",
+    "count_tokens_batch_async",
     "tokens_available",
     # Logging
     "configure_logging",
@@ -87,13 +117,9 @@ if _storage_available:
         "open_hln",
     ])
 
-# Interface is optional (requires flask)
-try:
-    from .interface import InterfaceHolon, create_app
-    _interface_available = True
+# Add interface exports if available
+if _interface_available:
     __all__.extend([
         "InterfaceHolon",
         "create_app",
     ])
-except ImportError:
-    _interface_available = False
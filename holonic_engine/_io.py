@@ -0,0 +1,33 @@
+"""
+File I/O helpers for the Holonic Engine.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write(path: str | os.PathLike, data: bytes) -> None:
+    """
+    Write bytes to a file atomically.
+
+    The data goes to a temporary file in the same directory, is fsynced, and
+    then replaces the target with os.replace(). Readers see either the old
+    file or the complete new one, never a partial write.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
@@ -4,68 +4,105 @@ HolonAction - A binding to an executable function with metadata for AI consumpti
 
 from __future__ import annotations
 
+import functools
 import inspect
 from typing import Any, Callable, Optional
 
 import attrs
 
 
-@attrs.define
+@attrs.frozen
 class ActionParameter:
-    """Represents a single parameter in an action's signature."""
+    """Represents a single parameter in an action's signature. Immutable."""
     name: str
     type_hint: Optional[str] = None
     default: Optional[Any] = None
     has_default: bool = False
 
 
+def _reset_unstructured(instance: ActionSignature, attribute: attrs.Attribute, value: Any) -> Any:
+    instance._unstructured = None
+    return value
+
+
 @attrs.define
 class ActionSignature:
-    """Auto-derived signature information from a callable."""
-    parameters: list[ActionParameter] = attrs.Factory(list)
-    return_type: Optional[str] = None
-    docstring: Optional[str] = None
+    """
+    Auto-derived signature information from a callable.
+
+    The converter caches its unstructured view of the signature in
+    ``_unstructured``; reassigning any field clears it. Parameters are
+    stored as a tuple of frozen ActionParameters, so they can't change in
+    place behind the cache.
+    """
+    parameters: tuple[ActionParameter, ...] = attrs.field(
+        factory=tuple, converter=tuple, on_setattr=attrs.setters.pipe(attrs.setters.convert, _reset_unstructured)
+    )
+    return_type: Optional[str] = attrs.field(default=None, on_setattr=_reset_unstructured)
+    docstring: Optional[str] = attrs.field(default=None, on_setattr=_reset_unstructured)
+    _unstructured: tuple[tuple[dict[str, Any], ...], Optional[str], Optional[str]] | None = attrs.field(
+        default=None, init=False, repr=False, eq=False
+    )
 
     @classmethod
     def from_callable(cls, func: Callable) -> ActionSignature:
         """Extract signature information from a callable."""
-        sig = inspect.signature(func)
-        params = []
-
-        for name, param in sig.parameters.items():
-            type_hint = None
-            if param.annotation != inspect.Parameter.empty:
-                type_hint = (
-                    param.annotation.__name__
-                    if hasattr(param.annotation, '__name__')
-                    else str(param.annotation)
-                )
-
-            has_default = param.default != inspect.Parameter.empty
-            default = param.default if has_default else None
-
-            params.append(ActionParameter(
-                name=name,
-                type_hint=type_hint,
-                default=default,
-                has_default=has_default
-            ))
-
-        return_type = None
-        if sig.return_annotation != inspect.Signature.empty:
-            return_type = (
-                sig.return_annotation.__name__
-                if hasattr(sig.return_annotation, '__name__')
-                else str(sig.return_annotation)
-            )
-
+        params, return_type = _inspect_callable(func)
         return cls(
-            parameters=params,
+            parameters=tuple(ActionParameter(*fields) for fields in params),
             return_type=return_type,
             docstring=inspect.getdoc(func)
         )
 
 
+def _type_name(annotation: Any) -> str:
+    return annotation.__name__ if hasattr(annotation, '__name__') else str(annotation)
+
+
+@functools.lru_cache(maxsize=1024)
+def _inspect_function(func: Callable, bound: bool) -> tuple[tuple[tuple, ...], Optional[str]]:
+    """
+    Inspect a function once and cache its parameter fields and return type.
+
+    Every HolonicObject registers the same built-in methods, so caching on
+    the underlying function (``__func__`` for bound methods, with ``bound``
+    dropping the self/cls parameter) skips repeated inspect.signature calls.
+    """
+    sig = inspect.signature(func)
+    items = list(sig.parameters.items())
+    if bound and items and items[0][1].kind in (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    ):
+        items = items[1:]
+
+    params = []
+    for name, param in items:
+        type_hint = None
+        if param.annotation != inspect.Parameter.empty:
+            type_hint = _type_name(param.annotation)
+
+        has_default = param.default != inspect.Parameter.empty
+        default = param.default if has_default else None
+
+        params.append((name, type_hint, default, has_default))
+
+    return_type = None
+    if sig.return_annotation != inspect.Signature.empty:
+        return_type = _type_name(sig.return_annotation)
+
+    return tuple(params), return_type
+
+
+def _inspect_callable(func: Callable) -> tuple[tuple[tuple, ...], Optional[str]]:
+    """Parameter fields and return type for any callable, cached where safe."""
+    if inspect.ismethod(func) and inspect.isfunction(func.__func__):
+        return _inspect_function(func.__func__, True)
+    if inspect.isfunction(func):
+        return _inspect_function(func, False)
+    return _inspect_function.__wrapped__(func, False)
+
+
 @attrs.define
 class HolonAction:
     """
@@ -11,8 +11,8 @@ A HolonicAgent IS-A Holon with additional capabilities:
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
-from typing import Any, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, ClassVar
 
 import attrs
 
@@ -63,6 +63,16 @@ class MessageHistory:
         return iter(self._messages)
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _epoch_ns(dt: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch. Naive datetimes are taken as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
 import re
 
 def _parse_path(path: str) -> list[str | int]:
@@ -170,6 +180,21 @@ class HolonicObject(Holon):
         last_heartbeat: Timestamp of last heartbeat (None if never)
         next_heartbeat: Timestamp when next heartbeat is due
     """
+    # Built-in self-management actions as (method, action name, purpose);
+    # subclasses may extend this tuple to register more per instance. This
+    # is a declarative table only: every instance still binds and registers
+    # each entry, and the cost of that is kept down by the signature cache
+    # in action.py rather than by this table.
+    _BUILTIN_ACTIONS: ClassVar[tuple[tuple[str, str, str], ...]] = (
+        ("knowledge_set", "knowledge_set", "Set a value in knowledge at a dot.path"),
+        ("knowledge_delete", "knowledge_delete", "Delete a value from knowledge at a dot.path"),
+        ("child_purpose_set", "child_purpose_set", "Set purpose on a child holon by GUID"),
+        ("child_purpose_clear", "child_purpose_clear", "Clear all purpose from a child holon"),
+        ("create_child", "create_child", "Create a new child holon, optionally copying from a template GUID"),
+        ("send_message", "send_message", "Send a message to one or more holons by GUID"),
+        ("delay_heartbeat", "sleep", "Delay next heartbeat by specified seconds from its current scheduled time"),
+    )
+
     id: str = attrs.field(factory=lambda: str(uuid.uuid4()))
     holon_parent: "HolonicObject | None" = attrs.field(default=None)
     holon_children: list["HolonicObject"] = attrs.field(factory=list)
@@ -179,7 +204,8 @@ class HolonicObject(Holon):
     _token_bank: int = attrs.field(default=0, alias="token_bank")
     message_history: MessageHistory = attrs.field(factory=MessageHistory)
     last_heartbeat: datetime | None = attrs.field(default=None)
-    next_heartbeat: datetime = attrs.field(factory=lambda: datetime.now(timezone.utc))
+    _next_heartbeat: datetime = attrs.field(factory=lambda: datetime.now(timezone.utc), alias="next_heartbeat")
+    _next_heartbeat_ns: int = attrs.field(default=0, init=False, repr=False)  # Epoch-ns mirror for due checks
     _heart_rate_secs: int = attrs.field(default=1, alias="heart_rate_secs")
 
     # Storage binding for auto-persistence (optional)
@@ -188,6 +214,8 @@ class HolonicObject(Holon):
 
     def __attrs_post_init__(self):
         """Bind state and actions to the Holon."""
+        self._next_heartbeat_ns = _epoch_ns(self._next_heartbeat)
+
         # Initialize default self bindings (dynamic references)
         self._self_bindings.update({
             "current_time": lambda: datetime.now(timezone.utc).isoformat(),
@@ -201,13 +229,8 @@ class HolonicObject(Holon):
         })
 
         # Built-in actions for self-management
-        self.add_action(self.knowledge_set, name="knowledge_set", purpose="Set a value in knowledge at a dot.path")
-        self.add_action(self.knowledge_delete, name="knowledge_delete", purpose="Delete a value from knowledge at a dot.path")
-        self.add_action(self.child_purpose_set, name="child_purpose_set", purpose="Set purpose on a child holon by GUID")
-        self.add_action(self.child_purpose_clear, name="child_purpose_clear", purpose="Clear all purpose from a child holon")
-        self.add_action(self.create_child, name="create_child", purpose="Create a new child holon, optionally copying from a template GUID")
-        self.add_action(self.send_message, name="send_message", purpose="Send a message to one or more holons by GUID")
-        self.add_action(self.delay_heartbeat, name="sleep", purpose="Delay next heartbeat by specified seconds from its current scheduled time")
+        for method_name, action_name, purpose in self._BUILTIN_ACTIONS:
+            self.add_action(getattr(self, method_name), name=action_name, purpose=purpose)
 
     # =========================================================================
     # Properties with auto-persistence
@@ -235,6 +258,22 @@ class HolonicObject(Holon):
         self._heart_rate_secs = value
         self._auto_save()
 
+    @property
+    def next_heartbeat(self) -> datetime:
+        """Get when the next heartbeat is due."""
+        return self._next_heartbeat
+
+    @next_heartbeat.setter
+    def next_heartbeat(self, value: datetime) -> None:
+        """Set the next heartbeat and keep the epoch-ns mirror in sync."""
+        self._next_heartbeat = value
+        self._next_heartbeat_ns = _epoch_ns(value)
+
+    @property
+    def next_heartbeat_ns(self) -> int:
+        """Next heartbeat as integer nanoseconds since the epoch (naive times taken as UTC)."""
+        return self._next_heartbeat_ns
+
     # =========================================================================
     # Storage binding for auto-persistence
     # =========================================================================
@@ -307,8 +346,13 @@ class HolonicObject(Holon):
 
         return tree
 
-    def to_dict(self) -> dict[str, Any]:
-        """Serialize to dictionary. Resolves all dynamic bindings at serialization time."""
+    def to_dict(self, *, _memo: dict[int, Any] | None = None) -> dict[str, Any]:
+        """
+        Serialize to dictionary. Resolves all dynamic bindings at serialization time.
+
+        Each call builds a fresh HUD, so ``_memo`` is accepted for parity
+        with Holon.to_dict but not consulted.
+        """
         from .converter import holon_converter
         from .tokens import count_tokens
 
@@ -683,13 +727,11 @@ class HolonicObject(Holon):
 
     def delay_heartbeat(self, seconds: int) -> None:
         """Push the next heartbeat back by the specified number of seconds."""
-        from datetime import timedelta
         self.next_heartbeat = self.next_heartbeat + timedelta(seconds=seconds)
         self._auto_save()
 
     def action_results(self, results: dict[str, Any], heartbeat_time: datetime) -> list[Any]:
         """Process action results from AI response. Dispatches actions and updates heartbeat times."""
-        from datetime import timedelta
         self.last_heartbeat = heartbeat_time
         self.next_heartbeat = heartbeat_time + timedelta(seconds=self._heart_rate_secs)
         action_calls = results.get("actions", [])
@@ -4,8 +4,10 @@ Container classes for Holon components - HolonPurpose, HolonSelf, and HolonActio
 
 from __future__ import annotations
 
+import functools
 import types
-from typing import TYPE_CHECKING, Any, Callable, Iterator, Union
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar, Union
 
 import attrs
 import cattrs
@@ -50,139 +52,322 @@ def _unstructure_value(value: Any) -> Any:
     return value
 
 
-@attrs.define
-class HolonBinding:
+# Exact types whose resolved value is the source itself
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def _call_source(source: Any, memo: dict[int, Any] | None) -> Any:
+    return source()
+
+
+def _return_source(source: Any, memo: dict[int, Any] | None) -> Any:
+    return source
+
+
+def _source_to_dict(source: Any, memo: dict[int, Any] | None) -> Any:
+    return source.to_dict()
+
+
+def _copy_containers(value: Any) -> Any:
+    """Copy the dicts and lists of a serialized value, sharing the leaves."""
+    if isinstance(value, dict):
+        return {k: _copy_containers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(v) for v in value]
+    return value
+
+
+def _source_holon(source: Holon, memo: dict[int, Any] | None) -> Any:
+    # A Holon shared by several bindings is serialized once per call; later
+    # positions get their own containers so the result has no aliasing
+    if memo is None:
+        return source.to_dict()
+    key = id(source)
+    if key not in memo:
+        memo[key] = source.to_dict(_memo=memo)
+        return memo[key]
+    return _copy_containers(memo[key])
+
+
+@functools.lru_cache(maxsize=None)
+def _attrs_field_names(cls: type) -> tuple[str, ...]:
+    return tuple(field.name for field in attrs.fields(cls))
+
+
+def _unstructure_field(value: Any) -> Any:
+    if type(value) in _PASSTHROUGH_TYPES:
+        return value
+    return _unstructure_value(value)
+
+
+def _hook_code_key(hook: Callable[[Any], Any]) -> tuple | None:
+    code = getattr(hook, "__code__", None)
+    if code is None:
+        return None
+    return code.co_code, code.co_consts, code.co_names
+
+
+@functools.lru_cache(maxsize=None)
+def _stock_attrs_hook_key(cls: type) -> tuple | None:
+    """Code of the hook a fresh cattrs converter generates for cls."""
+    return _hook_code_key(cattrs.Converter().get_unstructure_hook(cls))
+
+
+def _has_stock_unstructure(cls: type) -> bool:
     """
-    A binding to a code object that resolves its value at runtime.
+    True if the global converter unstructures cls with its default hook.
 
-    - Functions/lambdas are automatically invoked at resolve time
-    - Class instances are serialized via cattrs or __dict__
-    - Primitives are returned as-is
+    A registered hook, hook factory or override changes the generated
+    code, in which case the source must go through cattrs to honor it.
     """
-    source: Union[Callable[[], Any], Any] = attrs.field(repr=False)
-    key: str | None = None
+    try:
+        hook = cattrs.global_converter.get_unstructure_hook(cls)
+        key = _hook_code_key(hook)
+        return key is not None and key == _stock_attrs_hook_key(cls)
+    except Exception:
+        return False
 
-    def resolve(self) -> Any:
-        """Resolve the binding to its current value."""
-        if _is_function(self.source):
-            return self.source()
-        return _unstructure_value(self.source)
 
+def _source_attrs(source: Any, memo: dict[int, Any] | None) -> Any:
+    # Shallow field walk; nested values still go through _unstructure_value
+    return {
+        name: _unstructure_field(getattr(source, name))
+        for name in _attrs_field_names(type(source))
+    }
 
-@attrs.define
-class HolonPurpose:
+
+def _source_cattrs(source: Any, memo: dict[int, Any] | None) -> Any:
+    try:
+        return cattrs.unstructure(source)
+    except Exception:
+        return _unstructure_value(source)
+
+
+def _source_instance_dict(source: Any, memo: dict[int, Any] | None) -> Any:
+    return dict(vars(source))
+
+
+def _select_resolver(source: Any) -> Callable[[Any, dict[int, Any] | None], Any]:
     """
-    The interpretive lens for a Holon.
+    Pick the resolution strategy for a binding source.
 
-    Contains bindings that define HOW the AI should interpret the Self state.
-    Can hold any combination of primitives, objects, or callable bindings.
+    Follows the same precedence as _unstructure_value, but runs the
+    type probing once so repeated resolves skip straight to the
+    matching conversion. Values are still computed on every resolve,
+    so mutable sources stay live.
     """
-    _items: list[HolonBinding] = attrs.Factory(list)
+    if _is_function(source):
+        return _call_source
+    if type(source) in _PASSTHROUGH_TYPES:
+        return _return_source
+    if hasattr(source, 'to_dict'):
+        from .holon import Holon
+        return _source_holon if isinstance(source, Holon) else _source_to_dict
+    if attrs.has(type(source)) and _has_stock_unstructure(type(source)):
+        return _source_attrs
+    try:
+        if cattrs.unstructure(source) is not source:
+            return _source_cattrs
+    except Exception:
+        pass
+    if hasattr(source, '__dict__'):
+        return _source_instance_dict
+    return _return_source
 
-    def add(
-        self,
-        item: Any,
-        *,
-        key: str | None = None
-    ) -> HolonPurpose:
-        """Add an item to the purpose."""
-        self._items.append(HolonBinding(source=item, key=key))
-        return self
 
-    def _has_any_keys(self) -> bool:
-        return any(item.key is not None for item in self._items)
+def _is_static(source: Any) -> bool:
+    """True if a binding to source always resolves to the same immutable value."""
+    return type(source) in _PASSTHROUGH_TYPES
 
-    def _all_have_keys(self) -> bool:
-        return bool(self._items) and all(item.key is not None for item in self._items)
 
-    def resolve(self) -> list[Any]:
-        """Resolve all bindings as a list."""
-        return [item.resolve() for item in self._items]
+def _copy_serialized(result: list[Any] | dict[str, Any]) -> list[Any] | dict[str, Any]:
+    """Copy a cached all-static serialize() result so callers can't mutate the cache."""
+    if isinstance(result, dict):
+        return dict(result)
+    return [dict(value) if isinstance(value, dict) else value for value in result]
 
-    def serialize(self) -> list[Any] | dict[str, Any]:
-        """Smart serialization: list if unkeyed, dict if keyed, mixed handled."""
-        if not self._items:
-            return []
 
-        if self._all_have_keys():
-            return {item.key: item.resolve() for item in self._items}
-        elif not self._has_any_keys():
-            return self.resolve()
-        else:
-            # Mixed: list with keyed items as embedded dicts
-            result = []
-            for item in self._items:
-                value = item.resolve()
-                if item.key is not None:
-                    result.append({item.key: value})
-                else:
-                    result.append(value)
-            return result
+def _reset_resolver(instance: HolonBinding, attribute: attrs.Attribute, value: Any) -> Any:
+    instance._resolver = None
+    instance._notify_owners()
+    return value
 
-    def __iter__(self) -> Iterator[Any]:
-        return iter(self.resolve())
 
-    def __len__(self) -> int:
-        return len(self._items)
+def _key_changed(instance: HolonBinding, attribute: attrs.Attribute, value: Any) -> Any:
+    instance._notify_owners()
+    return value
 
 
 @attrs.define
-class HolonSelf:
+class HolonBinding:
     """
-    The current state/context for a Holon.
+    A binding to a code object that resolves its value at runtime.
 
-    Contains bindings that define WHAT the AI should interpret.
-    Can hold any combination of primitives, objects, nested Holons, or callable bindings.
+    - Functions/lambdas are automatically invoked at resolve time
+    - Class instances are serialized via cattrs or __dict__
+    - Primitives are returned as-is
+
+    The resolution strategy is chosen on first resolve and reused until
+    the source is replaced. Containers holding the binding are told when
+    its source or key is reassigned, so their cached shape stays current.
     """
+    source: Union[Callable[[], Any], Any] = attrs.field(repr=False, on_setattr=_reset_resolver)
+    key: str | None = attrs.field(default=None, on_setattr=_key_changed)
+    _resolver: Callable[[Any, dict[int, Any] | None], Any] | None = attrs.field(
+        default=None, init=False, repr=False, eq=False
+    )
+    # Weak references to the containers holding this binding
+    _owners: list[weakref.ref[_BindingContainer]] = attrs.field(
+        factory=list, init=False, repr=False, eq=False
+    )
+
+    def _add_owner(self, owner: _BindingContainer) -> None:
+        self._owners = [ref for ref in self._owners if ref() is not None and ref() is not owner]
+        self._owners.append(weakref.ref(owner))
+
+    def _notify_owners(self) -> None:
+        for ref in self._owners:
+            owner = ref()
+            if owner is not None:
+                owner._invalidate()
+
+    def resolve(self, _memo: dict[int, Any] | None = None) -> Any:
+        """
+        Resolve the binding to its current value.
+
+        Args:
+            _memo: Per-serialization cache of nested Holons keyed by id()
+        """
+        resolver = self._resolver
+        if resolver is None:
+            resolver = self._resolver = _select_resolver(self.source)
+        return resolver(self.source, _memo)
+
+
+_C = TypeVar("_C", bound="_BindingContainer")
+
+
+@attrs.define
+class _BindingContainer:
+    """Ordered bindings with smart serialization, shared by HolonPurpose and HolonSelf."""
     _items: list[HolonBinding] = attrs.Factory(list)
+    # Keyed/unkeyed tallies let serialize() pick its shape without a scan
+    _n_keyed: int = attrs.field(default=0, init=False, repr=False, eq=False)
+    _n_unkeyed: int = attrs.field(default=0, init=False, repr=False, eq=False)
+    # Bindings whose value can change between serializations
+    _n_dynamic: int = attrs.field(default=0, init=False, repr=False, eq=False)
+    _static_result: list[Any] | dict[str, Any] | None = attrs.field(default=None, init=False, repr=False, eq=False)
+    # Set when a binding's source or key was reassigned; tallies are
+    # recomputed on next use, since the hook fires before the new value lands
+    _stale: bool = attrs.field(default=False, init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        for item in self._items:
+            item._add_owner(self)
+        self._recount()
+
+    def _invalidate(self) -> None:
+        self._static_result = None
+        self._stale = True
+
+    def _recount(self) -> None:
+        """Recompute the tallies from the bindings."""
+        self._n_keyed = sum(1 for item in self._items if item.key is not None)
+        self._n_unkeyed = len(self._items) - self._n_keyed
+        self._n_dynamic = sum(1 for item in self._items if not _is_static(item.source))
+        self._stale = False
 
     def add(
-        self,
+        self: _C,
         item: Any,
         *,
         key: str | None = None
-    ) -> HolonSelf:
-        """Add an item to self."""
-        self._items.append(HolonBinding(source=item, key=key))
+    ) -> _C:
+        """Add an item."""
+        binding = HolonBinding(source=item, key=key)
+        binding._add_owner(self)
+        self._items.append(binding)
+        if key is None:
+            self._n_unkeyed += 1
+        else:
+            self._n_keyed += 1
+        if not _is_static(item):
+            self._n_dynamic += 1
+        self._static_result = None
         return self
 
     def _has_any_keys(self) -> bool:
-        return any(item.key is not None for item in self._items)
+        if self._stale:
+            self._recount()
+        return self._n_keyed > 0
 
     def _all_have_keys(self) -> bool:
-        return bool(self._items) and all(item.key is not None for item in self._items)
-
-    def resolve(self) -> list[Any]:
+        if self._stale:
+            self._recount()
+        return self._n_keyed > 0 and self._n_unkeyed == 0
+
+    def iter_resolved(self, _memo: dict[int, Any] | None = None) -> Iterator[tuple[str | None, Any]]:
+        """Lazily resolve bindings, yielding (key, value) pairs in insertion order."""
+        if _memo is None:
+            _memo = {}
+        for item in self._items:
+            yield item.key, item.resolve(_memo)
+
+    def resolve(self, _memo: dict[int, Any] | None = None) -> list[Any]:
         """Resolve all bindings as a list."""
-        return [item.resolve() for item in self._items]
+        return [value for _, value in self.iter_resolved(_memo)]
 
-    def serialize(self) -> list[Any] | dict[str, Any]:
+    def serialize(self, _memo: dict[int, Any] | None = None) -> list[Any] | dict[str, Any]:
         """Smart serialization: list if unkeyed, dict if keyed, mixed handled."""
-        if not self._items:
-            return []
-
-        if self._all_have_keys():
-            return {item.key: item.resolve() for item in self._items}
-        elif not self._has_any_keys():
-            return self.resolve()
+        if self._static_result is not None:
+            return _copy_serialized(self._static_result)
+        if self._stale:
+            self._recount()
+
+        if not self._n_keyed:
+            result = self.resolve(_memo)
+        elif not self._n_unkeyed:
+            result = dict(self.iter_resolved(_memo))
         else:
             # Mixed: list with keyed items as embedded dicts
-            result = []
-            for item in self._items:
-                value = item.resolve()
-                if item.key is not None:
-                    result.append({item.key: value})
-                else:
-                    result.append(value)
-            return result
+            result = [
+                value if key is None else {key: value}
+                for key, value in self.iter_resolved(_memo)
+            ]
+
+        if not self._n_dynamic:
+            # Only primitive literals: output is fixed until a binding changes
+            self._static_result = result
+            return _copy_serialized(result)
+        return result
 
     def __iter__(self) -> Iterator[Any]:
-        return iter(self.resolve())
+        return (value for _, value in self.iter_resolved())
 
     def __len__(self) -> int:
         return len(self._items)
 
 
+@attrs.define
+class HolonPurpose(_BindingContainer):
+    """
+    The interpretive lens for a Holon.
+
+    Contains bindings that define HOW the AI should interpret the Self state.
+    Can hold any combination of primitives, objects, or callable bindings.
+    """
+
+
+@attrs.define
+class HolonSelf(_BindingContainer):
+    """
+    The current state/context for a Holon.
+
+    Contains bindings that define WHAT the AI should interpret.
+    Can hold any combination of primitives, objects, nested Holons, or callable bindings.
+    """
+
+
 @attrs.define
 class HolonActions:
     """
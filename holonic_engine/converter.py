@@ -61,18 +61,29 @@ class HolonConverter:
             result["default"] = param.default
         return result
 
+    def _signature_view(
+        self, sig: ActionSignature
+    ) -> tuple[tuple[dict[str, Any], ...], str | None, str | None]:
+        """Unstructured (parameters, returns, docstring) for a signature, cached on the signature."""
+        view = sig._unstructured
+        if view is None:
+            view = (
+                tuple(self._unstructure_action_parameter(p) for p in sig.parameters),
+                sig.return_type,
+                sig.docstring,
+            )
+            sig._unstructured = view
+        return view
+
     def _unstructure_action_signature(self, sig: ActionSignature) -> dict[str, Any]:
         """Convert ActionSignature to dict."""
-        result = {
-            "parameters": [
-                self._unstructure_action_parameter(p)
-                for p in sig.parameters
-            ]
-        }
-        if sig.return_type:
-            result["returns"] = sig.return_type
-        if sig.docstring:
-            result["docstring"] = sig.docstring
+        params, returns, docstring = self._signature_view(sig)
+        # Copy the cached parameter dicts so callers can't mutate the cache
+        result = {"parameters": [dict(p) for p in params]}
+        if returns:
+            result["returns"] = returns
+        if docstring:
+            result["docstring"] = docstring
         return result
 
     def _unstructure_holon_action(self, action: HolonAction) -> dict[str, Any]:
@@ -83,31 +94,39 @@ class HolonConverter:
             result["purpose"] = action.purpose
 
         if action.signature:
-            sig_data = self._unstructure_action_signature(action.signature)
-            result["parameters"] = sig_data.get("parameters", [])
-            if "returns" in sig_data:
-                result["returns"] = sig_data["returns"]
-            if "docstring" in sig_data:
-                result["docstring"] = sig_data["docstring"]
+            params, returns, docstring = self._signature_view(action.signature)
+            result["parameters"] = [dict(p) for p in params]
+            if returns:
+                result["returns"] = returns
+            if docstring:
+                result["docstring"] = docstring
 
         return result
 
-    def unstructure_holon(self, holon: Holon) -> dict[str, Any]:
+    def unstructure_holon(
+        self,
+        holon: Holon,
+        *,
+        _memo: dict[int, Any] | None = None
+    ) -> dict[str, Any]:
         """
         Convert a Holon to a dictionary.
 
         Args:
             holon: The Holon to convert
+            _memo: Nested Holons already serialized during this call, keyed by id()
         """
+        if _memo is None:
+            _memo = {}
         result = {}
 
         # Purpose: smart serialize (list or dict)
-        purpose_data = holon.purpose.serialize()
+        purpose_data = holon.purpose.serialize(_memo)
         if purpose_data:
             result["purpose"] = purpose_data
 
         # Self: smart serialize (list or dict, handles nested Holons)
-        self_data = holon.self_state.serialize()
+        self_data = holon.self_state.serialize(_memo)
         if self_data:
             result["self"] = self_data
 
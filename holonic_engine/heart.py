@@ -8,16 +8,19 @@ then dispatches results back to the appropriate holons.
 from __future__ import annotations
 
 import json
+import os
 import threading
 import time
-from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Callable
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping
 
 import attrs
 
+from ._io import atomic_write
 from .client import call_ai, detect_client_type
 from .logging import heart_logger, log_heartbeat_start, log_heartbeat_complete, log_token_allocation, log_ai_call, log_ai_response
-from .serialization import parse_ai_response
+from .serialization import _dumps, _loads, parse_ai_response
 from .telemetry import get_telemetry, Timer
 from .tokens import count_tokens
 
@@ -25,13 +28,46 @@ if TYPE_CHECKING:
     from .agent import HolonicObject
 
 
+# Static part of every heartbeat prompt; the HOLONS DATA JSON is appended per beat
+_PROMPT_INSTRUCTIONS = """You are processing a heartbeat for multiple holons. Each holon has its own purpose, state, and available actions.
+
+For each holon, analyze its state and decide what actions (if any) to take.
+
+Respond with a JSON object where each key is a holon GUID and the value is an object with an "actions" array:
+
+{
+  "holon-guid-1": {
+    "actions": [
+      {"action": "action_name", "params": {"key": "value"}}
+    ]
+  },
+  "holon-guid-2": {
+    "actions": []
+  }
+}
+
+If a holon needs no actions, use an empty actions array.
+
+HOLONS DATA:
+"""
+
+
 @attrs.define
 class HolonicObjectHeartbeatRecord:
-    """Record of a single HolonicObject's participation in a heartbeat."""
+    """
+    Record of a single HolonicObject's participation in a heartbeat.
+
+    hud_sent is the HUD as sent to the AI: it is decoded from the JSON
+    captured by Heartbeat.add_holonicobject, so it holds JSON types only
+    (datetimes become ISO strings, tuples become lists, non-str keys become
+    strings). Only its top level is read-only; nested dicts and lists are
+    plain containers and are not protected from mutation.
+    """
     hobj: "HolonicObject"
-    hud_sent: dict[str, Any]
+    hud_sent: Mapping[str, Any]
     scheduled_time: datetime  # When this holon was scheduled to heartbeat
     actions_result: dict[str, Any] = attrs.field(factory=dict)
+    hud_sent_json: str | None = attrs.field(default=None, repr=False)  # hud_sent as serialized at capture
 
 
 @attrs.define
@@ -40,7 +76,7 @@ class Heartbeat:
     heartbeat_time: datetime  # When this heartbeat cycle started
     execution_time: datetime | None = attrs.field(default=None)  # When AI call started
     completion_time: datetime | None = attrs.field(default=None)  # When AI call completed
-    _records: list[HolonicObjectHeartbeatRecord] = attrs.field(factory=list)
+    _records: dict[str, HolonicObjectHeartbeatRecord] = attrs.field(factory=dict)  # Keyed by hobj.id
     _full_prompt: str = attrs.field(default="")
     _raw_response: str = attrs.field(default="")
     _parsed_response: dict[str, Any] = attrs.field(factory=dict)
@@ -49,85 +85,99 @@ class Heartbeat:
 
     def add_holonicobject(self, hobj: "HolonicObject", scheduled_time: datetime | None = None) -> None:
         """Add a HolonicObject to this heartbeat and capture its serialized HUD."""
-        import copy
-        hud = copy.deepcopy(hobj.to_dict())
+        # Serialize once: the JSON text is kept for persistence and decoding
+        # it back gives an independent, JSON-typed snapshot without a
+        # deepcopy. Its top level is read-only so callers can't rewrite what
+        # was sent; nested values are not frozen.
+        hud_json = _dumps(hobj.to_dict())
         # Use the holon's next_heartbeat as scheduled time if not provided
         if scheduled_time is None:
             scheduled_time = hobj.next_heartbeat
-        self._records.append(HolonicObjectHeartbeatRecord(
+        self._records[hobj.id] = HolonicObjectHeartbeatRecord(
             hobj=hobj,
-            hud_sent=hud,
+            hud_sent=MappingProxyType(_loads(hud_json)),
             scheduled_time=scheduled_time,
-        ))
+            hud_sent_json=hud_json,
+        )
 
     def get_holonicobjects(self) -> list["HolonicObject"]:
         """Get list of all HolonicObjects in this heartbeat."""
-        return [r.hobj for r in self._records]
+        return [r.hobj for r in self._records.values()]
+
+    def _get_record(self, hobj: "HolonicObject") -> HolonicObjectHeartbeatRecord:
+        """Look up the record for a HolonicObject by id."""
+        record = self._records.get(hobj.id)
+        if record is None or record.hobj is not hobj:
+            raise KeyError(f"HolonicObject {hobj.id} not found in this heartbeat")
+        return record
 
-    def get_results(self, hobj: "HolonicObject") -> tuple[dict[str, Any], dict[str, Any]]:
+    def get_results(self, hobj: "HolonicObject") -> tuple[dict[str, Any], Mapping[str, Any]]:
         """Get results for a specific HolonicObject. Returns (actions_json, full_hud_sent)."""
-        for record in self._records:
-            if record.hobj is hobj:
-                return (record.actions_result, record.hud_sent)
-        raise KeyError(f"HolonicObject {hobj.id} not found in this heartbeat")
+        record = self._get_record(hobj)
+        return (record.actions_result, record.hud_sent)
+
+    def get_hud_json(self, hobj: "HolonicObject") -> str:
+        """Get the HUD sent for a HolonicObject as a JSON string."""
+        record = self._get_record(hobj)
+        if record.hud_sent_json is None:
+            record.hud_sent_json = _dumps(dict(record.hud_sent))
+        return record.hud_sent_json
 
     def build_prompt(self) -> str:
         """Build the combined prompt for AI submission."""
         # Build holon data with timestamps
         holons_data = {}
-        for record in self._records:
+        for hobj_id, record in self._records.items():
             holon_data = record.hud_sent.copy()
             holon_data["_heartbeat_info"] = {
                 "scheduled_time": record.scheduled_time.isoformat(),
             }
-            holons_data[record.hobj.id] = holon_data
+            holons_data[hobj_id] = holon_data
 
         combined_data = {
             "heartbeat_time": self.heartbeat_time.isoformat(),
             "execution_time": self.execution_time.isoformat() if self.execution_time else None,
             "holons": holons_data,
         }
-        self._full_prompt = f"""You are processing a heartbeat for multiple holons. Each holon has its own purpose, state, and available actions.
-
-For each holon, analyze its state and decide what actions (if any) to take.
-
-Respond with a JSON object where each key is a holon GUID and the value is an object with an "actions" array:
-
-{{
-  "holon-guid-1": {{
-    "actions": [
-      {{"action": "action_name", "params": {{"key": "value"}}}}
-    ]
-  }},
-  "holon-guid-2": {{
-    "actions": []
-  }}
-}}
-
-If a holon needs no actions, use an empty actions array.
-
-HOLONS DATA:
-{json.dumps(combined_data, indent=2)}
-"""
+        self._full_prompt = "".join((
+            _PROMPT_INSTRUCTIONS,
+            json.dumps(combined_data, indent=2),
+            "\n",
+        ))
         return self._full_prompt
 
     def process_response(self, response_text: str) -> None:
         """Parse AI response and distribute results to each holon record."""
-        self._raw_response = response_text
-        try:
-            self._parsed_response = json.loads(response_text)
-        except json.JSONDecodeError:
-            self._parsed_response = parse_ai_response(response_text)
+        if not response_text or response_text.isspace():
+            # Nothing to decode - every holon falls through to empty actions
+            parsed = {}
+        else:
+            try:
+                parsed = _loads(response_text)
+            except json.JSONDecodeError:
+                parsed = parse_ai_response(response_text)
+
+        self.process_response_dict(parsed, raw_response=response_text)
+
+    def process_response_dict(self, response: dict[str, Any], raw_response: str | None = None) -> None:
+        """
+        Distribute an already-decoded response to each holon record.
+
+        For callers that hold the response as a dict, skipping the JSON
+        parse. raw_response defaults to the dict serialized back to JSON.
+        """
+        self._raw_response = _dumps(response) if raw_response is None else raw_response
+        self._parsed_response = response
 
         # Distribute results to each record
-        for record in self._records:
-            record.actions_result = self._parsed_response.get(record.hobj.id, {"actions": []})
+        for hobj_id, record in self._records.items():
+            record.actions_result = response.get(hobj_id, {"actions": []})
 
     def dispatch_to_holonicobjects(self) -> dict[str, list[Any]]:
         """Dispatch results to each HolonicObject and return execution results."""
         results: dict[str, list[Any]] = {}
-        for record in self._records:
-            results[record.hobj.id] = record.hobj.action_results(
+        for hobj_id, record in self._records.items():
+            results[hobj_id] = record.hobj.action_results(
                 record.actions_result,
                 self.heartbeat_time
             )
@@ -165,12 +215,46 @@ HOLONS DATA:
 
     def get_hobj_ids(self) -> set[str]:
         """Get the IDs of all HolonicObjects in this heartbeat."""
-        return {r.hobj.id for r in self._records}
+        return set(self._records)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize this heartbeat and its records to a JSON-ready dict."""
+        return {
+            "heartbeat_time": self.heartbeat_time.isoformat(),
+            "execution_time": self.execution_time.isoformat() if self.execution_time else None,
+            "completion_time": self.completion_time.isoformat() if self.completion_time else None,
+            "prompt": self._full_prompt,
+            "response": self._raw_response,
+            "errored": self._errored,
+            "error_message": self._error_message,
+            "hobjs": [
+                {
+                    "hobj_id": hobj_id,
+                    "scheduled_time": record.scheduled_time.isoformat(),
+                    "hud_sent": dict(record.hud_sent),
+                    "actions_result": record.actions_result,
+                }
+                for hobj_id, record in self._records.items()
+            ],
+        }
 
     def __len__(self) -> int:
         return len(self._records)
 
 
+def _allocations_by_id(
+    allocations: Iterable[tuple["HolonicObject", int]] | dict[str, tuple["HolonicObject", int]]
+) -> dict[str, tuple["HolonicObject", int]]:
+    """Key (hobj, amount) allocations by hobj id, summing repeated entries."""
+    if isinstance(allocations, dict):
+        return allocations
+    by_id: dict[str, tuple["HolonicObject", int]] = {}
+    for hobj, amount in allocations:
+        existing = by_id.get(hobj.id)
+        by_id[hobj.id] = (hobj, existing[1] + amount if existing else amount)
+    return by_id
+
+
 @attrs.define
 class HolonicHeart:
     """
@@ -185,12 +269,34 @@ class HolonicHeart:
     interval: float = attrs.field(default=1.0)
     max_tokens: int = attrs.field(default=4096)
     structured_output: bool = attrs.field(default=True)
-    token_allocations: list[tuple["HolonicObject", int]] = attrs.field(factory=list)
+    _token_allocations: dict[str, tuple["HolonicObject", int]] = attrs.field(
+        factory=dict, converter=_allocations_by_id, alias="token_allocations"
+    )
 
     _running: bool = attrs.field(default=False, init=False)
     _thread: threading.Thread | None = attrs.field(default=None, init=False)
+    _stop_event: threading.Event = attrs.field(factory=threading.Event, init=False)
     _history: list[Heartbeat] = attrs.field(factory=list, init=False)
     _on_heartbeat: Callable[[Heartbeat], None] | None = attrs.field(default=None)
+    # Replaced, never mutated, so the loop thread can iterate it safely
+    _heartbeat_callbacks: tuple[Callable[[Heartbeat], None], ...] = attrs.field(
+        default=attrs.Factory(lambda self: (self._on_heartbeat,) if self._on_heartbeat else (), takes_self=True),
+        init=False,
+    )
+
+    @property
+    def token_allocations(self) -> tuple[tuple["HolonicObject", int], ...]:
+        """
+        Per-beat token allocations as (hobj, amount) pairs.
+
+        Read-only; change allocations with add_token_allocation,
+        set_token_allocation, and remove_token_allocation.
+        """
+        return tuple(self._token_allocations.values())
+
+    @token_allocations.setter
+    def token_allocations(self, allocations: Iterable[tuple["HolonicObject", int]]) -> None:
+        self._token_allocations = _allocations_by_id(allocations)
 
     @property
     def is_running(self) -> bool:
@@ -202,39 +308,58 @@ class HolonicHeart:
         if self._running:
             return
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         """Stop the heartbeat loop."""
         self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=self.interval * 2)
             self._thread = None
 
     def _run_loop(self) -> None:
-        """Main heartbeat loop."""
+        """
+        Main heartbeat loop.
+
+        Beats run on a fixed-rate schedule against time.monotonic(), so the
+        time spent inside a beat (mostly the AI call) no longer pushes every
+        later beat back. If a beat overruns its slot the schedule restarts
+        from now rather than firing back-to-back beats to catch up. The wait
+        between beats is on _stop_event, so stop() wakes the loop immediately.
+        """
+        next_deadline = time.monotonic()
         while self._running:
             try:
                 heartbeat = self.beat()
-                if heartbeat and len(heartbeat) > 0 and self._on_heartbeat:
-                    self._on_heartbeat(heartbeat)
+                if heartbeat and len(heartbeat) > 0:
+                    for callback in self._heartbeat_callbacks:
+                        callback(heartbeat)
             except Exception:
                 pass  # Silently continue on errors
-            time.sleep(self.interval)
+
+            next_deadline += self.interval
+            sleep_for = next_deadline - time.monotonic()
+            if sleep_for > 0:
+                if self._stop_event.wait(sleep_for):
+                    break
+            else:
+                next_deadline = time.monotonic()
 
     def beat(self) -> Heartbeat | None:
         """Execute a single heartbeat cycle. Returns the Heartbeat object or None if no holons due."""
         telemetry = get_telemetry()
 
         with Timer() as total_timer:
-            # Round to the current second
-            now = datetime.now(timezone.utc)
-            heartbeat_time = now.replace(microsecond=0)
-            next_second = heartbeat_time + timedelta(seconds=1)
+            # Round to the current second; due checks compare epoch-ns ints
+            now_secs = time.time_ns() // 1_000_000_000
+            heartbeat_time = datetime.fromtimestamp(now_secs, timezone.utc)
+            next_second_ns = (now_secs + 1) * 1_000_000_000
 
             # Allocate tokens to all hobjs in token_allocations (even if frozen)
-            for hobj, amount in self.token_allocations:
+            for hobj, amount in self._token_allocations.values():
                 hobj.token_bank += amount
                 telemetry.record_token_allocation(hobj.id, amount)
                 log_token_allocation(hobj.id, amount, hobj.token_bank)
@@ -249,7 +374,7 @@ class HolonicHeart:
             # Also exclude holons that already have an active heartbeat in progress
             due_holons = [
                 (hobj, ts) for hobj, ts in all_heartbeats
-                if ts < next_second and hobj.token_bank >= 0 and hobj.id not in active_hobj_ids
+                if hobj.next_heartbeat_ns < next_second_ns and hobj.token_bank >= 0 and hobj.id not in active_hobj_ids
             ]
 
             if not due_holons:
@@ -328,21 +453,44 @@ class HolonicHeart:
                 count += 1
         return count
 
-    def on_heartbeat(self, callback: Callable[[Heartbeat], None]) -> None:
-        """Register a callback for heartbeat results."""
+    def persist(self, path: str | os.PathLike) -> None:
+        """Write the heartbeat history to a JSON file, replacing it atomically."""
+        atomic_write(path, _dumps([heartbeat.to_dict() for heartbeat in self._history]).encode())
+
+    def on_heartbeat(self, callback: Callable[[Heartbeat], None]) -> Callable[[], bool]:
+        """
+        Register a callback for heartbeat results.
+
+        Every registered callback is called, in order. To swap callbacks,
+        remove the old one with the returned handle or
+        remove_heartbeat_callback().
+
+        Returns:
+            A function that unregisters the callback
+        """
+        self._heartbeat_callbacks = (*self._heartbeat_callbacks, callback)
         self._on_heartbeat = callback
+        return lambda: self.remove_heartbeat_callback(callback)
+
+    def remove_heartbeat_callback(self, callback: Callable[[Heartbeat], None]) -> bool:
+        """Unregister a heartbeat callback. Returns True if it was registered."""
+        callbacks = list(self._heartbeat_callbacks)
+        if callback not in callbacks:
+            return False
+        callbacks.remove(callback)
+        self._heartbeat_callbacks = tuple(callbacks)
+        self._on_heartbeat = callbacks[-1] if callbacks else None
+        return True
 
     def add_token_allocation(self, hobj: "HolonicObject", amount: int) -> None:
-        """Add a token allocation for a HolonicObject."""
-        self.token_allocations.append((hobj, amount))
+        """Add a token allocation for a HolonicObject (added to any existing allocation)."""
+        existing = self._token_allocations.get(hobj.id)
+        self._token_allocations[hobj.id] = (hobj, existing[1] + amount if existing else amount)
 
     def remove_token_allocation(self, hobj: "HolonicObject") -> bool:
-        """Remove all token allocations for a HolonicObject. Returns True if any removed."""
-        original_len = len(self.token_allocations)
-        self.token_allocations = [(h, a) for h, a in self.token_allocations if h is not hobj]
-        return len(self.token_allocations) < original_len
+        """Remove the token allocation for a HolonicObject. Returns True if one was removed."""
+        return self._token_allocations.pop(hobj.id, None) is not None
 
     def set_token_allocation(self, hobj: "HolonicObject", amount: int) -> None:
         """Set the token allocation for a HolonicObject (replaces any existing)."""
-        self.remove_token_allocation(hobj)
-        self.add_token_allocation(hobj, amount)
+        self._token_allocations[hobj.id] = (hobj, amount)
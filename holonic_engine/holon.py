@@ -8,6 +8,7 @@ belong to the HolonicAgent that wraps it.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable
 
 import attrs
@@ -71,15 +72,20 @@ class Holon:
 
     # Serialization
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, _memo: dict[int, Any] | None = None) -> dict[str, Any]:
         """Serialize the Holon to a dictionary."""
         from .converter import holon_converter
-        return holon_converter.unstructure_holon(self)
+        return holon_converter.unstructure_holon(self, _memo=_memo)
 
     def to_json(self, **kwargs) -> str:
-        """Serialize to JSON string."""
-        import json
-        return json.dumps(self.to_dict(), **kwargs)
+        """
+        Serialize to JSON string. Keyword arguments are passed to json.dumps.
+
+        Without indent the output is compact, and non-ASCII text is not
+        escaped; pass separators or ensure_ascii=True to override.
+        """
+        from .serialization import _dumps
+        return _dumps(self.to_dict(), **kwargs)
 
     # Action dispatch
 
@@ -87,17 +93,38 @@ class Holon:
         """Dispatch an action by name."""
         return self.actions.execute(action_name, **kwargs)
 
-    def dispatch_many(self, action_calls: list[dict]) -> list[Any]:
+    def dispatch_many(
+        self,
+        action_calls: list[dict],
+        *,
+        parallel: bool = False,
+        max_workers: int = 8
+    ) -> list[Any]:
         """
         Dispatch multiple action calls (from AI response).
 
         Args:
             action_calls: List of {"action": "name", "params": {...}} dicts
+            parallel: Run the calls concurrently in a thread pool. Only use
+                this when the actions are independent of each other.
+            max_workers: Maximum threads used when parallel is True
+
+        Results are returned in the order of action_calls. In parallel mode
+        every call runs even if one fails; the first failure (in call order)
+        is re-raised once all calls have finished.
         """
-        results = []
-        for call in action_calls:
-            action_name = call.get("action")
-            params = call.get("params", {})
-            result = self.dispatch(action_name, **params)
-            results.append(result)
-        return results
+        # Every call goes through dispatch, so subclass overrides apply on
+        # both paths; it is bound once rather than looked up per call
+        dispatch = self.dispatch
+        if parallel and len(action_calls) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(action_calls))) as executor:
+                futures = [
+                    executor.submit(dispatch, call.get("action"), **call.get("params", {}))
+                    for call in action_calls
+                ]
+            return [future.result() for future in futures]
+
+        return [
+            dispatch(call.get("action"), **call.get("params", {}))
+            for call in action_calls
+        ]
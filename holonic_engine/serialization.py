@@ -17,8 +17,54 @@ try:
     import toon
     TOON_AVAILABLE = True
 except ImportError:
+    toon = None
     TOON_AVAILABLE = False
 
+# Use orjson for JSON encoding/decoding when installed, stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj: Any, *, indent: int | None = None, **kwargs: Any) -> str:
+    """
+    Encode obj as a JSON string.
+
+    Output is compact (no spaces after separators) unless indented, and
+    non-ASCII characters are written as-is rather than escaped. NaN and
+    infinities are encoded as null by orjson but as NaN/Infinity by the
+    stdlib fallback.
+
+    Uses orjson when available. orjson only supports 2-space indentation
+    and none of json.dumps' other options, so other indent widths, extra
+    keyword arguments (sort_keys, default, ...) and values orjson rejects,
+    such as integers wider than 64 bits, go through stdlib json, which is
+    given matching separators and ensure_ascii=False unless the caller
+    passes its own.
+    """
+    if ORJSON_AVAILABLE and indent in (None, 2) and not kwargs:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            pass
+    if indent is None:
+        kwargs.setdefault("separators", (",", ":"))
+    kwargs.setdefault("ensure_ascii", False)
+    return json.dumps(obj, indent=indent, **kwargs)
+
+
+def _loads(text: str | bytes) -> Any:
+    """Decode a JSON string. Raises json.JSONDecodeError on invalid input."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 def serialize_for_ai(holon: Holon, *, format: str = "toon") -> str:
     """
@@ -38,14 +84,14 @@ def serialize_for_ai(holon: Holon, *, format: str = "toon") -> str:
             return toon.encode(data)
         else:
             # Fallback to JSON if TOON not available
-            return json.dumps(data, indent=2)
+            return _dumps(data, indent=2)
     elif format == "json":
-        return json.dumps(data, indent=2)
+        return _dumps(data, indent=2)
     else:
         raise ValueError(f"Unknown format: {format}. Use 'json' or 'toon'.")
 
 
-def parse_ai_response(response: str | dict) -> list[dict]:
+def parse_ai_response(response: str | bytes | dict) -> list[dict]:
     """
     Parse an AI response containing action calls.
 
@@ -61,15 +107,13 @@ def parse_ai_response(response: str | dict) -> list[dict]:
     {"action": "action.name", "params": {...}}
 
     Args:
-        response: JSON string or dict from AI
+        response: JSON string/bytes or dict from AI
 
     Returns:
         List of action call dictionaries
     """
-    if isinstance(response, str):
-        data = json.loads(response)
-    else:
-        data = response
+    # Already-decoded dicts (e.g. structured output) skip the decoder
+    data = _loads(response) if isinstance(response, (str, bytes)) else response
 
     # Handle list of actions
     if "actions" in data:
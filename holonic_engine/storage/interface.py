@@ -144,6 +144,14 @@ class HolonicStorage(Protocol):
         """
         ...
 
+    def save_messages(self, batch: list[dict[str, Any]]) -> None:
+        """
+        Save several messages at once.
+
+        Each item takes the same keys as save_message's arguments.
+        """
+        ...
+
     def get_messages(
         self,
         hobj_id: str,
@@ -162,10 +170,18 @@ class HolonicStorage(Protocol):
 
     # Telemetry
 
-    def save_telemetry_snapshot(self, snapshot: dict[str, Any]) -> int:
+    def save_telemetry_snapshot(
+        self,
+        snapshot: dict[str, Any],
+        timestamp: datetime | None = None,
+    ) -> int:
         """
         Save a telemetry snapshot.
 
+        Args:
+            snapshot: Telemetry data (will be JSON serialized)
+            timestamp: Snapshot timestamp (defaults to now)
+
         Returns the snapshot ID.
         """
         ...
@@ -7,13 +7,17 @@ Supports encrypted SQLite via SQLCipher for portable .hln files.
 
 from __future__ import annotations
 
+import functools
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator
 from urllib.parse import quote_plus
 
 from sqlalchemy import create_engine, select, delete, update, and_, event
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Dialect, Engine
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from .schema import (
     metadata,
@@ -41,6 +45,28 @@ except ImportError:
     pass
 
 
+def _sqlite_ddl(dialect: Dialect, if_not_exists: bool) -> tuple[str, ...]:
+    """The schema's CREATE TABLE/INDEX statements for a SQLite dialect."""
+    return _compile_sqlite_ddl(type(dialect), dialect.server_version_info, if_not_exists)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_sqlite_ddl(
+    dialect_cls: type[Dialect],
+    server_version_info: tuple[int, ...] | None,
+    if_not_exists: bool,
+) -> tuple[str, ...]:
+    """Compile the schema DDL once per dialect class and server version."""
+    dialect = dialect_cls()
+    dialect.server_version_info = server_version_info
+    statements = []
+    for table in metadata.sorted_tables:
+        statements.append(str(CreateTable(table, if_not_exists=if_not_exists).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            statements.append(str(CreateIndex(index, if_not_exists=if_not_exists).compile(dialect=dialect)))
+    return tuple(statements)
+
+
 class SQLStorage:
     """
     Generic SQL storage backend using SQLAlchemy Core.
@@ -79,6 +105,8 @@ class SQLStorage:
             self.connection_string = connection_string
 
         self._engine: Engine | None = None
+        # Per-thread connection of an open bulk() block, if any
+        self._local = threading.local()
 
     @property
     def engine(self) -> Engine:
@@ -87,6 +115,11 @@ class SQLStorage:
             raise RuntimeError("Storage not connected. Call connect() first.")
         return self._engine
 
+    @property
+    def is_connected(self) -> bool:
+        """Check if connect() has been called and disconnect() has not."""
+        return self._engine is not None
+
     @property
     def is_encrypted(self) -> bool:
         """Check if this storage uses encryption."""
@@ -120,9 +153,71 @@ class SQLStorage:
             self._engine.dispose()
             self._engine = None
 
-    def create_tables(self) -> None:
-        """Create all tables if they don't exist."""
-        metadata.create_all(self.engine)
+    def create_tables(self, checkfirst: bool = True) -> None:
+        """
+        Create all tables if they don't exist.
+
+        On SQLite the schema DDL is compiled once per dialect and server
+        version and replayed directly; existing tables are skipped with
+        CREATE ... IF NOT EXISTS instead of per-table probes.
+
+        Args:
+            checkfirst: Skip tables that already exist. Pass False when the
+                database is known to be empty; existing tables then raise.
+        """
+        if self.engine.dialect.name != "sqlite":
+            metadata.create_all(self.engine, checkfirst=checkfirst)
+            return
+
+        with self._begin() as conn:
+            for statement in _sqlite_ddl(self.engine.dialect, checkfirst):
+                conn.exec_driver_sql(statement)
+
+    @contextmanager
+    def bulk(self) -> Iterator["SQLStorage"]:
+        """
+        Run every storage call in the block inside a single transaction.
+
+        Writes made inside the block are committed together when it exits,
+        or rolled back together if it raises. Reads inside the block see the
+        uncommitted writes. Nested bulk() blocks join the outer transaction.
+        The transaction is bound to the calling thread; other threads keep
+        using their own connections.
+
+        Example:
+            with storage.bulk():
+                for hb in heartbeats:
+                    storage.save_heartbeat(hb)
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield self
+            return
+        with self.engine.begin() as conn:
+            self._local.conn = conn
+            try:
+                yield self
+            finally:
+                self._local.conn = None
+
+    @contextmanager
+    def _begin(self) -> Iterator[Connection]:
+        """Yield a connection for writes, committing on exit unless in bulk()."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+        with self.engine.begin() as conn:
+            yield conn
+
+    @contextmanager
+    def _connect(self) -> Iterator[Connection]:
+        """Yield a connection for reads, reusing the bulk() one if open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+        with self.engine.connect() as conn:
+            yield conn
 
     # =========================================================================
     # Holon persistence (the "type" / template)
@@ -165,7 +260,7 @@ class SQLStorage:
             actions_data.append(action_data)
         actions_json = json.dumps(actions_data) if actions_data else None
 
-        with self.engine.connect() as conn:
+        with self._begin() as conn:
             existing = conn.execute(
                 select(holons.c.id).where(holons.c.id == holon.id)
             ).fetchone()
@@ -192,11 +287,10 @@ class SQLStorage:
                         updated_at=now,
                     )
                 )
-            conn.commit()
 
     def load_holon(self, holon_id: str) -> dict[str, Any] | None:
         """Load a Holon's definition by ID."""
-        with self.engine.connect() as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 select(holons).where(holons.c.id == holon_id)
             ).fetchone()
@@ -204,33 +298,37 @@ class SQLStorage:
             if row is None:
                 return None
 
-            return {
-                "id": row.id,
-                "purpose": json.loads(row.purpose) if row.purpose else {},
-                "self_state": json.loads(row.self_state) if row.self_state else {},
-                "actions": json.loads(row.actions) if row.actions else [],
-                "created_at": row.created_at,
-                "updated_at": row.updated_at,
-            }
+            return self._holon_row_to_dict(row)
+
+    @staticmethod
+    def _holon_row_to_dict(row: Any) -> dict[str, Any]:
+        """Convert a holons row into the dict returned by load_holon."""
+        return {
+            "id": row.id,
+            "purpose": json.loads(row.purpose) if row.purpose else {},
+            "self_state": json.loads(row.self_state) if row.self_state else {},
+            "actions": json.loads(row.actions) if row.actions else [],
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+        }
 
     def delete_holon(self, holon_id: str) -> bool:
         """Delete a Holon from storage."""
-        with self.engine.connect() as conn:
+        with self._begin() as conn:
             result = conn.execute(
                 delete(holons).where(holons.c.id == holon_id)
             )
-            conn.commit()
             return result.rowcount > 0
 
     def list_holons(self) -> list[str]:
         """List all Holon IDs."""
-        with self.engine.connect() as conn:
+        with self._connect() as conn:
             result = conn.execute(select(holons.c.id))
             return [row.id for row in result]
 
     def get_holon_references(self, holon_id: str) -> list[dict[str, Any]]:
         """Get all hobjs that reference a holon."""
-        with self.engine.connect() as conn:
+        with self._connect() as conn:
             result = conn.execute(
                 select(holon_references)
                 .where(holon_references.c.holon_id == holon_id)
@@ -254,7 +352,7 @@ class SQLStorage:
 
         knowledge_json = json.dumps(hobj.knowledge) if hobj.knowledge else None
 
-        with self.engine.connect() as conn:
+        with self._begin() as conn:
             existing = conn.execute(
                 select(hobjs.c.id).where(hobjs.c.id == hobj.id)
             ).fetchone()
@@ -289,11 +387,10 @@ class SQLStorage:
                         updated_at=now,
                     )
                 )
-            conn.commit()
 
     def load_hobj(self, hobj_id: str) -> dict[str, Any] | None:
         """Load a HolonicObject's state by ID."""
-        with self.engine.connect() as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 select(hobjs).where(hobjs.c.id == hobj_id)
             ).fetchone()
@@ -301,31 +398,35 @@ class SQLStorage:
             if row is None:
                 return None
 
-            return {
-                "id": row.id,
-                "holon_id": row.holon_id,
-                "parent_id": row.parent_id,
-                "knowledge": json.loads(row.knowledge) if row.knowledge else {},
-                "token_bank": row.token_bank,
-                "heart_rate_secs": row.heart_rate_secs,
-                "last_heartbeat": row.last_heartbeat,
-                "next_heartbeat": row.next_heartbeat,
-                "created_at": row.created_at,
-                "updated_at": row.updated_at,
-            }
+            return self._hobj_row_to_dict(row)
+
+    @staticmethod
+    def _hobj_row_to_dict(row: Any) -> dict[str, Any]:
+        """Convert a hobjs row into the dict returned by load_hobj."""
+        return {
+            "id": row.id,
+            "holon_id": row.holon_id,
+            "parent_id": row.parent_id,
+            "knowledge": json.loads(row.knowledge) if row.knowledge else {},
+            "token_bank": row.token_bank,
+            "heart_rate_secs": row.heart_rate_secs,
+            "last_heartbeat": row.last_heartbeat,
+            "next_heartbeat": row.next_heartbeat,
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+        }
 
     def delete_hobj(self, hobj_id: str) -> bool:
         """Delete a HolonicObject from storage."""
-        with self.engine.connect() as conn:
+        with self._begin() as conn:
             result = conn.execute(
                 delete(hobjs).where(hobjs.c.id == hobj_id)
             )
-            conn.commit()
             return result.rowcount > 0
 
     def list_hobjs(self, parent_id: str | None = None) -> list[str]:
         """List HolonicObject IDs by parent."""
-        with self.engine.connect() as conn:
+        with self._connect() as conn:
             if parent_id is None:
                 result = conn.execute(
                     select(hobjs.c.id).where(hobjs.c.parent_id.is_(None))
@@ -338,31 +439,52 @@ class SQLStorage:
 
     def list_hobjs_by_holon(self, holon_id: str) -> list[str]:
         """List all HolonicObject IDs that use a specific Holon."""
-        with self.engine.connect() as conn:
+        with self._connect() as conn:
             result = conn.execute(
                 select(hobjs.c.id).where(hobjs.c.holon_id == holon_id)
             )
             return [row.id for row in result]
 
     def load_tree(self, root_id: str) -> dict[str, Any] | None:
-        """Load an entire holon tree starting from root_id."""
-        root_data = self.load_hobj(root_id)
-        if root_data is None:
-            return None
+        """
+        Load an entire holon tree starting from root_id.
+
+        Fetches the whole subtree with one recursive CTE and its holon
+        definitions with one IN query, then links children in Python.
+        """
+        tree = select(hobjs).where(hobjs.c.id == root_id).cte("tree", recursive=True)
+        tree = tree.union_all(
+            select(hobjs).join(tree, hobjs.c.parent_id == tree.c.id)
+        )
+
+        with self._connect() as conn:
+            nodes = [
+                self._hobj_row_to_dict(row)
+                for row in conn.execute(select(tree)).fetchall()
+            ]
+            if not nodes:
+                return None
+
+            holon_ids = {node["holon_id"] or node["id"] for node in nodes}
+            holon_rows = conn.execute(
+                select(holons).where(holons.c.id.in_(holon_ids))
+            ).fetchall()
 
-        # Load the holon definition
-        holon_data = self.load_holon(root_data.get("holon_id") or root_id)
-        if holon_data:
-            root_data["holon"] = holon_data
+        holon_by_id = {row.id: self._holon_row_to_dict(row) for row in holon_rows}
+        by_id: dict[str, dict[str, Any]] = {}
+        for node in nodes:
+            holon_data = holon_by_id.get(node["holon_id"] or node["id"])
+            if holon_data:
+                node["holon"] = holon_data
+            node["children"] = []
+            by_id[node["id"]] = node
 
-        # Recursively load children
-        child_ids = self.list_hobjs(parent_id=root_id)
-        root_data["children"] = [
-            self.load_tree(child_id)
-            for child_id in child_ids
-        ]
+        for node in nodes:
+            parent = by_id.get(node["parent_id"])
+            if parent is not None and node["id"] != root_id:
+                parent["children"].append(node)
 
-        return root_data
+        return by_id[root_id]
 
     # =========================================================================
     # Holon references (for multi-reference scenarios)
@@ -377,7 +499,7 @@ class SQLStorage:
         """Add a reference from a hobj to a holon."""
         now = datetime.now(timezone.utc)
 
-        with self.engine.connect() as conn:
+        with self._begin() as conn:
             result = conn.execute(
                 holon_references.insert().values(
                     holon_id=holon_id,
@@ -386,12 +508,11 @@ class SQLStorage:
                     created_at=now,
                 )
             )
-            conn.commit()
             return result.lastrowid
 
     def remove_holon_reference(self, holon_id: str, hobj_id: str) -> bool:
         """Remove a reference from a hobj to a holon."""
-        with self.engine.connect() as conn:
+        with self._begin() as conn:
             result = conn.execute(
                 delete(holon_references).where(
                     and_(
@@ -400,12 +521,11 @@ class SQLStorage:
                     )
                 )
             )
-            conn.commit()
             return result.rowcount > 0
 
     def get_hobj_holon_references(self, hobj_id: str) -> list[dict[str, Any]]:
         """Get all holons referenced by a hobj."""
-        with self.engine.connect() as conn:
+        with self._connect() as conn:
             result = conn.execute(
                 select(holon_references)
                 .where(holon_references.c.hobj_id == hobj_id)
@@ -484,11 +604,12 @@ class SQLStorage:
 
         Creates HolonicObject instances and reconnects parent/child relationships.
         """
-        tree_data = self.load_tree(root_id)
-        if tree_data is None:
-            return None
+        with self.bulk():
+            tree_data = self.load_tree(root_id)
+            if tree_data is None:
+                return None
 
-        return self._restore_tree_recursive(tree_data, parent=None)
+            return self._restore_tree_recursive(tree_data, parent=None)
 
     def _restore_tree_recursive(
         self,
@@ -545,7 +666,7 @@ class SQLStorage:
         """Save a heartbeat record and its hobj participation."""
         now = datetime.now(timezone.utc)
 
-        with self.engine.connect() as conn:
+        with self._begin() as conn:
             result = conn.execute(
                 heartbeats.insert().values(
                     heartbeat_time=heartbeat.heartbeat_time,
@@ -558,23 +679,23 @@ class SQLStorage:
             )
             heartbeat_id = result.lastrowid
 
-            for hobj in heartbeat.get_holonicobjects():
-                actions_result, hud_sent = heartbeat.get_results(hobj)
-                conn.execute(
-                    heartbeat_hobjs.insert().values(
-                        heartbeat_id=heartbeat_id,
-                        hobj_id=hobj.id,
-                        hud_sent=json.dumps(hud_sent),
-                        actions_result=json.dumps(actions_result),
-                    )
-                )
+            rows = [
+                {
+                    "heartbeat_id": heartbeat_id,
+                    "hobj_id": hobj.id,
+                    "hud_sent": heartbeat.get_hud_json(hobj),
+                    "actions_result": json.dumps(heartbeat.get_results(hobj)[0]),
+                }
+                for hobj in heartbeat.get_holonicobjects()
+            ]
+            if rows:
+                conn.execute(heartbeat_hobjs.insert(), rows)
 
-            conn.commit()
             return heartbeat_id
 
     def get_heartbeat(self, heartbeat_id: int) -> dict[str, Any] | None:
         """Get a specific heartbeat by ID."""
-        with self.engine.connect() as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 select(heartbeats).where(heartbeats.c.id == heartbeat_id)
             ).fetchone()
@@ -611,7 +732,7 @@ class SQLStorage:
         offset: int = 0,
     ) -> list[dict[str, Any]]:
         """Get heartbeat history."""
-        with self.engine.connect() as conn:
+        with self._connect() as conn:
             query = select(heartbeats).order_by(heartbeats.c.heartbeat_time.desc())
 
             conditions = []
@@ -642,7 +763,7 @@ class SQLStorage:
         limit: int = 100,
     ) -> list[dict[str, Any]]:
         """Get heartbeat history for a specific hobj."""
-        with self.engine.connect() as conn:
+        with self._connect() as conn:
             query = (
                 select(heartbeats, heartbeat_hobjs.c.hud_sent, heartbeat_hobjs.c.actions_result)
                 .join(heartbeat_hobjs, heartbeats.c.id == heartbeat_hobjs.c.heartbeat_id)
@@ -677,23 +798,51 @@ class SQLStorage:
         timestamp: datetime | None = None,
     ) -> None:
         """Save a message between hobjs."""
+        self.save_messages([
+            {
+                "message_id": message_id,
+                "sender_id": sender_id,
+                "recipient_ids": recipient_ids,
+                "content": content,
+                "tokens_attached": tokens_attached,
+                "timestamp": timestamp,
+            }
+        ])
+
+    def save_messages(self, batch: list[dict[str, Any]]) -> None:
+        """
+        Save several messages with one multi-row INSERT.
+
+        Each item takes the same keys as save_message's arguments.
+        """
+        rows = [self._message_row(**message) for message in batch]
+        if not rows:
+            return
+
+        with self._begin() as conn:
+            conn.execute(messages.insert(), rows)
+
+    @staticmethod
+    def _message_row(
+        message_id: str,
+        sender_id: str,
+        recipient_ids: list[str],
+        content: Any,
+        tokens_attached: int = 0,
+        timestamp: datetime | None = None,
+    ) -> dict[str, Any]:
+        """Build the messages row for one save_message call."""
         if timestamp is None:
             timestamp = datetime.now(timezone.utc)
 
-        content_json = json.dumps(content) if not isinstance(content, str) else content
-
-        with self.engine.connect() as conn:
-            conn.execute(
-                messages.insert().values(
-                    id=message_id,
-                    sender_id=sender_id,
-                    recipient_ids=json.dumps(recipient_ids),
-                    content=content_json,
-                    tokens_attached=tokens_attached,
-                    timestamp=timestamp,
-                )
-            )
-            conn.commit()
+        return {
+            "id": message_id,
+            "sender_id": sender_id,
+            "recipient_ids": json.dumps(recipient_ids),
+            "content": json.dumps(content) if not isinstance(content, str) else content,
+            "tokens_attached": tokens_attached,
+            "timestamp": timestamp,
+        }
 
     def get_messages(
         self,
@@ -702,7 +851,7 @@ class SQLStorage:
         limit: int = 100,
     ) -> list[dict[str, Any]]:
         """Get messages for a hobj."""
-        with self.engine.connect() as conn:
+        with self._connect() as conn:
             if direction == "sent":
                 condition = messages.c.sender_id == hobj_id
             elif direction == "received":
@@ -737,18 +886,22 @@ class SQLStorage:
     # Telemetry
     # =========================================================================
 
-    def save_telemetry_snapshot(self, snapshot: dict[str, Any]) -> int:
+    def save_telemetry_snapshot(
+        self,
+        snapshot: dict[str, Any],
+        timestamp: datetime | None = None,
+    ) -> int:
         """Save a telemetry snapshot."""
-        now = datetime.now(timezone.utc)
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
 
-        with self.engine.connect() as conn:
+        with self._begin() as conn:
             result = conn.execute(
                 telemetry_snapshots.insert().values(
-                    snapshot_time=now,
+                    snapshot_time=timestamp,
                     data=json.dumps(snapshot),
                 )
             )
-            conn.commit()
             return result.lastrowid
 
     def get_telemetry_snapshots(
@@ -757,7 +910,7 @@ class SQLStorage:
         limit: int = 100,
     ) -> list[dict[str, Any]]:
         """Get telemetry snapshots."""
-        with self.engine.connect() as conn:
+        with self._connect() as conn:
             query = (
                 select(telemetry_snapshots)
                 .order_by(telemetry_snapshots.c.snapshot_time.desc())
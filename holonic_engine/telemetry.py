@@ -8,7 +8,8 @@ for debugging and optimization.
 from __future__ import annotations
 
 import time
-from collections import defaultdict
+from itertools import islice
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
@@ -16,26 +17,43 @@ from typing import Any
 import attrs
 
 
-@dataclass
+@dataclass(slots=True)
 class TimingStats:
-    """Statistics for a timed operation."""
+    """
+    Statistics for a timed operation.
+
+    All figures are running accumulators updated in O(1) per record;
+    variance uses Welford's single-pass algorithm.
+    """
     count: int = 0
     total_ms: float = 0.0
     min_ms: float = float('inf')
     max_ms: float = 0.0
+    _mean: float = field(default=0.0, repr=False)
+    _m2: float = field(default=0.0, repr=False)
 
     def record(self, duration_ms: float) -> None:
         """Record a timing measurement."""
         self.count += 1
         self.total_ms += duration_ms
-        self.min_ms = min(self.min_ms, duration_ms)
-        self.max_ms = max(self.max_ms, duration_ms)
+        if duration_ms < self.min_ms:
+            self.min_ms = duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        delta = duration_ms - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (duration_ms - self._mean)
 
     @property
     def avg_ms(self) -> float:
         """Average duration in milliseconds."""
         return self.total_ms / self.count if self.count > 0 else 0.0
 
+    @property
+    def stddev_ms(self) -> float:
+        """Population standard deviation in milliseconds."""
+        return (self._m2 / self.count) ** 0.5 if self.count > 0 else 0.0
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -44,10 +62,11 @@ class TimingStats:
             "avg_ms": round(self.avg_ms, 2),
             "min_ms": round(self.min_ms, 2) if self.count > 0 else None,
             "max_ms": round(self.max_ms, 2) if self.count > 0 else None,
+            "stddev_ms": round(self.stddev_ms, 2),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CounterStats:
     """Simple counter with total and rate tracking."""
     count: int = 0
@@ -84,6 +103,22 @@ class CounterStats:
         }
 
 
+def _new_hobj_stats() -> dict[str, int]:
+    """Zeroed per-hobj counters, created on first sight of an hobj id."""
+    return {
+        "heartbeats": 0,
+        "actions": 0,
+        "tokens_received": 0,
+        "tokens_spent": 0,
+        "errors": 0,
+    }
+
+
+def _resize_errors(instance: HolonicTelemetry, attribute: attrs.Attribute, value: int) -> int:
+    instance._errors = deque(instance._errors, maxlen=value)
+    return value
+
+
 @attrs.define
 class HolonicTelemetry:
     """
@@ -115,18 +150,24 @@ class HolonicTelemetry:
     prompt_tokens_total: int = attrs.field(default=0)
     response_tokens_total: int = attrs.field(default=0)
 
-    # Error tracking
-    errors: list[dict[str, Any]] = attrs.field(factory=list)
-    _max_errors: int = attrs.field(default=100)
+    # Error tracking (oldest entries drop off once _max_errors is reached)
+    _errors: deque[dict[str, Any]] = attrs.field(factory=deque)
+    _max_errors: int = attrs.field(default=100, on_setattr=_resize_errors)
 
     # Per-hobj stats
-    hobj_stats: dict[str, dict[str, Any]] = attrs.field(factory=lambda: defaultdict(lambda: {
-        "heartbeats": 0,
-        "actions": 0,
-        "tokens_received": 0,
-        "tokens_spent": 0,
-        "errors": 0,
-    }))
+    hobj_stats: dict[str, dict[str, Any]] = attrs.field(factory=lambda: defaultdict(_new_hobj_stats))
+
+    def __attrs_post_init__(self) -> None:
+        self._errors = deque(self._errors, maxlen=self._max_errors)
+
+    @property
+    def errors(self) -> list[dict[str, Any]]:
+        """Recorded errors, oldest first, as a list copy."""
+        return list(self._errors)
+
+    @errors.setter
+    def errors(self, value: list[dict[str, Any]]) -> None:
+        self._errors = deque(value, maxlen=self._max_errors)
 
     def record_heartbeat(self, duration_ms: float, hobj_count: int) -> None:
         """Record a heartbeat cycle."""
@@ -145,11 +186,12 @@ class HolonicTelemetry:
         """Record an action dispatch."""
         self.actions_dispatched.increment()
         self.action_timing[action_name].record(duration_ms)
-        self.hobj_stats[hobj_id]["actions"] += 1
+        stats = self.hobj_stats[hobj_id]
+        stats["actions"] += 1
 
         if not success:
             self.actions_failed.increment()
-            self.hobj_stats[hobj_id]["errors"] += 1
+            stats["errors"] += 1
 
     def record_token_allocation(self, hobj_id: str, amount: int) -> None:
         """Record a token allocation."""
@@ -162,10 +204,7 @@ class HolonicTelemetry:
 
     def record_error(self, error_type: str, message: str, context: dict[str, Any] | None = None) -> None:
         """Record an error."""
-        if len(self.errors) >= self._max_errors:
-            self.errors.pop(0)
-
-        self.errors.append({
+        self._errors.append({
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "type": error_type,
             "message": message,
@@ -201,8 +240,8 @@ class HolonicTelemetry:
                 "unique_count": len(self.hobj_stats),
             },
             "errors": {
-                "count": len(self.errors),
-                "recent": self.errors[-5:] if self.errors else [],
+                "count": len(self._errors),
+                "recent": list(islice(self._errors, max(len(self._errors) - 5, 0), None)),
             },
         }
 
@@ -224,23 +263,30 @@ class HolonicTelemetry:
         self.ai_calls = CounterStats()
         self.prompt_tokens_total = 0
         self.response_tokens_total = 0
-        self.errors.clear()
+        self._errors.clear()
         self.hobj_stats.clear()
 
 
 class Timer:
     """Context manager for timing operations."""
 
+    __slots__ = ("start_ns", "duration_ms")
+
     def __init__(self) -> None:
-        self.start_time: float = 0
+        self.start_ns: int = 0
         self.duration_ms: float = 0
 
+    @property
+    def start_time(self) -> float:
+        """Start time in seconds on the perf_counter clock."""
+        return self.start_ns / 1e9
+
     def __enter__(self) -> "Timer":
-        self.start_time = time.perf_counter()
+        self.start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, *args) -> None:
-        self.duration_ms = (time.perf_counter() - self.start_time) * 1000
+        self.duration_ms = (time.perf_counter_ns() - self.start_ns) / 1e6
 
 
 # Global telemetry instance
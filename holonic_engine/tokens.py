@@ -6,19 +6,32 @@ Uses tiktoken for accurate token counting with OpenAI models.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Collection, Iterable, Iterator
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from .holon import Holon
 
 # Try to import tiktoken, gracefully degrade if not available
 try:
     import tiktoken
+    import tiktoken.model
     TIKTOKEN_AVAILABLE = True
 except ImportError:
     tiktoken = None
     TIKTOKEN_AVAILABLE = False
 
+# NumPy is only needed for count_series, so it is imported there on first use
+NUMPY_AVAILABLE = find_spec("numpy") is not None
+
 
 # Default encoding for modern models (GPT-4o, GPT-4o-mini)
 DEFAULT_ENCODING = "o200k_base"
@@ -36,20 +49,143 @@ MODEL_ENCODINGS = {
 }
 
 
+def _get_encoding(enc_name: str) -> "tiktoken.Encoding":
+    """
+    Load a tiktoken encoding by name.
+
+    This is the only place that touches tiktoken directly, so tests can
+    swap in a stand-in encoder by patching this one function.
+    """
+    return tiktoken.get_encoding(enc_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _encoding_for_model(model: str) -> str:
+    """
+    Encoding name for a model missing from MODEL_ENCODINGS.
+
+    Defers to tiktoken's own table, which also matches dated and
+    fine-tuned variants by prefix (e.g. "gpt-4-0613" -> cl100k_base),
+    and falls back to DEFAULT_ENCODING for models it does not know.
+    """
+    try:
+        return tiktoken.model.encoding_name_for_model(model)
+    except KeyError:
+        return DEFAULT_ENCODING
+
+
+_JSON_COUNTS_MAX = 256
+# (encoding name, digest of the JSON text) -> token count, least recent first.
+# Keyed on a digest so large payloads are not pinned in memory.
+_json_counts: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+_json_counts_lock = threading.Lock()
+
+
+def _count_json_text(text: str, encoder: "tiktoken.Encoding") -> int:
+    """Token count of serialized JSON, cached per (encoding name, text digest)."""
+    if not text:
+        return 0
+    key = (encoder.name, hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+    with _json_counts_lock:
+        count = _json_counts.get(key)
+        if count is not None:
+            _json_counts.move_to_end(key)
+            return count
+    count = _count_ordinary(encoder, text)
+    with _json_counts_lock:
+        _json_counts[key] = count
+        if len(_json_counts) > _JSON_COUNTS_MAX:
+            _json_counts.popitem(last=False)
+    return count
+
+
+_JSON_CHUNK_CHARS = 65536
+
+
+def _iter_json_chunks(data: Any, target: int = _JSON_CHUNK_CHARS) -> Iterator[str]:
+    """
+    Stream compact JSON for data in chunks of roughly target characters.
+
+    Chunks are only cut after a ',', '}' or ']' piece so that token merges
+    are not split inside strings or numbers.
+    """
+    encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+    parts: list[str] = []
+    size = 0
+    for piece in encoder.iterencode(data):
+        parts.append(piece)
+        size += len(piece)
+        if size >= target and piece[-1] in ",}]":
+            yield "".join(parts)
+            parts.clear()
+            size = 0
+    if parts:
+        yield "".join(parts)
+
+
+def _count_json_chunked(data: Any, encoder: "tiktoken.Encoding", max_chars: int) -> int:
+    """Approximate count_json over streamed chunks, one thread per CPU."""
+    threads = os.cpu_count() or 1
+    total = 0
+    chars = 0
+    batch: list[str] = []
+    for chunk in _iter_json_chunks(data):
+        chars += len(chunk)
+        if chars > max_chars:
+            raise ValueError(f"serialized JSON exceeds max_chars={max_chars}")
+        batch.append(chunk)
+        if len(batch) >= threads:
+            total += sum(map(len, encoder.encode_ordinary_batch(batch, num_threads=threads)))
+            batch.clear()
+    if batch:
+        total += sum(map(len, encoder.encode_ordinary_batch(batch, num_threads=threads)))
+    return total
+
+
+def _count_ordinary(encoder: "tiktoken.Encoding", text: str) -> int:
+    """Count ordinary tokens, treating special-token markers as plain text."""
+    return len(encoder.encode_ordinary(text))
+
+
+def _use_hf(backend: str) -> bool:
+    """Whether backend selects the Hugging Face tokenizers backend."""
+    if backend == "tiktoken":
+        return False
+    if backend == "hf":
+        return True
+    raise ValueError(f"Unknown token counting backend: {backend!r}")
+
+
 class TokenCounter:
     """
     Token counter using tiktoken.
 
-    Caches encoders for efficiency.
+    Caches encoders for efficiency, one per encoding name. Model names are
+    resolved to an encoding name first, so the cache stays bounded by the
+    handful of tiktoken encodings no matter how many models are passed.
     """
 
+    __slots__ = ()
+
     _encoders: dict[str, "tiktoken.Encoding"] = {}
+    _encoders_lock = threading.Lock()
+    # (model, encoding) exactly as passed -> encoder, so repeat calls skip
+    # name normalization and resolution; capped against unbounded model names
+    _resolved: dict[tuple[str | None, str | None], "tiktoken.Encoding"] = {}
+    _RESOLVED_MAX = 1024
+
+    # Longest text any count method will tokenize; anything longer is almost
+    # always an accidental payload that would tie up the encoder for minutes
+    max_chars = 10_000_000
 
     @classmethod
     def get_encoder(cls, model: str | None = None, encoding: str | None = None) -> "tiktoken.Encoding":
         """
         Get a tiktoken encoder.
 
+        Model names are matched case-insensitively and without surrounding
+        whitespace ("GPT-4o " resolves like "gpt-4o").
+
         Args:
             model: Model name (e.g., "gpt-4o") - will look up encoding
             encoding: Encoding name directly (e.g., "o200k_base")
@@ -57,6 +193,11 @@ class TokenCounter:
         Returns:
             tiktoken Encoding instance
         """
+        key = (model, encoding)
+        encoder = cls._resolved.get(key)
+        if encoder is not None:
+            return encoder
+
         if not TIKTOKEN_AVAILABLE:
             raise ImportError(
                 "Token counting requires the 'tiktoken' package. "
@@ -64,18 +205,52 @@ class TokenCounter:
             )
 
         # Determine encoding to use
+        normalized = model.strip().lower() if model else model
         if encoding:
             enc_name = encoding
-        elif model:
-            enc_name = MODEL_ENCODINGS.get(model, DEFAULT_ENCODING)
+        elif normalized:
+            enc_name = MODEL_ENCODINGS.get(normalized) or _encoding_for_model(normalized)
         else:
             enc_name = DEFAULT_ENCODING
 
-        # Cache encoders
-        if enc_name not in cls._encoders:
-            cls._encoders[enc_name] = tiktoken.get_encoding(enc_name)
+        encoder = cls._encoders.get(enc_name)
+        if encoder is None:
+            # Loading an encoding can download and parse a large BPE file;
+            # the lock keeps concurrent first calls from doing it twice
+            with cls._encoders_lock:
+                encoder = cls._encoders.get(enc_name)
+                if encoder is None:
+                    encoder = cls._encoders[enc_name] = _get_encoding(enc_name)
 
-        return cls._encoders[enc_name]
+        if len(cls._resolved) < cls._RESOLVED_MAX:
+            cls._resolved[key] = encoder
+            cls._resolved[(normalized, encoding)] = encoder
+        return encoder
+
+    @classmethod
+    def warmup(cls, encodings: Iterable[str] = (DEFAULT_ENCODING, "cl100k_base")) -> None:
+        """
+        Load and cache encoders ahead of the first count.
+
+        Loading an encoding downloads or parses its BPE table, which can take
+        a noticeable fraction of a second; long-running processes can pay it
+        at startup instead. Errors from loading (e.g. no network for the
+        download) propagate, so the caller decides whether to retry.
+
+        Args:
+            encodings: Encoding names to load
+        """
+        for enc_name in encodings:
+            cls.get_encoder(encoding=enc_name)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached encoders."""
+        with cls._encoders_lock:
+            cls._encoders.clear()
+            cls._resolved.clear()
+        with _json_counts_lock:
+            _json_counts.clear()
 
     @classmethod
     def count(
@@ -83,21 +258,153 @@ class TokenCounter:
         text: str,
         *,
         model: str | None = None,
-        encoding: str | None = None
+        encoding: str | None = None,
+        allow_special: bool = False,
+        backend: str = "tiktoken"
     ) -> int:
         """
         Count tokens in a text string.
 
+        Special-token markers such as "<|endoftext|>" are counted as the
+        plain text they are, which skips tiktoken's special-token scan.
+
         Args:
             text: The text to tokenize
             model: Model name for encoding lookup
             encoding: Direct encoding name
+            allow_special: Count special-token markers as single special tokens
+            backend: "tiktoken", or "hf" for the optional Hugging Face
+                tokenizers backend (see tokens_hf), which ignores model,
+                encoding and allow_special
+
+        Returns:
+            Number of tokens, always a plain int
+
+        Raises:
+            TypeError: If text is not a str
+            ValueError: If text is longer than max_chars, or backend is not
+                "tiktoken" or "hf"
+        """
+        if not text:
+            # Only falsy input is checked here, where None or b"" would
+            # otherwise count as 0; other non-str input fails in the encoder
+            if not isinstance(text, str):
+                raise TypeError(f"text must be str, not {type(text).__name__}")
+            return 0
+        if len(text) > cls.max_chars:
+            raise ValueError(f"text exceeds max_chars={cls.max_chars}")
+        if _use_hf(backend):
+            from .tokens_hf import HFTokenCounter
+            return HFTokenCounter.count(text)
+        encoder = cls.get_encoder(model=model, encoding=encoding)
+        if allow_special:
+            return len(encoder.encode(text, allowed_special="all"))
+        return _count_ordinary(encoder, text)
+
+    @classmethod
+    def count_bytes(
+        cls,
+        data: bytes,
+        *,
+        model: str | None = None,
+        encoding: str | None = None
+    ) -> int:
+        """
+        Count tokens in UTF-8 encoded bytes.
+
+        The bytes are validated and decoded in one strict pass by CPython's
+        UTF-8 decoder, which already skips ASCII runs a machine word at a
+        time, then counted like count().
+
+        Args:
+            data: UTF-8 bytes, or any object supporting the buffer protocol
+            model: Model name for encoding lookup
+            encoding: Direct encoding name
 
         Returns:
             Number of tokens
+
+        Raises:
+            TypeError: If data is a str or not bytes-like
+            UnicodeDecodeError: If data is not valid UTF-8
+        """
+        if isinstance(data, str):
+            raise TypeError("data must be bytes-like, not str; use count() for text")
+        return cls.count(str(data, "utf-8"), model=model, encoding=encoding)
+
+    @classmethod
+    def count_batch(
+        cls,
+        texts: list[str],
+        *,
+        model: str | None = None,
+        encoding: str | None = None,
+        backend: str = "tiktoken"
+    ) -> list[int]:
+        """
+        Count tokens in many strings at once.
+
+        Resolves the encoder once and tokenizes the whole batch through
+        tiktoken's thread pool, which releases the GIL per text.
+
+        Args:
+            texts: The texts to tokenize
+            model: Model name for encoding lookup
+            encoding: Direct encoding name
+            backend: "tiktoken", or "hf" for the optional Hugging Face
+                tokenizers backend, which ignores model and encoding
+
+        Returns:
+            Number of tokens for each text, in order
+
+        Raises:
+            ValueError: If any text is longer than max_chars
         """
+        limit = cls.max_chars
+        if any(len(text) > limit for text in texts):
+            raise ValueError(f"text exceeds max_chars={limit}")
+        if _use_hf(backend):
+            from .tokens_hf import HFTokenCounter
+            return HFTokenCounter.count_batch(texts)
         encoder = cls.get_encoder(model=model, encoding=encoding)
-        return len(encoder.encode(text))
+        batches = encoder.encode_ordinary_batch(texts, num_threads=os.cpu_count() or 1)
+        return [len(tokens) for tokens in batches]
+
+    @classmethod
+    def count_series(
+        cls,
+        texts: Collection[str],
+        *,
+        model: str | None = None,
+        encoding: str | None = None
+    ) -> "np.ndarray":
+        """
+        Count tokens in every string of a pandas Series or NumPy array.
+
+        A vectorized replacement for df["prompt"].map(count_tokens): the
+        values are converted to a list once, counted with count_batch, and
+        returned as a contiguous int64 array ready for aggregation.
+
+        Args:
+            texts: Strings with __iter__ and __len__, e.g. a Series or ndarray
+            model: Model name for encoding lookup
+            encoding: Direct encoding name
+
+        Returns:
+            int64 array of token counts, in order
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError(
+                "count_series requires the 'numpy' package. "
+                "Install with: pip install numpy"
+            )
+        import numpy as np
+
+        if len(texts) == 0:
+            return np.empty(0, dtype=np.int64)
+        values = texts.tolist() if hasattr(texts, "tolist") else list(texts)
+        counts = cls.count_batch(values, model=model, encoding=encoding)
+        return np.fromiter(counts, dtype=np.int64, count=len(counts))
 
     @classmethod
     def count_json(
@@ -105,29 +412,52 @@ class TokenCounter:
         data: dict,
         *,
         model: str | None = None,
-        encoding: str | None = None
+        encoding: str | None = None,
+        exact: bool = True
     ) -> int:
         """
         Count tokens in a JSON-serializable dict.
 
+        The dict is serialized compactly, without ASCII escaping, the same
+        way prompts are, and tokenized in a single encode call. Counts are
+        cached per serialized text, so repeated fragments such as schemas
+        and tool specs are tokenized once.
+
+        With exact=False the JSON is streamed in ~64KB chunks cut at
+        structural boundaries and tokenized in parallel batches, so the
+        full text is never held in memory. Merges that would span a cut are
+        lost, so the count can differ slightly from the exact one; use it
+        for very large payloads where an estimate is enough.
+
         Args:
             data: Dictionary to serialize and count
             model: Model name for encoding lookup
             encoding: Direct encoding name
+            exact: Tokenize the whole serialization at once
 
         Returns:
             Number of tokens
+
+        Raises:
+            ValueError: If the serialized JSON is longer than max_chars
         """
-        import json
-        text = json.dumps(data)
-        return cls.count(text, model=model, encoding=encoding)
+        encoder = cls.get_encoder(model=model, encoding=encoding)
+        if not exact:
+            return _count_json_chunked(data, encoder, cls.max_chars)
+
+        from .serialization import _dumps
+        text = _dumps(data)
+        if len(text) > cls.max_chars:
+            raise ValueError(f"serialized JSON exceeds max_chars={cls.max_chars}")
+        return _count_json_text(text, encoder)
 
 
 def count_tokens(
     text: str,
     *,
     model: str | None = None,
-    encoding: str | None = None
+    encoding: str | None = None,
+    allow_special: bool = False
 ) -> int:
     """
     Count tokens in a text string.
@@ -136,11 +466,82 @@ def count_tokens(
         text: The text to tokenize
         model: Model name (e.g., "gpt-4o") for encoding lookup
         encoding: Direct encoding name (e.g., "o200k_base")
+        allow_special: Count special-token markers as single special tokens
 
     Returns:
         Number of tokens
     """
-    return TokenCounter.count(text, model=model, encoding=encoding)
+    return TokenCounter.count(text, model=model, encoding=encoding, allow_special=allow_special)
+
+
+def count_tokens_batch(
+    texts: list[str],
+    *,
+    model: str | None = None,
+    encoding: str | None = None
+) -> list[int]:
+    """
+    Count tokens in many strings at once.
+
+    Args:
+        texts: The texts to tokenize
+        model: Model name (e.g., "gpt-4o") for encoding lookup
+        encoding: Direct encoding name (e.g., "o200k_base")
+
+    Returns:
+        Number of tokens for each text, in order
+    """
+    return TokenCounter.count_batch(texts, model=model, encoding=encoding)
+
+
+async def count_tokens_async(
+    text: str,
+    *,
+    model: str | None = None,
+    encoding: str | None = None
+) -> int:
+    """
+    Count tokens in a text string without blocking the event loop.
+
+    Runs count_tokens in the default executor; tiktoken releases the GIL
+    while encoding, so concurrent calls run in parallel.
+
+    Args:
+        text: The text to tokenize
+        model: Model name (e.g., "gpt-4o") for encoding lookup
+        encoding: Direct encoding name (e.g., "o200k_base")
+
+    Returns:
+        Number of tokens
+    """
+    import asyncio
+
+    return await asyncio.to_thread(count_tokens, text, model=model, encoding=encoding)
+
+
+async def count_tokens_batch_async(
+    texts: list[str],
+    *,
+    model: str | None = None,
+    encoding: str | None = None
+) -> list[int]:
+    """
+    Count tokens in many strings without blocking the event loop.
+
+    The whole batch goes to one worker thread, which fans it out over
+    tiktoken's own thread pool.
+
+    Args:
+        texts: The texts to tokenize
+        model: Model name (e.g., "gpt-4o") for encoding lookup
+        encoding: Direct encoding name (e.g., "o200k_base")
+
+    Returns:
+        Number of tokens for each text, in order
+    """
+    import asyncio
+
+    return await asyncio.to_thread(count_tokens_batch, texts, model=model, encoding=encoding)
 
 
 def is_available() -> bool:
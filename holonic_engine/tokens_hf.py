@@ -0,0 +1,105 @@
+"""
+Optional Hugging Face tokenizers backend for token counting.
+
+The Rust `tokenizers` library batches encodes across threads and is
+typically faster than tiktoken on long text. Only counts are used, so a
+tokenizer that mirrors an OpenAI vocabulary gives the same numbers within
+a small margin. tiktoken stays the default backend.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import tokenizers
+
+# Try to import tokenizers, gracefully degrade if not available
+try:
+    from tokenizers import Tokenizer
+    TOKENIZERS_AVAILABLE = True
+except ImportError:
+    Tokenizer = None
+    TOKENIZERS_AVAILABLE = False
+
+
+# Hub repository of a tokenizer that mirrors o200k_base (GPT-4o)
+DEFAULT_HF_TOKENIZER = "Xenova/gpt-4o"
+
+
+def _load_tokenizer(name: str) -> "tokenizers.Tokenizer":
+    """Load a tokenizer from the Hugging Face Hub by repository name."""
+    return Tokenizer.from_pretrained(name)
+
+
+class HFTokenCounter:
+    """
+    Token counter using Hugging Face tokenizers.
+
+    Caches tokenizers per Hub repository name, like TokenCounter does for
+    tiktoken encodings.
+    """
+
+    __slots__ = ()
+
+    _tokenizers: dict[str, "tokenizers.Tokenizer"] = {}
+    _tokenizers_lock = threading.Lock()
+
+    @classmethod
+    def get_tokenizer(cls, name: str = DEFAULT_HF_TOKENIZER) -> "tokenizers.Tokenizer":
+        """
+        Get a Hugging Face tokenizer.
+
+        Args:
+            name: Hub repository name (e.g., "Xenova/gpt-4o")
+
+        Returns:
+            tokenizers Tokenizer instance
+        """
+        if not TOKENIZERS_AVAILABLE:
+            raise ImportError(
+                "The 'hf' token counting backend requires the 'tokenizers' package. "
+                "Install with: pip install tokenizers"
+            )
+
+        tokenizer = cls._tokenizers.get(name)
+        if tokenizer is None:
+            with cls._tokenizers_lock:
+                tokenizer = cls._tokenizers.get(name)
+                if tokenizer is None:
+                    tokenizer = cls._tokenizers[name] = _load_tokenizer(name)
+        return tokenizer
+
+    @classmethod
+    def count(cls, text: str, *, name: str = DEFAULT_HF_TOKENIZER) -> int:
+        """
+        Count tokens in a text string.
+
+        Args:
+            text: The text to tokenize
+            name: Hub repository name of the tokenizer
+
+        Returns:
+            Number of tokens
+        """
+        if not text:
+            return 0
+        return len(cls.get_tokenizer(name).encode(text, add_special_tokens=False).ids)
+
+    @classmethod
+    def count_batch(cls, texts: list[str], *, name: str = DEFAULT_HF_TOKENIZER) -> list[int]:
+        """
+        Count tokens in many strings at once.
+
+        Args:
+            texts: The texts to tokenize
+            name: Hub repository name of the tokenizer
+
+        Returns:
+            Number of tokens for each text, in order
+        """
+        if not texts:
+            return []
+        encodings = cls.get_tokenizer(name).encode_batch(list(texts), add_special_tokens=False)
+        return [len(encoding.ids) for encoding in encodings]
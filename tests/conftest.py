@@ -0,0 +1,134 @@
+"""
+Shared pytest fixtures.
+"""
+
+import itertools
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from holonic_engine import Holon, HolonicObject, agent, reset_telemetry
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def multiply(x: int, y: int) -> int:
+    return x * y
+
+
+def greet(user_name: str, greeting: str = "Hello") -> str:
+    return f"{greeting}, {user_name}!"
+
+
+def double(x: int) -> int:
+    """Double a number."""
+    return x * 2
+
+
+class StubClient:
+    """
+    Minimal AI client stand-in that counts chat.completions.create calls.
+
+    Cheaper than a Mock for the many heart tests that only need an object
+    to hand to HolonicHeart and, occasionally, to check it was never used.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        self.calls += 1
+        raise AssertionError("chat.completions.create should not be called")
+
+
+_id_counter = itertools.count(1)
+
+
+def _counter_uuid4() -> uuid.UUID:
+    return uuid.UUID(int=next(_id_counter))
+
+
+@pytest.fixture(autouse=True)
+def _sequential_ids(monkeypatch):
+    """
+    Hand out sequential UUIDs to HolonicObjects and Messages.
+
+    The counter is shared across the session, so ids stay unique between
+    tests and keep the 36-character UUID shape without reading urandom.
+    """
+    monkeypatch.setattr(agent, "uuid", SimpleNamespace(uuid4=_counter_uuid4))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_telemetry():
+    """Give every test an empty global telemetry collector."""
+    reset_telemetry()
+
+
+@pytest.fixture(scope="session")
+def empty_holon():
+    """A shared empty Holon. Tests must not mutate it."""
+    return Holon()
+
+
+@pytest.fixture(scope="session")
+def full_holon():
+    """A shared Holon with purpose, self state and one action. Tests must not mutate it."""
+    return (
+        Holon()
+        .add_purpose("Main purpose")
+        .add_self({"key": "value"}, key="data")
+        .add_action(double, name="my_action", purpose="Double input")
+    )
+
+
+@pytest.fixture(scope="session")
+def arith_holon():
+    """A shared Holon exposing add, multiply and greet actions. Tests must not mutate it."""
+    return (
+        Holon()
+        .add_action(add, name="add")
+        .add_action(multiply, name="multiply")
+        .add_action(greet, name="greet")
+    )
+
+
+@pytest.fixture(scope="session")
+def arith_holon_data(arith_holon):
+    """arith_holon.to_dict(), computed once. Its bindings are all static, so the view can't go stale."""
+    return arith_holon.to_dict()
+
+
+@pytest.fixture
+def stub_client():
+    """A stand-in AI client for HolonicHeart tests that never reach the network."""
+    return StubClient()
+
+
+@pytest.fixture
+def fresh_root():
+    """A new root HolonicObject with no children."""
+    return HolonicObject()
+
+
+@pytest.fixture
+def now_utc():
+    """The current UTC time, truncated to the second like heartbeat times."""
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+
+@pytest.fixture
+def past_due(now_utc):
+    """A next_heartbeat value that is already due."""
+    return now_utc - timedelta(seconds=1)
+
+
+@pytest.fixture
+def future(now_utc):
+    """A next_heartbeat value an hour away, so it is not due."""
+    return now_utc + timedelta(hours=1)
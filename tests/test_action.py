@@ -2,6 +2,7 @@
 Tests for HolonAction, ActionParameter, and ActionSignature.
 """
 
+import attrs
 import pytest
 
 from holonic_engine import ActionParameter, ActionSignature, HolonAction
@@ -51,6 +52,20 @@ class TestActionParameter:
 class TestActionSignature:
     """Tests for ActionSignature class."""
 
+    def test_parameters_are_immutable(self):
+        """Test parameters can only be replaced, which refreshes the converter cache."""
+        sig = ActionSignature(parameters=[ActionParameter(name="x")])
+        assert isinstance(sig.parameters, tuple)
+        with pytest.raises(AttributeError):
+            sig.parameters.append(ActionParameter(name="y"))
+        with pytest.raises(attrs.exceptions.FrozenInstanceError):
+            sig.parameters[0].name = "y"
+
+        sig._unstructured = ((), None, None)
+        sig.parameters = [ActionParameter(name="y")]
+        assert sig.parameters == (ActionParameter(name="y"),)
+        assert sig._unstructured is None
+
     def test_from_simple_function(self):
         """Test extracting signature from a simple function."""
         def simple_func(x: int, y: str) -> bool:
@@ -105,6 +120,27 @@ class TestActionSignature:
         assert len(sig.parameters) == 2
         assert sig.parameters[0].name == "x"
 
+    def test_bound_method_matches_uncached_inspection(self):
+        """Test cached signatures of bound methods drop only self."""
+        class Box:
+            def put(self, item: str, count: int = 1) -> bool:
+                """Put items in the box."""
+                return True
+
+            def spread(*args):
+                return args
+
+        a, b = Box(), Box()
+        sig = ActionSignature.from_callable(a.put)
+        assert [p.name for p in sig.parameters] == ["item", "count"]
+        assert sig.return_type == "bool"
+        assert sig.docstring == "Put items in the box."
+        assert [p.name for p in ActionSignature.from_callable(a.spread).parameters] == ["args"]
+
+        other = ActionSignature.from_callable(b.put)
+        assert other == sig
+        assert other.parameters[0] is not sig.parameters[0]
+
 
 class TestHolonAction:
     """Tests for HolonAction class."""
@@ -30,6 +30,14 @@ class TestHolonicObjectCreation:
         obj2 = HolonicObject()
         assert obj1.id != obj2.id
 
+    def test_builtin_actions_registered(self):
+        """Test every entry in the built-in table is bound to the instance."""
+        obj = HolonicObject()
+        for method_name, action_name, purpose in HolonicObject._BUILTIN_ACTIONS:
+            action = obj.actions.get(action_name)
+            assert action.callback == getattr(obj, method_name)
+            assert action.purpose == purpose
+
 
 class TestChildManagement:
     """Tests for child object management."""
@@ -450,6 +458,25 @@ class TestHeartbeat:
         obj.set_next_heartbeat(future)
         assert obj.next_heartbeat == future
 
+    def test_next_heartbeat_ns_tracks_datetime(self):
+        """Test that the epoch-ns mirror follows construction and assignment."""
+        from datetime import datetime, timezone
+        when = datetime(2030, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+        obj = HolonicObject(next_heartbeat=when)
+        assert obj.next_heartbeat_ns == int(when.timestamp()) * 10**9 + 678901000
+
+        later = datetime(2031, 1, 1, tzinfo=timezone.utc)
+        obj.next_heartbeat = later
+        assert obj.next_heartbeat is later
+        assert obj.next_heartbeat_ns == int(later.timestamp()) * 10**9
+
+    def test_next_heartbeat_ns_naive_is_utc(self):
+        """Test that naive datetimes (e.g. loaded from storage) are read as UTC."""
+        from datetime import datetime, timezone
+        obj = HolonicObject()
+        obj.next_heartbeat = datetime(2030, 1, 1)
+        assert obj.next_heartbeat_ns == int(datetime(2030, 1, 1, tzinfo=timezone.utc).timestamp()) * 10**9
+
     def test_collect_due_heartbeats_single(self):
         """Test collecting heartbeats from single holon."""
         obj = HolonicObject()
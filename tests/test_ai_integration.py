@@ -8,32 +8,77 @@ These tests require API keys to be set as environment variables:
 Tests are skipped if API keys are not available.
 """
 
-import json
+import functools
 import os
 
 import pytest
 
 from holonic_engine import Holon, serialize_for_ai, parse_ai_response
+from holonic_engine.serialization import _loads
 
 
 # Check for API availability
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 
-# Try to import API clients
-try:
-    import openai
-    OPENAI_AVAILABLE = OPENAI_API_KEY is not None
-except ImportError:
-    openai = None
-    OPENAI_AVAILABLE = False
 
-try:
-    import anthropic
-    ANTHROPIC_AVAILABLE = ANTHROPIC_API_KEY is not None
-except ImportError:
-    anthropic = None
-    ANTHROPIC_AVAILABLE = False
+# API clients are imported on first use so collecting this module
+# doesn't pay for the SDK imports when the tests are going to be skipped
+@functools.cache
+def _openai():
+    """Return the openai module, or None if it is not installed."""
+    try:
+        import openai
+    except ImportError:
+        return None
+    return openai
+
+
+@functools.cache
+def _anthropic():
+    """Return the anthropic module, or None if it is not installed."""
+    try:
+        import anthropic
+    except ImportError:
+        return None
+    return anthropic
+
+
+def openai_available() -> bool:
+    return OPENAI_API_KEY is not None and _openai() is not None
+
+
+def anthropic_available() -> bool:
+    return ANTHROPIC_API_KEY is not None and _anthropic() is not None
+
+
+def _keepalive_http_client():
+    """Shared HTTP transport settings so sequential calls reuse connections."""
+    import httpx
+    return httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+
+
+@pytest.fixture(scope="session")
+def openai_client():
+    """One OpenAI client (and connection pool) for the whole session."""
+    if not openai_available():
+        pytest.skip("OpenAI API not available (set OPENAI_API_KEY)")
+    client = _openai().OpenAI(http_client=_keepalive_http_client())
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def anthropic_client():
+    """One Anthropic client (and connection pool) for the whole session."""
+    if not anthropic_available():
+        pytest.skip("Anthropic API not available (set ANTHROPIC_API_KEY)")
+    client = _anthropic().Anthropic(http_client=_keepalive_http_client())
+    yield client
+    client.close()
 
 
 # Sample actions for testing
@@ -80,232 +125,149 @@ def create_test_holon() -> Holon:
     )
 
 
-class TestOpenAIIntegration:
-    """Integration tests using OpenAI API."""
+SINGLE_ACTION_INSTRUCTIONS = "Respond ONLY with valid JSON for action calls."
+MULTI_ACTION_INSTRUCTIONS = (
+    "When asked for multiple actions, respond with: "
+    "{\"actions\": [{\"action\": \"name\", \"params\": {...}}, ...]}"
+)
 
-    @pytest.fixture
-    def client(self):
-        """Create OpenAI client."""
-        if not OPENAI_AVAILABLE:
-            pytest.skip("OpenAI API not available (set OPENAI_API_KEY)")
-        return openai.OpenAI()
 
-    @pytest.fixture
-    def holon(self):
-        """Create test Holon."""
-        return create_test_holon()
+def _is_addition_42(results):
+    return len(results) == 1 and results[0] == 42  # 15 + 27
 
-    def test_simple_calculation(self, client, holon):
-        """Test AI can call add_numbers action."""
-        context = serialize_for_ai(holon, format="json")
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"You are an AI assistant. Here is your context:\n{context}\n\nRespond ONLY with valid JSON for action calls."
-                },
-                {
-                    "role": "user",
-                    "content": "Please add 15 and 27 together."
-                }
-            ],
-            temperature=0,
-        )
+def _greets_alice(results):
+    return len(results) == 1 and "Alice" in results[0]
 
-        # Parse the AI response
-        ai_text = response.choices[0].message.content
-        # Extract JSON from response (may have markdown code blocks)
-        if "```" in ai_text:
-            # Extract JSON from code block
-            start = ai_text.find("{")
-            end = ai_text.rfind("}") + 1
-            ai_text = ai_text[start:end]
 
-        action_calls = parse_ai_response(ai_text)
-        results = holon.dispatch_many(action_calls)
+def _add_then_multiply(results):
+    return len(results) == 2 and 8 in results and 24 in results  # 5 + 3, 4 * 6
 
-        assert len(results) == 1
-        assert results[0] == 42  # 15 + 27
 
-    def test_greeting_with_parameter(self, client, holon):
-        """Test AI can call greet_user with parameters."""
-        context = serialize_for_ai(holon, format="json")
+def _is_addition_150(results):
+    return len(results) == 1 and results[0] == 150  # 100 + 50
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"You are an AI assistant. Here is your context:\n{context}\n\nRespond ONLY with valid JSON for action calls."
-                },
-                {
-                    "role": "user",
-                    "content": "Please greet Alice formally."
-                }
-            ],
-            temperature=0,
-        )
 
-        ai_text = response.choices[0].message.content
-        if "```" in ai_text:
-            start = ai_text.find("{")
-            end = ai_text.rfind("}") + 1
-            ai_text = ai_text[start:end]
+def _seattle_weather(results):
+    return (
+        len(results) == 1
+        and results[0]["city"] == "Seattle"
+        and "temperature" in results[0]
+    )
 
-        action_calls = parse_ai_response(ai_text)
-        results = holon.dispatch_many(action_calls)
 
-        assert len(results) == 1
-        assert "Alice" in results[0]
+def _greets_bob(results):
+    return len(results) == 1 and "Bob" in results[0]
 
-    def test_multiple_actions(self, client, holon):
-        """Test AI can call multiple actions."""
-        context = serialize_for_ai(holon, format="json")
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"You are an AI assistant. Here is your context:\n{context}\n\nWhen asked for multiple actions, respond with: {{\"actions\": [{{\"action\": \"name\", \"params\": {{...}}}}, ...]}}"
-                },
-                {
-                    "role": "user",
-                    "content": "Add 5 and 3, then multiply 4 by 6."
-                }
-            ],
-            temperature=0,
-        )
+OPENAI_CASES = [
+    pytest.param("Please add 15 and 27 together.", SINGLE_ACTION_INSTRUCTIONS, _is_addition_42, id="simple_calculation"),
+    pytest.param("Please greet Alice formally.", SINGLE_ACTION_INSTRUCTIONS, _greets_alice, id="greeting_with_parameter"),
+    pytest.param("Add 5 and 3, then multiply 4 by 6.", MULTI_ACTION_INSTRUCTIONS, _add_then_multiply, id="multiple_actions"),
+]
 
-        ai_text = response.choices[0].message.content
-        if "```" in ai_text:
-            start = ai_text.find("{")
-            end = ai_text.rfind("}") + 1
-            ai_text = ai_text[start:end]
+ANTHROPIC_CASES = [
+    pytest.param("Please add 100 and 50 together.", SINGLE_ACTION_INSTRUCTIONS + " No additional text.", _is_addition_150, id="simple_calculation"),
+    pytest.param("What's the weather in Seattle?", SINGLE_ACTION_INSTRUCTIONS, _seattle_weather, id="weather_lookup"),
+    pytest.param("Please greet Bob casually.", SINGLE_ACTION_INSTRUCTIONS, _greets_bob, id="greeting_action"),
+]
 
-        action_calls = parse_ai_response(ai_text)
-        results = holon.dispatch_many(action_calls)
 
-        # Should have two results
-        assert len(results) == 2
-        assert 8 in results  # 5 + 3
-        assert 24 in results  # 4 * 6
+def dispatch_ai_text(holon: Holon, ai_text: str) -> list:
+    """Extract the JSON payload from an AI reply and dispatch it on the Holon."""
+    # Extract JSON from response (may have markdown code blocks)
+    if "```" in ai_text:
+        start = ai_text.find("{")
+        end = ai_text.rfind("}") + 1
+        ai_text = ai_text[start:end]
 
+    action_calls = parse_ai_response(ai_text)
+    return holon.dispatch_many(action_calls)
 
-class TestAnthropicIntegration:
-    """Integration tests using Anthropic Claude API."""
+
+class TestOpenAIIntegration:
+    """Integration tests using OpenAI API."""
 
     @pytest.fixture
-    def client(self):
-        """Create Anthropic client."""
-        if not ANTHROPIC_AVAILABLE:
-            pytest.skip("Anthropic API not available (set ANTHROPIC_API_KEY)")
-        return anthropic.Anthropic()
+    def client(self, openai_client):
+        """Use the session OpenAI client."""
+        return openai_client
 
     @pytest.fixture
     def holon(self):
         """Create test Holon."""
         return create_test_holon()
 
-    def test_simple_calculation(self, client, holon):
-        """Test Claude can call add_numbers action."""
+    @pytest.mark.parametrize("prompt,instructions,check", OPENAI_CASES)
+    def test_openai_action(self, client, holon, prompt, instructions, check):
+        """Test the model dispatches the expected action(s) for each prompt."""
         context = serialize_for_ai(holon, format="json")
 
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1024,
-            system=f"You are an AI assistant. Here is your context:\n{context}\n\nRespond ONLY with valid JSON for action calls, no additional text.",
+        response = client.chat.completions.create(
+            model="gpt-4o-mini",
             messages=[
+                {
+                    "role": "system",
+                    "content": f"You are an AI assistant. Here is your context:\n{context}\n\n{instructions}"
+                },
                 {
                     "role": "user",
-                    "content": "Please add 100 and 50 together."
+                    "content": prompt
                 }
             ],
+            temperature=0,
         )
 
-        ai_text = response.content[0].text
-        # Extract JSON from response
-        if "```" in ai_text:
-            start = ai_text.find("{")
-            end = ai_text.rfind("}") + 1
-            ai_text = ai_text[start:end]
-
-        action_calls = parse_ai_response(ai_text)
-        results = holon.dispatch_many(action_calls)
-
-        assert len(results) == 1
-        assert results[0] == 150  # 100 + 50
+        results = dispatch_ai_text(holon, response.choices[0].message.content)
 
-    def test_weather_lookup(self, client, holon):
-        """Test Claude can call get_weather action."""
-        context = serialize_for_ai(holon, format="json")
+        assert check(results), results
 
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1024,
-            system=f"You are an AI assistant. Here is your context:\n{context}\n\nRespond ONLY with valid JSON for action calls.",
-            messages=[
-                {
-                    "role": "user",
-                    "content": "What's the weather in Seattle?"
-                }
-            ],
-        )
 
-        ai_text = response.content[0].text
-        if "```" in ai_text:
-            start = ai_text.find("{")
-            end = ai_text.rfind("}") + 1
-            ai_text = ai_text[start:end]
+class TestAnthropicIntegration:
+    """Integration tests using Anthropic Claude API."""
 
-        action_calls = parse_ai_response(ai_text)
-        results = holon.dispatch_many(action_calls)
+    @pytest.fixture
+    def client(self, anthropic_client):
+        """Use the session Anthropic client."""
+        return anthropic_client
 
-        assert len(results) == 1
-        assert results[0]["city"] == "Seattle"
-        assert "temperature" in results[0]
+    @pytest.fixture
+    def holon(self):
+        """Create test Holon."""
+        return create_test_holon()
 
-    def test_greeting_action(self, client, holon):
-        """Test Claude can call greet_user action."""
+    @pytest.mark.parametrize("prompt,instructions,check", ANTHROPIC_CASES)
+    def test_anthropic_action(self, client, holon, prompt, instructions, check):
+        """Test Claude dispatches the expected action for each prompt."""
         context = serialize_for_ai(holon, format="json")
 
         response = client.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=1024,
-            system=f"You are an AI assistant. Here is your context:\n{context}\n\nRespond ONLY with valid JSON for action calls.",
+            system=f"You are an AI assistant. Here is your context:\n{context}\n\n{instructions}",
             messages=[
                 {
                     "role": "user",
-                    "content": "Please greet Bob casually."
+                    "content": prompt
                 }
             ],
         )
 
-        ai_text = response.content[0].text
-        if "```" in ai_text:
-            start = ai_text.find("{")
-            end = ai_text.rfind("}") + 1
-            ai_text = ai_text[start:end]
-
-        action_calls = parse_ai_response(ai_text)
-        results = holon.dispatch_many(action_calls)
+        results = dispatch_ai_text(holon, response.content[0].text)
 
-        assert len(results) == 1
-        assert "Bob" in results[0]
+        assert check(results), results
 
 
 class TestComplexIntegration:
     """Complex integration tests with either API."""
 
     @pytest.fixture
-    def ai_client(self):
+    def ai_client(self, request):
         """Get any available AI client."""
-        if OPENAI_AVAILABLE:
-            return ("openai", openai.OpenAI())
-        elif ANTHROPIC_AVAILABLE:
-            return ("anthropic", anthropic.Anthropic())
+        if openai_available():
+            return ("openai", request.getfixturevalue("openai_client"))
+        elif anthropic_available():
+            return ("anthropic", request.getfixturevalue("anthropic_client"))
         else:
             pytest.skip("No AI API available")
 
@@ -332,14 +294,14 @@ class TestComplexIntegration:
         )
 
         context = serialize_for_ai(holon, format="json")
-        data = json.loads(context)
+        data = _loads(context)
 
         # Check that the counter was called during serialization
         assert data["self"]["current_count"] == 1
 
         # Call again - should increment
         context2 = serialize_for_ai(holon, format="json")
-        data2 = json.loads(context2)
+        data2 = _loads(context2)
         assert data2["self"]["current_count"] == 2
 
     def test_token_aware_holon(self, ai_client):
@@ -376,7 +338,7 @@ class TestComplexIntegration:
         )
 
         context = serialize_for_ai(outer, format="json")
-        data = json.loads(context)
+        data = _loads(context)
 
         # Outer name should be present
         assert data["name"] == "OuterModule"
@@ -391,12 +353,12 @@ class TestErrorHandling:
     """Test error handling in AI integration."""
 
     @pytest.fixture
-    def ai_client(self):
+    def ai_client(self, request):
         """Get any available AI client."""
-        if OPENAI_AVAILABLE:
-            return ("openai", openai.OpenAI())
-        elif ANTHROPIC_AVAILABLE:
-            return ("anthropic", anthropic.Anthropic())
+        if openai_available():
+            return ("openai", request.getfixturevalue("openai_client"))
+        elif anthropic_available():
+            return ("anthropic", request.getfixturevalue("anthropic_client"))
         else:
             pytest.skip("No AI API available")
 
@@ -8,19 +8,32 @@ import attrs
 from holonic_engine import HolonAction, HolonBinding, HolonActions, HolonPurpose, HolonSelf
 
 
+class Person:
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+
+@attrs.define
+class Config:
+    host: str
+    port: int
+
+
 class TestHolonBinding:
     """Tests for HolonBinding class."""
 
-    def test_static_value_binding(self):
-        """Test binding to a static value."""
-        binding = HolonBinding(source="hello")
-        assert binding.resolve() == "hello"
-
-    def test_static_dict_binding(self):
-        """Test binding to a static dictionary."""
-        data = {"name": "Alice", "age": 30}
-        binding = HolonBinding(source=data)
-        assert binding.resolve() == data
+    @pytest.mark.parametrize("source,expected", [
+        pytest.param("hello", "hello", id="static_value"),
+        pytest.param({"name": "Alice", "age": 30}, {"name": "Alice", "age": 30}, id="static_dict"),
+        pytest.param([1, 2, 3], [1, 2, 3], id="list"),
+        pytest.param(lambda: {"timestamp": "now"}, {"timestamp": "now"}, id="lambda"),
+        pytest.param(Person("Bob", 25), {"name": "Bob", "age": 25}, id="class_instance"),
+        pytest.param(Config(host="localhost", port=8080), {"host": "localhost", "port": 8080}, id="attrs_class"),
+    ])
+    def test_binding_resolves(self, source, expected):
+        """Test each supported source type resolves to its serializable form."""
+        assert HolonBinding(source=source).resolve() == expected
 
     def test_function_binding(self):
         """Test binding to a function that is called on resolve."""
@@ -34,47 +47,67 @@ class TestHolonBinding:
         assert binding.resolve() == 1
         assert binding.resolve() == 2  # Called again, increments
 
-    def test_lambda_binding(self):
-        """Test binding to a lambda."""
-        binding = HolonBinding(source=lambda: {"timestamp": "now"})
-        result = binding.resolve()
-        assert result == {"timestamp": "now"}
-
     def test_keyed_binding(self):
         """Test binding with a key."""
         binding = HolonBinding(source={"x": 1}, key="data")
         assert binding.key == "data"
         assert binding.resolve() == {"x": 1}
 
-    def test_class_instance_binding(self):
-        """Test binding to a class instance uses __dict__."""
-        class Person:
-            def __init__(self, name, age):
-                self.name = name
-                self.age = age
-
-        person = Person("Bob", 25)
-        binding = HolonBinding(source=person)
-        result = binding.resolve()
-        assert result == {"name": "Bob", "age": 25}
-
-    def test_attrs_class_binding(self):
-        """Test binding to an attrs class."""
+    def test_nested_attrs_class_binding(self):
+        """Test nested attrs instances are unstructured recursively."""
         @attrs.define
-        class Config:
+        class Endpoint:
             host: str
             port: int
 
-        config = Config(host="localhost", port=8080)
-        binding = HolonBinding(source=config)
-        result = binding.resolve()
-        assert result == {"host": "localhost", "port": 8080}
+        @attrs.define
+        class Service:
+            name: str
+            endpoints: list
+
+        service = Service(name="api", endpoints=[Endpoint(host="a", port=1)])
+        binding = HolonBinding(source=service)
+        assert binding.resolve() == {
+            "name": "api",
+            "endpoints": [{"host": "a", "port": 1}],
+        }
+
+    def test_mutable_source_stays_live(self):
+        """Test later mutations of a static source are visible on resolve."""
+        data = {"count": 1}
+        binding = HolonBinding(source=data)
+        assert binding.resolve() == {"count": 1}
 
-    def test_list_binding(self):
-        """Test binding to a list."""
-        items = [1, 2, 3]
-        binding = HolonBinding(source=items)
-        assert binding.resolve() == [1, 2, 3]
+        data["count"] = 2
+        assert binding.resolve() == {"count": 2}
+
+    def test_replacing_source_reselects_resolver(self):
+        """Test assigning a new source picks a fresh resolution strategy."""
+        binding = HolonBinding(source="static")
+        assert binding.resolve() == "static"
+
+        binding.source = lambda: "dynamic"
+        assert binding.resolve() == "dynamic"
+
+    def test_attrs_source_honors_registered_unstructure_hook(self):
+        """Test attrs sources with a registered cattrs hook resolve through it."""
+        import cattrs
+
+        @attrs.define
+        class Money:
+            cents: int
+
+        @attrs.define
+        class Wallet:
+            balance: Money
+
+        cattrs.register_unstructure_hook(Money, lambda m: f"${m.cents / 100:.2f}")
+
+        assert HolonBinding(source=Money(1234)).resolve() == "$12.34"
+        assert HolonBinding(source=Wallet(Money(5))).resolve() == {"balance": "$0.05"}
+        assert HolonBinding(source=Config(host="localhost", port=80)).resolve() == {
+            "host": "localhost", "port": 80
+        }
 
 
 class TestHolonPurpose:
@@ -109,30 +142,30 @@ class TestHolonPurpose:
         assert result is purpose
         assert len(purpose) == 2
 
-    def test_keyed_items_serialize_as_dict(self):
-        """Test that all keyed items serialize as dict."""
+    @pytest.mark.parametrize("items,expected", [
+        pytest.param([], [], id="empty"),
+        pytest.param([("value1", "key1"), ("value2", "key2")], {"key1": "value1", "key2": "value2"}, id="keyed_as_dict"),
+        pytest.param([("item1", None), ("item2", None)], ["item1", "item2"], id="unkeyed_as_list"),
+        pytest.param(
+            [("unkeyed1", None), ("value1", "key1"), ("unkeyed2", None)],
+            ["unkeyed1", {"key1": "value1"}, "unkeyed2"],
+            id="mixed_as_list",
+        ),
+    ])
+    def test_serialize_shape(self, items, expected):
+        """Test serialize picks dict, list, or mixed list from the item keys."""
         purpose = HolonPurpose()
-        purpose.add("value1", key="key1")
-        purpose.add("value2", key="key2")
-        result = purpose.serialize()
-        assert result == {"key1": "value1", "key2": "value2"}
+        for value, key in items:
+            purpose.add(value, key=key)
+        assert purpose.serialize() == expected
 
-    def test_unkeyed_items_serialize_as_list(self):
-        """Test that unkeyed items serialize as list."""
-        purpose = HolonPurpose()
-        purpose.add("item1")
-        purpose.add("item2")
-        result = purpose.serialize()
-        assert result == ["item1", "item2"]
+    def test_items_passed_at_construction_set_shape(self):
+        """Test bindings given to the constructor count toward the serialize shape."""
+        purpose = HolonPurpose(items=[HolonBinding(source="value", key="key")])
+        assert purpose.serialize() == {"key": "value"}
 
-    def test_mixed_items_serialize_as_mixed_list(self):
-        """Test mixed keyed/unkeyed items."""
-        purpose = HolonPurpose()
-        purpose.add("unkeyed1")
-        purpose.add("value1", key="key1")
-        purpose.add("unkeyed2")
-        result = purpose.serialize()
-        assert result == ["unkeyed1", {"key1": "value1"}, "unkeyed2"]
+        purpose.add("unkeyed")
+        assert purpose.serialize() == [{"key": "value"}, "unkeyed"]
 
     def test_iteration(self):
         """Test iterating over purpose items."""
@@ -141,6 +174,56 @@ class TestHolonPurpose:
         items = list(purpose)
         assert items == ["a", "b", "c"]
 
+    def test_static_serialize_is_reused_and_isolated(self):
+        """Test literal-only purposes are cached, copied out, and refreshed on add."""
+        purpose = HolonPurpose()
+        purpose.add("Be helpful").add("concise", key="style")
+
+        first = purpose.serialize()
+        first[1]["style"] = "verbose"
+        first.append("mutated")
+        assert purpose.serialize() == ["Be helpful", {"style": "concise"}]
+
+        purpose.add("Be accurate")
+        assert purpose.serialize() == ["Be helpful", {"style": "concise"}, "Be accurate"]
+
+    def test_rebinding_refreshes_static_serialize(self):
+        """Test reassigning a binding's source or key refreshes the cached output and shape."""
+        binding = HolonBinding(source="a", key="k")
+        purpose = HolonPurpose(items=[binding])
+        assert purpose.serialize() == {"k": "a"}
+
+        binding.source = "changed"
+        assert purpose.serialize() == {"k": "changed"}
+        binding.key = "other"
+        assert purpose.serialize() == {"other": "changed"}
+        binding.key = None
+        assert purpose.serialize() == ["changed"]
+
+        values = iter([1, 2])
+        binding.source = lambda: next(values)
+        assert purpose.serialize() == [1]
+        assert purpose.serialize() == [2]
+
+    def test_iter_resolved_is_lazy(self):
+        """Test iter_resolved yields (key, value) pairs, resolving on demand."""
+        calls = []
+
+        def tracked(value):
+            def resolve():
+                calls.append(value)
+                return value
+            return resolve
+
+        purpose = HolonPurpose()
+        purpose.add(tracked("a")).add(tracked("b"), key="second")
+
+        pairs = purpose.iter_resolved()
+        assert calls == []
+        assert next(pairs) == (None, "a")
+        assert calls == ["a"]
+        assert list(pairs) == [("second", "b")]
+
     def test_function_binding_resolved(self):
         """Test that function bindings are resolved."""
         purpose = HolonPurpose()
@@ -193,6 +276,34 @@ class TestHolonSelf:
         assert "nested" in result
         assert "purpose" in result["nested"]
 
+    def test_shared_nested_holon_serialized_once(self):
+        """Test a Holon bound under two keys is resolved once per serialize."""
+        from holonic_engine import Holon
+
+        calls = {"count": 0}
+
+        def status():
+            calls["count"] += 1
+            return "active"
+
+        inner = Holon().add_self(status, key="status")
+
+        self_state = HolonSelf()
+        self_state.add(inner, key="primary")
+        self_state.add(inner, key="secondary")
+        result = self_state.serialize()
+
+        assert result["primary"] == result["secondary"] == {"self": {"status": "active"}}
+        assert calls["count"] == 1
+
+        # Each position gets its own containers
+        assert result["primary"] is not result["secondary"]
+        result["primary"]["self"]["status"] = "changed"
+        assert result["secondary"] == {"self": {"status": "active"}}
+
+        self_state.serialize()
+        assert calls["count"] == 2  # Memo is per call, not persistent
+
     def test_fluent_api(self):
         """Test fluent API chaining."""
         self_state = HolonSelf()
@@ -256,21 +367,23 @@ class TestHolonActions:
         action = actions.get("send_email")
         assert action.purpose == "Send an email notification"
 
-    def test_get_action(self):
-        """Test getting action by name."""
+    @pytest.mark.parametrize("name,present", [
+        ("my_action", True),
+        ("other", False),
+    ])
+    def test_lookup(self, name, present):
+        """Test get() and __contains__ agree on registered names."""
         def my_action():
             return "result"
 
         actions = HolonActions()
         actions.add(my_action, name="my_action")
-        action = actions.get("my_action")
-        assert action is not None
-        assert action.callback is my_action
-
-    def test_get_nonexistent_action(self):
-        """Test getting nonexistent action returns None."""
-        actions = HolonActions()
-        assert actions.get("nonexistent") is None
+        assert (name in actions) is present
+        action = actions.get(name)
+        if present:
+            assert action.callback is my_action
+        else:
+            assert action is None
 
     def test_execute_action(self):
         """Test executing an action by name."""
@@ -304,15 +417,22 @@ class TestHolonActions:
         assert "action1" in names
         assert "action2" in names
 
-    def test_contains(self):
-        """Test __contains__ method."""
-        def my_action():
+    def test_iteration_order_is_registration_order(self):
+        """Test actions iterate in registration order, with re-adds replacing in place."""
+        def first():
+            pass
+
+        def second():
+            pass
+
+        def replacement():
             pass
 
         actions = HolonActions()
-        actions.add(my_action, name="my_action")
-        assert "my_action" in actions
-        assert "other" not in actions
+        actions.add(first, name="a").add(second, name="b").add(replacement, name="a")
+
+        assert [a.name for a in actions] == ["a", "b"]
+        assert actions.get("a").callback is replacement
 
     def test_fluent_api(self):
         """Test fluent API chaining."""
@@ -326,3 +446,26 @@ class TestHolonActions:
         result = actions.add(a).add(b)
         assert result is actions
         assert len(actions) == 2
+
+    @pytest.mark.slow
+    def test_lookup_by_name_in_large_registry(self):
+        """Test name lookups stay keyed on the action name with many actions."""
+        def noop():
+            pass
+
+        actions = HolonActions()
+        for i in range(10_000):
+            actions.add(noop, name=f"action_{i}")
+
+        assert len(actions) == 10_000
+        assert "action_9999" in actions
+        assert actions.get("action_5000").name == "action_5000"
+        assert actions.get("action_10000") is None
+
+    def test_holon_action_is_slotted(self):
+        """Test HolonAction uses __slots__ rather than a per-instance __dict__."""
+        def noop():
+            pass
+
+        action = HolonAction(callback=noop, name="noop")
+        assert not hasattr(action, "__dict__")
@@ -2,8 +2,12 @@
 Tests for the Heartbeat and HolonicHeart classes.
 """
 
+import json
+import time
+from types import SimpleNamespace
+
 import pytest
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch, MagicMock
 
 from holonic_engine import (
@@ -12,6 +16,7 @@ from holonic_engine import (
     HolonicObjectHeartbeatRecord,
     HolonicHeart,
 )
+from holonic_engine import heart as heart_module
 
 
 class TestHeartbeat:
@@ -64,6 +69,35 @@ class TestHeartbeat:
         actions, hud = heartbeat.get_results(hobj)
         assert hud["self"]["knowledge"]["value"] == 1
 
+    def test_hud_sent_is_read_only(self):
+        """Test that the captured HUD can't be reassigned at the top level."""
+        heartbeat = Heartbeat(heartbeat_time=datetime.now(timezone.utc))
+        hobj = HolonicObject()
+        heartbeat.add_holonicobject(hobj)
+
+        _, hud = heartbeat.get_results(hobj)
+        with pytest.raises(TypeError):
+            hud["self"] = {}
+
+    def test_hud_sent_holds_json_types(self):
+        """Test the captured HUD is JSON-typed and only frozen at the top level."""
+        when = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        hobj = SimpleNamespace(
+            id="hobj-1",
+            next_heartbeat=when,
+            to_dict=lambda: {"when": when, "pair": (1, 2), "ids": {1: "a"}, "nested": {"x": [1]}},
+        )
+        heartbeat = Heartbeat(heartbeat_time=when)
+        heartbeat.add_holonicobject(hobj)
+
+        hud = heartbeat._records["hobj-1"].hud_sent
+        assert hud["when"] == when.isoformat()
+        assert hud["pair"] == [1, 2]
+        assert hud["ids"] == {"1": "a"}
+
+        hud["nested"]["x"].append(2)
+        assert hud["nested"]["x"] == [1, 2]
+
     def test_build_prompt(self):
         """Test building the prompt."""
         now = datetime.now(timezone.utc)
@@ -79,6 +113,58 @@ class TestHeartbeat:
         assert "Test Agent" in prompt
         assert heartbeat.full_prompt == prompt
 
+    def test_build_prompt_appends_holons_json(self):
+        """Test the prompt is the fixed instructions followed by the holons JSON."""
+        now = datetime.now(timezone.utc)
+        heartbeat = Heartbeat(heartbeat_time=now)
+        hobj = HolonicObject()
+        heartbeat._records[hobj.id] = HolonicObjectHeartbeatRecord(
+            hobj=hobj,
+            hud_sent={"purpose": {"role": "Test Agent"}},
+            scheduled_time=now,
+        )
+
+        prompt = heartbeat.build_prompt()
+        instructions, _, data = prompt.partition("HOLONS DATA:\n")
+
+        assert instructions.startswith("You are processing a heartbeat")
+        parsed = json.loads(data)
+        assert parsed["heartbeat_time"] == now.isoformat()
+        assert parsed["holons"][hobj.id]["purpose"] == {"role": "Test Agent"}
+        assert parsed["holons"][hobj.id]["_heartbeat_info"]["scheduled_time"] == now.isoformat()
+
+    def test_get_hud_json(self):
+        """Test the HUD JSON is produced on demand and reused afterwards."""
+        now = datetime.now(timezone.utc)
+        heartbeat = Heartbeat(heartbeat_time=now)
+        hobj = HolonicObject()
+        record = HolonicObjectHeartbeatRecord(hobj=hobj, hud_sent={"self": {"x": 1}}, scheduled_time=now)
+        heartbeat._records[hobj.id] = record
+
+        hud_json = heartbeat.get_hud_json(hobj)
+
+        assert json.loads(hud_json) == {"self": {"x": 1}}
+        assert record.hud_sent_json is hud_json
+        with pytest.raises(KeyError):
+            heartbeat.get_hud_json(HolonicObject())
+
+    def test_records_keyed_by_hobj_id(self):
+        """Test response distribution and lookups go through the id-keyed records."""
+        now = datetime.now(timezone.utc)
+        heartbeat = Heartbeat(heartbeat_time=now)
+        hobjs = [HolonicObject() for _ in range(3)]
+        for hobj in hobjs:
+            heartbeat._records[hobj.id] = HolonicObjectHeartbeatRecord(hobj=hobj, hud_sent={}, scheduled_time=now)
+
+        heartbeat.process_response(json.dumps({hobjs[1].id: {"actions": [{"action": "noop"}]}}))
+
+        assert heartbeat.get_results(hobjs[1])[0] == {"actions": [{"action": "noop"}]}
+        assert heartbeat.get_results(hobjs[0])[0] == {"actions": []}
+        assert heartbeat.get_holonicobjects() == hobjs
+        assert heartbeat.get_hobj_ids() == {h.id for h in hobjs}
+        with pytest.raises(KeyError):
+            heartbeat.get_results(HolonicObject())
+
     def test_process_response(self):
         """Test processing AI response."""
         heartbeat = Heartbeat(heartbeat_time=datetime.now(timezone.utc))
@@ -116,6 +202,31 @@ class TestHeartbeat:
         actions, hud = heartbeat.get_results(hobj)
         assert actions["actions"] == []
 
+    def test_process_response_dict(self, now_utc):
+        """Test distributing a pre-decoded response without parsing JSON."""
+        heartbeat = Heartbeat(heartbeat_time=now_utc)
+        hobj = HolonicObject()
+        heartbeat._records[hobj.id] = HolonicObjectHeartbeatRecord(hobj=hobj, hud_sent={}, scheduled_time=now_utc)
+        response = {hobj.id: {"actions": [{"action": "sleep", "params": {"seconds": 1}}]}}
+
+        heartbeat.process_response_dict(response)
+
+        assert heartbeat.get_results(hobj)[0] is response[hobj.id]
+        assert json.loads(heartbeat.raw_response) == response
+
+    @pytest.mark.parametrize("response", ["", "  \n"])
+    def test_process_response_blank(self, response):
+        """Test that a blank response gives every hobj empty actions without decoding."""
+        now = datetime.now(timezone.utc)
+        heartbeat = Heartbeat(heartbeat_time=now)
+        hobj = HolonicObject()
+        heartbeat._records[hobj.id] = HolonicObjectHeartbeatRecord(hobj=hobj, hud_sent={}, scheduled_time=now)
+
+        heartbeat.process_response(response)
+
+        assert heartbeat.raw_response == response
+        assert heartbeat.get_results(hobj)[0] == {"actions": []}
+
     def test_get_results_not_found(self):
         """Test getting results for hobj not in heartbeat."""
         heartbeat = Heartbeat(heartbeat_time=datetime.now(timezone.utc))
@@ -191,148 +302,155 @@ class TestHolonicObjectHeartbeatRecord:
         assert record.scheduled_time == scheduled_time
         assert len(record.actions_result["actions"]) == 1
 
+    def test_records_and_heartbeats_are_slotted(self):
+        """Test that history objects carry no per-instance __dict__."""
+        now = datetime.now(timezone.utc)
+        record = HolonicObjectHeartbeatRecord(hobj=HolonicObject(), hud_sent={}, scheduled_time=now)
+        heartbeat = Heartbeat(heartbeat_time=now)
+
+        for obj in (record, heartbeat):
+            assert not hasattr(obj, "__dict__")
+            with pytest.raises(AttributeError):
+                obj.unexpected = 1
+
 
 class TestHolonicHeart:
     """Tests for the HolonicHeart class."""
 
-    def test_create_heart(self):
+    def test_create_heart(self, fresh_root, stub_client):
         """Test creating a heart."""
-        root = HolonicObject()
-        client = Mock()
-
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
-        assert heart.root is root
-        assert heart.client is client
+        assert heart.root is fresh_root
+        assert heart.client is stub_client
         assert heart.interval == 1.0
-        assert heart.token_allocations == []
+        assert heart.token_allocations == ()
         assert heart.history == []
 
-    def test_token_allocations_init(self):
+    def test_token_allocations_init(self, fresh_root, stub_client):
         """Test initializing with token allocations."""
-        root = HolonicObject()
-        client = Mock()
-        child = root.create_child()
+        child = fresh_root.create_child()
 
         heart = HolonicHeart(
-            root=root,
-            client=client,
+            root=fresh_root,
+            client=stub_client,
             token_allocations=[(child, 10)]
         )
 
         assert len(heart.token_allocations) == 1
         assert heart.token_allocations[0] == (child, 10)
 
-    def test_add_token_allocation(self):
+    def test_add_token_allocation(self, fresh_root, stub_client):
         """Test adding token allocation."""
-        root = HolonicObject()
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
-        heart.add_token_allocation(root, 50)
+        heart.add_token_allocation(fresh_root, 50)
 
         assert len(heart.token_allocations) == 1
-        assert heart.token_allocations[0] == (root, 50)
+        assert heart.token_allocations[0] == (fresh_root, 50)
+
+    def test_add_token_allocation_accumulates(self, fresh_root, stub_client):
+        """Test adding twice for the same hobj sums into one allocation."""
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
+
+        heart.add_token_allocation(fresh_root, 50)
+        heart.add_token_allocation(fresh_root, 25)
 
-    def test_remove_token_allocation(self):
+        assert heart.token_allocations == ((fresh_root, 75),)
+
+    def test_token_allocations_is_read_only(self, fresh_root, stub_client):
+        """Test the token_allocations view cannot be mutated in place."""
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
+        heart.add_token_allocation(fresh_root, 50)
+
+        with pytest.raises(AttributeError):
+            heart.token_allocations.append((fresh_root, 10))
+
+        assert heart.token_allocations == ((fresh_root, 50),)
+
+    def test_remove_token_allocation(self, fresh_root, stub_client):
         """Test removing token allocation."""
-        root = HolonicObject()
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
-        heart.add_token_allocation(root, 50)
-        result = heart.remove_token_allocation(root)
+        heart.add_token_allocation(fresh_root, 50)
+        result = heart.remove_token_allocation(fresh_root)
 
         assert result is True
         assert len(heart.token_allocations) == 0
 
-    def test_remove_token_allocation_not_found(self):
+    def test_remove_token_allocation_not_found(self, fresh_root, stub_client):
         """Test removing non-existent allocation."""
-        root = HolonicObject()
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
-        result = heart.remove_token_allocation(root)
+        result = heart.remove_token_allocation(fresh_root)
 
         assert result is False
 
-    def test_set_token_allocation(self):
+    def test_set_token_allocation(self, fresh_root, stub_client):
         """Test setting token allocation (replaces existing)."""
-        root = HolonicObject()
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
-        heart.add_token_allocation(root, 50)
-        heart.set_token_allocation(root, 100)
+        heart.add_token_allocation(fresh_root, 50)
+        heart.set_token_allocation(fresh_root, 100)
 
         assert len(heart.token_allocations) == 1
-        assert heart.token_allocations[0] == (root, 100)
+        assert heart.token_allocations[0] == (fresh_root, 100)
 
-    def test_beat_allocates_tokens(self):
+    def test_beat_allocates_tokens(self, fresh_root, stub_client, future):
         """Test that beat allocates tokens."""
-        root = HolonicObject()
-        root.token_bank = 0
-        root.next_heartbeat = datetime.now(timezone.utc) + timedelta(hours=1)  # Not due
+        fresh_root.token_bank = 0
+        fresh_root.next_heartbeat = future  # Not due
 
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
-        heart.add_token_allocation(root, 25)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
+        heart.add_token_allocation(fresh_root, 25)
 
         heart.beat()
 
-        assert root.token_bank == 25
+        assert fresh_root.token_bank == 25
 
-    def test_beat_allocates_to_frozen(self):
+    def test_beat_allocates_to_frozen(self, fresh_root, stub_client, future):
         """Test that beat allocates tokens even to frozen hobjs."""
-        root = HolonicObject()
-        root.token_bank = -100
-        root.next_heartbeat = datetime.now(timezone.utc) + timedelta(hours=1)  # Not due
+        fresh_root.token_bank = -100
+        fresh_root.next_heartbeat = future  # Not due
 
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
-        heart.add_token_allocation(root, 10)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
+        heart.add_token_allocation(fresh_root, 10)
 
         heart.beat()
 
-        assert root.token_bank == -90
+        assert fresh_root.token_bank == -90
 
-    def test_beat_skips_frozen_hobjs(self):
+    def test_beat_skips_frozen_hobjs(self, fresh_root, stub_client, past_due):
         """Test that beat skips frozen hobjs for processing."""
-        root = HolonicObject()
-        root.token_bank = -1
-        root.next_heartbeat = datetime.now(timezone.utc) - timedelta(seconds=1)  # Due
+        fresh_root.token_bank = -1
+        fresh_root.next_heartbeat = past_due  # Due
 
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
         result = heart.beat()
 
         assert result is None
-        client.chat.completions.create.assert_not_called()
+        assert stub_client.calls == 0
 
-    def test_beat_returns_none_when_no_due(self):
+    def test_beat_returns_none_when_no_due(self, fresh_root, stub_client, future):
         """Test that beat returns None when no hobjs are due."""
-        root = HolonicObject()
-        root.next_heartbeat = datetime.now(timezone.utc) + timedelta(hours=1)
+        fresh_root.next_heartbeat = future
 
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
         result = heart.beat()
 
         assert result is None
 
     @patch('holonic_engine.heart.call_ai')
-    def test_beat_processes_due_hobjs(self, mock_call_ai):
+    def test_beat_processes_due_hobjs(self, mock_call_ai, fresh_root, stub_client, past_due):
         """Test that beat processes due hobjs."""
-        root = HolonicObject()
-        root.token_bank = 100
-        root.next_heartbeat = datetime.now(timezone.utc) - timedelta(seconds=1)
+        fresh_root.token_bank = 100
+        fresh_root.next_heartbeat = past_due
 
-        mock_call_ai.return_value = f'{{"{root.id}": {{"actions": []}}}}'
+        mock_call_ai.return_value = f'{{"{fresh_root.id}": {{"actions": []}}}}'
 
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
         result = heart.beat()
 
@@ -341,67 +459,118 @@ class TestHolonicHeart:
         mock_call_ai.assert_called_once()
 
     @patch('holonic_engine.heart.call_ai')
-    def test_beat_stores_in_history(self, mock_call_ai):
+    def test_beat_stores_in_history(self, mock_call_ai, fresh_root, stub_client, past_due):
         """Test that beat stores heartbeat in history."""
-        root = HolonicObject()
-        root.token_bank = 100
-        root.next_heartbeat = datetime.now(timezone.utc) - timedelta(seconds=1)
+        fresh_root.token_bank = 100
+        fresh_root.next_heartbeat = past_due
 
-        mock_call_ai.return_value = f'{{"{root.id}": {{"actions": []}}}}'
+        mock_call_ai.return_value = f'{{"{fresh_root.id}": {{"actions": []}}}}'
 
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
         heart.beat()
 
         assert len(heart.history) == 1
 
     @patch('holonic_engine.heart.call_ai')
-    def test_beat_dispatches_actions(self, mock_call_ai):
+    def test_beat_dispatches_actions(self, mock_call_ai, fresh_root, stub_client, past_due):
         """Test that beat dispatches actions to hobjs."""
-        root = HolonicObject()
-        root.token_bank = 100
-        root.next_heartbeat = datetime.now(timezone.utc) - timedelta(seconds=1)
+        fresh_root.token_bank = 100
+        fresh_root.next_heartbeat = past_due
 
-        mock_call_ai.return_value = f'{{"{root.id}": {{"actions": [{{"action": "knowledge_set", "params": {{"path": "test", "value": 42}}}}]}}}}'
+        mock_call_ai.return_value = f'{{"{fresh_root.id}": {{"actions": [{{"action": "knowledge_set", "params": {{"path": "test", "value": 42}}}}]}}}}'
 
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
         heart.beat()
 
-        assert root.knowledge_get("test") == 42
+        assert fresh_root.knowledge_get("test") == 42
 
-    def test_on_heartbeat_callback(self):
+    def test_on_heartbeat_callback(self, fresh_root, stub_client):
         """Test registering heartbeat callback."""
-        root = HolonicObject()
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
         callback = Mock()
         heart.on_heartbeat(callback)
 
         assert heart._on_heartbeat is callback
 
+    def test_on_heartbeat_reregistration(self, fresh_root, stub_client):
+        """Test swapping callbacks through the unsubscribe handle and remove_heartbeat_callback."""
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
+        old, new, extra = Mock(), Mock(), Mock()
+
+        unsubscribe = heart.on_heartbeat(old)
+        assert unsubscribe() is True
+        heart.on_heartbeat(new)
+        assert heart._heartbeat_callbacks == (new,)
+        assert heart._on_heartbeat is new
+
+        heart.on_heartbeat(extra)
+        assert heart.remove_heartbeat_callback(extra) is True
+        assert heart.remove_heartbeat_callback(extra) is False
+        assert heart._heartbeat_callbacks == (new,)
+        assert heart._on_heartbeat is new
+
+        assert heart.remove_heartbeat_callback(new) is True
+        assert heart._on_heartbeat is None
+
+    def test_persist_writes_history(self, fresh_root, stub_client, tmp_path):
+        """Test that persist writes the heartbeat history as a JSON list."""
+        now = datetime.now(timezone.utc)
+        heartbeat = Heartbeat(heartbeat_time=now)
+        heartbeat._records[fresh_root.id] = HolonicObjectHeartbeatRecord(
+            hobj=fresh_root, hud_sent={"self": {"x": 1}}, scheduled_time=now
+        )
+        heartbeat.process_response(json.dumps({fresh_root.id: {"actions": []}}))
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
+        heart._history.append(heartbeat)
+
+        path = tmp_path / "history.json"
+        heart.persist(path)
+
+        saved = json.loads(path.read_text())
+        assert len(saved) == 1
+        assert saved[0]["heartbeat_time"] == now.isoformat()
+        assert saved[0]["hobjs"] == [{
+            "hobj_id": fresh_root.id,
+            "scheduled_time": now.isoformat(),
+            "hud_sent": {"self": {"x": 1}},
+            "actions_result": {"actions": []},
+        }]
+
+    def test_on_heartbeat_fans_out(self, fresh_root, stub_client):
+        """Test that every registered callback receives each non-empty heartbeat."""
+        first, second = Mock(), Mock()
+        heart = HolonicHeart(root=fresh_root, client=stub_client, interval=0.01, on_heartbeat=first)
+        heart.on_heartbeat(second)
+        heartbeat = Mock(__len__=lambda self: 1)
+
+        with patch.object(HolonicHeart, "beat", lambda self: heartbeat):
+            heart.start()
+            time.sleep(0.05)
+            heart.stop()
+
+        first.assert_called_with(heartbeat)
+        second.assert_called_with(heartbeat)
+
     @patch('holonic_engine.heart.call_ai')
-    def test_beat_with_children(self, mock_call_ai):
+    def test_beat_with_children(self, mock_call_ai, fresh_root, stub_client, past_due):
         """Test beat with parent and children."""
-        root = HolonicObject()
-        root.token_bank = 100
-        root.next_heartbeat = datetime.now(timezone.utc) - timedelta(seconds=1)
+        fresh_root.token_bank = 100
+        fresh_root.next_heartbeat = past_due
 
-        child1 = root.create_child()
+        child1 = fresh_root.create_child()
         child1.token_bank = 50
-        child1.next_heartbeat = datetime.now(timezone.utc) - timedelta(seconds=1)
+        child1.next_heartbeat = past_due
 
-        child2 = root.create_child()
+        child2 = fresh_root.create_child()
         child2.token_bank = -10  # Frozen
-        child2.next_heartbeat = datetime.now(timezone.utc) - timedelta(seconds=1)
+        child2.next_heartbeat = past_due
 
-        mock_call_ai.return_value = f'{{"{root.id}": {{"actions": []}}, "{child1.id}": {{"actions": []}}}}'
+        mock_call_ai.return_value = f'{{"{fresh_root.id}": {{"actions": []}}, "{child1.id}": {{"actions": []}}}}'
 
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
         result = heart.beat()
 
@@ -413,11 +582,9 @@ class TestHolonicHeart:
 class TestHeartStartStop:
     """Tests for heart start/stop functionality."""
 
-    def test_start_creates_thread(self):
+    def test_start_creates_thread(self, fresh_root, stub_client):
         """Test that start creates a background thread."""
-        root = HolonicObject()
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
         heart.start()
 
@@ -427,22 +594,62 @@ class TestHeartStartStop:
 
         heart.stop()
 
-    def test_stop_stops_thread(self):
+    def test_stop_stops_thread(self, fresh_root, stub_client):
         """Test that stop stops the background thread."""
-        root = HolonicObject()
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
         heart.start()
         heart.stop()
 
         assert heart._running is False
 
-    def test_start_idempotent(self):
+    @pytest.mark.parametrize("beat_duration, expected_waits", [
+        (0.05, [0.05] * 4),  # waits out the rest of each slot
+        (0.15, []),  # overrunning beats restart the schedule, no catch-up wait
+    ])
+    def test_loop_keeps_fixed_rate(self, fresh_root, stub_client, monkeypatch, beat_duration, expected_waits):
+        """Test slow beats don't stretch the interval between beat starts."""
+        heart = HolonicHeart(root=fresh_root, client=stub_client, interval=0.1)
+        clock = [0.0]
+        starts, waits = [], []
+
+        def beat(self):
+            starts.append(clock[0])
+            clock[0] += beat_duration
+            if len(starts) == 4:
+                heart._running = False
+            return None
+
+        class FakeEvent:
+            def wait(self, timeout):
+                waits.append(round(timeout, 9))
+                clock[0] += timeout
+                return False
+
+        monkeypatch.setattr(heart_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+        monkeypatch.setattr(HolonicHeart, "beat", beat)
+        heart._stop_event = FakeEvent()
+        heart._running = True
+        heart._run_loop()
+
+        gaps = [round(b - a, 9) for a, b in zip(starts, starts[1:])]
+        assert gaps == [max(0.1, beat_duration)] * 3
+        assert waits == expected_waits
+
+    def test_stop_wakes_sleeping_loop(self, fresh_root, stub_client):
+        """Test that stop returns promptly even with a long interval."""
+        heart = HolonicHeart(root=fresh_root, client=stub_client, interval=30.0)
+        heart.start()
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        heart.stop()
+        assert time.monotonic() - started < 1.0
+        assert heart._thread is None
+
+    def test_start_idempotent(self, fresh_root, stub_client):
         """Test that calling start twice doesn't create multiple threads."""
-        root = HolonicObject()
-        client = Mock()
-        heart = HolonicHeart(root=root, client=client)
+        heart = HolonicHeart(root=fresh_root, client=stub_client)
 
         heart.start()
         thread1 = heart._thread
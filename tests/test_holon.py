@@ -3,10 +3,38 @@ Tests for the core Holon class.
 """
 
 import json
+import threading
+from functools import reduce
+from operator import getitem
 
 import pytest
 
-from holonic_engine import Holon
+from holonic_engine import Holon, serialization
+
+
+def _double(x: int) -> int:
+    return x * 2
+
+
+def _noop():
+    pass
+
+
+def _send_email(to: str) -> bool:
+    return True
+
+
+def _get_user():
+    return {"id": 1}
+
+
+def _get_data():
+    return {"value": 42}
+
+
+def _describe(x: int) -> str:
+    """Do something."""
+    return str(x)
 
 
 class TestHolonCreation:
@@ -23,28 +51,29 @@ class TestHolonCreation:
 class TestHolonFluentAPI:
     """Tests for the fluent builder API."""
 
-    def test_add_purpose(self):
-        """Test adding purpose items."""
+    @pytest.mark.parametrize("method,args", [
+        ("add_purpose", ("Be helpful",)),
+        ("add_self", ({"x": 1},)),
+        ("add_action", (_noop,)),
+    ])
+    def test_fluent_returns_self(self, method, args):
+        """Test that each add_* method returns the holon for chaining."""
         holon = Holon()
-        result = holon.add_purpose("Be helpful")
-        assert result is holon  # Returns self for chaining
-        assert len(holon.purpose) == 1
-
-    def test_add_purpose_chain(self):
-        """Test chaining multiple purpose additions."""
-        holon = (
-            Holon()
-            .add_purpose("First")
-            .add_purpose("Second")
-            .add_purpose("Third")
-        )
-        assert len(holon.purpose) == 3
-
-    def test_add_purpose_with_key(self):
-        """Test adding keyed purpose item."""
-        holon = Holon().add_purpose("value", key="mykey")
-        serialized = holon.purpose.serialize()
-        assert serialized == {"mykey": "value"}
+        assert getattr(holon, method)(*args) is holon
+
+    @pytest.mark.parametrize("items,expected_len,key", [
+        (["Be helpful"], 1, None),
+        (["First", "Second", "Third"], 3, None),
+        (["value"], 1, "mykey"),
+    ])
+    def test_add_purpose(self, items, expected_len, key):
+        """Test adding plain and keyed purpose items."""
+        holon = Holon()
+        for item in items:
+            holon.add_purpose(item, key=key)
+        assert len(holon.purpose) == expected_len
+        if key is not None:
+            assert holon.purpose.serialize() == {key: items[-1]}
 
     def test_add_self(self):
         """Test adding self state items."""
@@ -54,54 +83,36 @@ class TestHolonFluentAPI:
 
     def test_add_self_with_function(self):
         """Test adding function to self state."""
-        def get_data():
-            return {"value": 42}
-
-        holon = Holon().add_self(get_data, key="dynamic")
+        holon = Holon().add_self(_get_data, key="dynamic")
         serialized = holon.self_state.serialize()
         assert serialized == {"dynamic": {"value": 42}}
 
     def test_add_action(self):
         """Test adding an action."""
-        def my_action(x: int) -> int:
-            return x * 2
-
-        holon = Holon().add_action(my_action, name="my_action")
+        holon = Holon().add_action(_double, name="my_action")
         assert len(holon.actions) == 1
         assert "my_action" in holon.actions
 
     def test_add_action_with_name(self):
         """Test adding action with custom name."""
-        def internal_func():
-            pass
-
-        holon = Holon().add_action(internal_func, name="public_name")
+        holon = Holon().add_action(_noop, name="public_name")
         assert "public_name" in holon.actions
 
     def test_add_action_with_purpose(self):
         """Test adding action with purpose description."""
-        def send_email(to: str) -> bool:
-            return True
-
-        holon = Holon().add_action(send_email, name="send_email", purpose="Send an email")
+        holon = Holon().add_action(_send_email, name="send_email", purpose="Send an email")
         action = holon.actions.get("send_email")
         assert action.purpose == "Send an email"
 
     def test_full_fluent_chain(self):
         """Test complete fluent API chain."""
-        def get_user():
-            return {"id": 1}
-
-        def perform_action(x: int) -> str:
-            return f"Result: {x}"
-
         holon = (
             Holon()
             .add_purpose("Main purpose")
             .add_purpose("Secondary purpose")
-            .add_self(get_user, key="user")
+            .add_self(_get_user, key="user")
             .add_self({"setting": True}, key="config")
-            .add_action(perform_action, purpose="Do something")
+            .add_action(_describe, purpose="Do something")
         )
 
         assert len(holon.purpose) == 2
@@ -112,31 +123,18 @@ class TestHolonFluentAPI:
 class TestHolonSerialization:
     """Tests for Holon serialization."""
 
-    def test_to_dict_empty(self):
-        """Test serializing empty Holon."""
-        holon = Holon()
-        result = holon.to_dict()
-        assert result == {}
-
-    def test_to_dict_with_purpose(self):
-        """Test serializing Holon with purpose."""
-        holon = Holon().add_purpose("Be helpful")
-        result = holon.to_dict()
-        assert result["purpose"] == ["Be helpful"]
-
-    def test_to_dict_with_self(self):
-        """Test serializing Holon with self state."""
-        holon = Holon().add_self({"value": 42}, key="data")
-        result = holon.to_dict()
-        assert result["self"] == {"data": {"value": 42}}
+    @pytest.mark.parametrize("build,expected", [
+        (lambda h: h, {}),
+        (lambda h: h.add_purpose("Be helpful"), {"purpose": ["Be helpful"]}),
+        (lambda h: h.add_self({"value": 42}, key="data"), {"self": {"data": {"value": 42}}}),
+    ], ids=["empty", "purpose", "self"])
+    def test_to_dict(self, build, expected):
+        """Test serializing a Holon with purpose or self items."""
+        assert build(Holon()).to_dict() == expected
 
     def test_to_dict_with_actions(self):
         """Test serializing Holon with actions."""
-        def my_action(x: int) -> str:
-            """Do something."""
-            return str(x)
-
-        holon = Holon().add_action(my_action, name="my_action", purpose="Test action")
+        holon = Holon().add_action(_describe, name="my_action", purpose="Test action")
         result = holon.to_dict()
         assert "actions" in result
         assert len(result["actions"]) == 1
@@ -150,46 +148,66 @@ class TestHolonSerialization:
         data = json.loads(json_str)
         assert data["purpose"] == ["Purpose"]
 
+    @pytest.mark.parametrize("orjson_available", [True, False], ids=["orjson", "stdlib"])
+    def test_to_json_format(self, monkeypatch, orjson_available):
+        """Test to_json output is compact and unescaped with or without orjson."""
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", orjson_available and serialization.ORJSON_AVAILABLE)
+        holon = Holon().add_purpose("Café").add_self(1, key="n")
+        assert holon.to_json() == '{"purpose":["Café"],"self":{"n":1}}'
+        assert holon.to_json(indent=2) == '{\n  "purpose": [\n    "Café"\n  ],\n  "self": {\n    "n": 1\n  }\n}'
+        assert holon.to_json(ensure_ascii=True) == '{"purpose":["Caf\\u00e9"],"self":{"n":1}}'
+
     def test_to_json_with_indent(self):
         """Test JSON serialization with indent."""
         holon = Holon().add_purpose("Test")
         json_str = holon.to_json(indent=2)
         assert "\n" in json_str  # Indented has newlines
 
+    def test_to_json_passes_json_options(self):
+        """Test json.dumps options such as sort_keys are honored."""
+        holon = Holon().add_self("b", key="zeta").add_self("a", key="alpha")
+        json_str = holon.to_json(sort_keys=True)
+        assert json_str.index('"alpha"') < json_str.index('"zeta"')
+
 
 class TestHolonDispatch:
     """Tests for Holon action dispatch."""
 
-    def test_dispatch_simple(self):
-        """Test dispatching a simple action."""
-        def add(a: int, b: int) -> int:
-            return a + b
-
-        holon = Holon().add_action(add, name="add")
-        result = holon.dispatch("add", a=5, b=3)
-        assert result == 8
-
-    def test_dispatch_with_defaults(self):
-        """Test dispatching action with defaults."""
-        def greet(user_name: str, greeting: str = "Hello") -> str:
-            return f"{greeting}, {user_name}!"
-
-        holon = Holon().add_action(greet, name="greet")
-        result = holon.dispatch("greet", user_name="Alice")
-        assert result == "Hello, Alice!"
-
-    def test_dispatch_nonexistent_action(self):
+    @pytest.mark.parametrize("action,params,expected", [
+        ("add", {"a": 5, "b": 3}, 8),
+        ("multiply", {"x": 4, "y": 5}, 20),
+        ("greet", {"user_name": "Alice"}, "Hello, Alice!"),
+        ("greet", {"user_name": "Bob", "greeting": "Hi"}, "Hi, Bob!"),
+    ])
+    def test_dispatch(self, arith_holon, action, params, expected):
+        """Test dispatching actions, with and without defaulted parameters."""
+        assert arith_holon.dispatch(action, **params) == expected
+
+    def test_dispatch_nonexistent_action(self, empty_holon):
         """Test dispatching nonexistent action."""
-        holon = Holon()
         with pytest.raises(KeyError):
-            holon.dispatch("nonexistent")
+            empty_holon.dispatch("nonexistent")
 
-    def test_dispatch_many(self):
+    def test_dispatch_many(self, arith_holon):
         """Test dispatching multiple actions."""
+        calls = [
+            {"action": "add", "params": {"a": 2, "b": 3}},
+            {"action": "multiply", "params": {"x": 4, "y": 5}},
+        ]
+        results = arith_holon.dispatch_many(calls)
+        assert results == [5, 20]
+
+    def test_dispatch_many_parallel(self):
+        """Test parallel dispatch overlaps calls and keeps result order."""
+        # Each call waits for the other, so a serial run breaks the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
         def add(a: int, b: int) -> int:
+            barrier.wait()
             return a + b
 
         def multiply(x: int, y: int) -> int:
+            barrier.wait()
             return x * y
 
         holon = Holon().add_action(add, name="add").add_action(multiply, name="multiply")
@@ -197,13 +215,43 @@ class TestHolonDispatch:
             {"action": "add", "params": {"a": 2, "b": 3}},
             {"action": "multiply", "params": {"x": 4, "y": 5}},
         ]
-        results = holon.dispatch_many(calls)
-        assert results == [5, 20]
 
-    def test_dispatch_many_empty(self):
+        assert holon.dispatch_many(calls, parallel=True) == [5, 20]
+
+    def test_dispatch_many_parallel_raises_after_all_calls(self):
+        """Test a failing call in parallel mode re-raises without cancelling others."""
+        ran = []
+
+        def ok() -> str:
+            ran.append("ok")
+            return "ok"
+
+        holon = Holon().add_action(ok, name="ok")
+        calls = [{"action": "missing"}, {"action": "ok"}]
+
+        with pytest.raises(KeyError, match="Action not found"):
+            holon.dispatch_many(calls, parallel=True)
+        assert ran == ["ok"]
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_dispatch_many_uses_dispatch_override(self, parallel):
+        """Test a subclass's dispatch override runs on both the serial and parallel paths."""
+        seen = []
+
+        class LoggingHolon(Holon):
+            def dispatch(self, action_name, **kwargs):
+                seen.append(action_name)
+                return super().dispatch(action_name, **kwargs)
+
+        holon = LoggingHolon().add_action(_double, name="double")
+        calls = [{"action": "double", "params": {"x": 1}}, {"action": "double", "params": {"x": 2}}]
+
+        assert holon.dispatch_many(calls, parallel=parallel) == [2, 4]
+        assert seen == ["double", "double"]
+
+    def test_dispatch_many_empty(self, empty_holon):
         """Test dispatching empty list."""
-        holon = Holon()
-        results = holon.dispatch_many([])
+        results = empty_holon.dispatch_many([])
         assert results == []
 
 
@@ -220,11 +268,12 @@ class TestNestedHolons:
         assert "nested" in result["self"]
         assert result["self"]["nested"]["purpose"] == ["Inner purpose"]
 
-    def test_deeply_nested_holons(self):
+    @pytest.mark.parametrize("depth", [1, 2, 8])
+    def test_deeply_nested_holons(self, depth):
         """Test deeply nested Holon structures."""
-        level3 = Holon().add_purpose("Deepest")
-        level2 = Holon().add_self(level3, key="child")
-        level1 = Holon().add_self(level2, key="child")
+        holon = Holon().add_purpose("Deepest")
+        for _ in range(depth):
+            holon = Holon().add_self(holon, key="child")
 
-        result = level1.to_dict()
-        assert result["self"]["child"]["self"]["child"]["purpose"] == ["Deepest"]
+        path = ["self", "child"] * depth + ["purpose"]
+        assert reduce(getitem, path, holon.to_dict()) == ["Deepest"]
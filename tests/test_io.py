@@ -0,0 +1,33 @@
+"""
+Tests for file I/O helpers.
+"""
+
+import os
+
+import pytest
+
+from holonic_engine._io import atomic_write
+
+
+class TestAtomicWrite:
+    """Tests for atomic_write."""
+
+    def test_writes_and_replaces(self, tmp_path):
+        """Test that the target ends up with exactly the new bytes."""
+        target = tmp_path / "history.json"
+        atomic_write(target, b"first")
+        atomic_write(target, b"second")
+
+        assert target.read_bytes() == b"second"
+        assert os.listdir(tmp_path) == ["history.json"]
+
+    def test_failed_write_keeps_original(self, tmp_path):
+        """Test that a failed write leaves the old file and no temp file behind."""
+        target = tmp_path / "history.json"
+        target.write_bytes(b"original")
+
+        with pytest.raises(TypeError):
+            atomic_write(target, "not bytes")
+
+        assert target.read_bytes() == b"original"
+        assert os.listdir(tmp_path) == ["history.json"]
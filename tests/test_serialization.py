@@ -3,6 +3,7 @@ Tests for serialization utilities and HolonConverter.
 """
 
 import json
+import re
 
 import pytest
 
@@ -14,6 +15,71 @@ from holonic_engine import (
     parse_ai_response,
     estimate_token_savings,
 )
+from holonic_engine.serialization import TOON_AVAILABLE, _dumps, _loads, toon
+
+
+_UNKNOWN_FORMAT_RE = re.compile(r"Unknown format")
+_INVALID_FORMAT_RE = re.compile(r"Invalid AI response format")
+
+_MULTI_ACTIONS_JSON = '{"actions": [{"action": "action1", "params": {"a": 1}}, {"action": "action2", "params": {"b": 2}}]}'
+
+
+def _my_func(x: int, y: str = "default") -> bool:
+    """My function."""
+    return True
+
+
+def _documented_func(x: int) -> str:
+    """This is the docstring."""
+    return str(x)
+
+
+def _typed_func(x: int) -> list[str]:
+    return []
+
+
+@pytest.fixture(scope="session")
+def _logger_state():
+    """
+    Build the log/status workflow holon once per session (per worker under xdist).
+
+    Its actions write to whichever list is currently in sink[0], so each
+    test can point the shared holon at its own log.
+    """
+    sink = [[]]
+
+    def log_message(message: str, level: str = "info") -> dict:
+        """Log a message."""
+        entry = {"message": message, "level": level}
+        sink[0].append(entry)
+        return entry
+
+    def get_status() -> dict:
+        """Get system status."""
+        return {"status": "ok", "logs": len(sink[0])}
+
+    holon = (
+        Holon()
+        .add_purpose("Log messages and track status")
+        .add_self(lambda: {"log_count": len(sink[0])}, key="state")
+        .add_action(log_message, name="log_message", purpose="Log a message")
+        .add_action(get_status, name="get_status", purpose="Get current status")
+    )
+    return holon, sink
+
+
+@pytest.fixture
+def logs():
+    """A fresh log list for one test."""
+    return []
+
+
+@pytest.fixture
+def logger_holon(_logger_state, logs):
+    """The shared workflow holon, writing to this test's own log."""
+    holon, sink = _logger_state
+    sink[0] = logs
+    return holon
 
 
 class TestHolonConverter:
@@ -23,19 +89,14 @@ class TestHolonConverter:
         """Test that holon_converter is a usable instance."""
         assert isinstance(holon_converter, HolonConverter)
 
-    def test_unstructure_holon_empty(self):
+    def test_unstructure_holon_empty(self, empty_holon):
         """Test unstructuring empty Holon."""
-        holon = Holon()
-        result = holon_converter.unstructure_holon(holon)
+        result = holon_converter.unstructure_holon(empty_holon)
         assert result == {}
 
     def test_unstructure_action_parameter(self):
         """Test unstructuring action parameters."""
-        def my_func(x: int, y: str = "default") -> bool:
-            """My function."""
-            return True
-
-        holon = Holon().add_action(my_func)
+        holon = Holon().add_action(_my_func)
         result = holon_converter.unstructure_holon(holon)
 
         action = result["actions"][0]
@@ -47,23 +108,30 @@ class TestHolonConverter:
 
     def test_unstructure_action_with_docstring(self):
         """Test that docstrings are included."""
-        def documented_func(x: int) -> str:
-            """This is the docstring."""
-            return str(x)
-
-        holon = Holon().add_action(documented_func)
+        holon = Holon().add_action(_documented_func)
         result = holon_converter.unstructure_holon(holon)
         assert result["actions"][0]["docstring"] == "This is the docstring."
 
     def test_unstructure_action_with_return_type(self):
         """Test that return types are included."""
-        def typed_func(x: int) -> list[str]:
-            return []
-
-        holon = Holon().add_action(typed_func)
+        holon = Holon().add_action(_typed_func)
         result = holon_converter.unstructure_holon(holon)
         assert "returns" in result["actions"][0]
 
+    def test_unstructure_action_reuses_cached_signature(self):
+        """Test repeated unstructuring reuses the signature view without sharing output."""
+        holon = Holon().add_action(_my_func)
+        first = holon_converter.unstructure_holon(holon)
+        first["actions"][0]["parameters"][0]["name"] = "mutated"
+
+        second = holon_converter.unstructure_holon(holon)
+        assert second["actions"][0]["parameters"][0] == {"name": "x", "type": "int"}
+
+        action = next(iter(holon.actions))
+        action.signature.docstring = "Replaced."
+        third = holon_converter.unstructure_holon(holon)
+        assert third["actions"][0]["docstring"] == "Replaced."
+
     def test_unstructure_purpose_as_list(self):
         """Test purpose serializes as list when unkeyed."""
         holon = Holon().add_purpose("First").add_purpose("Second")
@@ -107,82 +175,80 @@ class TestSerializeForAI:
         # Result should be a non-empty string
         assert len(result) > 0
 
-    def test_serialize_unknown_format(self):
+    def test_serialize_unknown_format(self, empty_holon):
         """Test that unknown format raises error."""
-        holon = Holon()
-        with pytest.raises(ValueError, match="Unknown format"):
-            serialize_for_ai(holon, format="xml")
+        with pytest.raises(ValueError, match=_UNKNOWN_FORMAT_RE):
+            serialize_for_ai(empty_holon, format="xml")
 
-    def test_serialize_default_format(self):
+    def test_serialize_default_format(self, empty_holon):
         """Test default format is toon."""
-        holon = Holon()
-        result = serialize_for_ai(holon)
+        result = serialize_for_ai(empty_holon)
         assert isinstance(result, str)
 
-    def test_serialize_complete_holon(self):
+    def test_serialize_complete_holon(self, full_holon):
         """Test serializing a complete Holon."""
-        def my_action(x: int) -> int:
-            """Double a number."""
-            return x * 2
+        data = holon_converter.unstructure_holon(full_holon)
+        assert set(data) == {"purpose", "self", "actions"}
 
-        holon = (
-            Holon()
-            .add_purpose("Main purpose")
-            .add_self({"key": "value"}, key="data")
-            .add_action(my_action, name="my_action", purpose="Double input")
-        )
 
-        result = serialize_for_ai(holon, format="json")
-        data = json.loads(result)
+class TestJsonHelpers:
+    """Tests for the internal JSON encode/decode helpers."""
 
-        assert "purpose" in data
-        assert "self" in data
-        assert "actions" in data
+    def test_round_trip(self):
+        """Test _dumps output decodes back to the same data."""
+        data = {"purpose": ["Be helpful"], "self": {"count": 3, "ok": True, "none": None}}
+        assert _loads(_dumps(data)) == data
+        assert _loads(_dumps(data, indent=2)) == data
 
+    def test_indent_matches_stdlib(self):
+        """Test indented output matches json.dumps(indent=2) for ASCII data."""
+        data = {"a": [1, 2], "b": {"c": "d"}}
+        assert _dumps(data, indent=2) == json.dumps(data, indent=2)
 
-class TestParseAIResponse:
-    """Tests for parse_ai_response function."""
+    def test_non_string_keys(self):
+        """Test non-string keys are stringified like the stdlib encoder."""
+        assert _loads(_dumps({1: "one"})) == {"1": "one"}
 
-    def test_parse_single_action_dict(self):
-        """Test parsing single action from dict."""
-        response = {"action": "my_action", "params": {"x": 5}}
-        result = parse_ai_response(response)
-        assert result == [{"action": "my_action", "params": {"x": 5}}]
+    def test_unsupported_indent_falls_back(self):
+        """Test indent widths other than 2 are still honored."""
+        assert _dumps({"a": 1}, indent=4) == json.dumps({"a": 1}, indent=4)
+
+    def test_loads_invalid_raises_decode_error(self):
+        """Test invalid input raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            _loads("not json")
 
-    def test_parse_single_action_string(self):
-        """Test parsing single action from JSON string."""
-        response = '{"action": "my_action", "params": {"x": 5}}'
-        result = parse_ai_response(response)
-        assert result == [{"action": "my_action", "params": {"x": 5}}]
 
-    def test_parse_multiple_actions_dict(self):
-        """Test parsing multiple actions from dict."""
-        response = {
+class TestParseAIResponse:
+    """Tests for parse_ai_response function."""
+
+    @pytest.mark.parametrize("response", [
+        {"action": "my_action", "params": {"x": 5}},
+        '{"action": "my_action", "params": {"x": 5}}',
+        b'{"action": "my_action", "params": {"x": 5}}',
+    ], ids=["dict", "str", "bytes"])
+    def test_parse_single_action(self, response):
+        """Test parsing a single action from a dict, JSON string or UTF-8 bytes."""
+        assert parse_ai_response(response) == [{"action": "my_action", "params": {"x": 5}}]
+
+    @pytest.mark.parametrize("response", [
+        {
             "actions": [
                 {"action": "action1", "params": {"a": 1}},
                 {"action": "action2", "params": {"b": 2}},
             ]
-        }
-        result = parse_ai_response(response)
-        assert len(result) == 2
-        assert result[0]["action"] == "action1"
-        assert result[1]["action"] == "action2"
-
-    def test_parse_multiple_actions_string(self):
-        """Test parsing multiple actions from JSON string."""
-        response = json.dumps({
-            "actions": [
-                {"action": "action1", "params": {}},
-                {"action": "action2", "params": {}},
-            ]
-        })
+        },
+        _MULTI_ACTIONS_JSON,
+    ], ids=["dict", "str"])
+    def test_parse_multiple_actions(self, response):
+        """Test parsing multiple actions from a dict or JSON string."""
         result = parse_ai_response(response)
-        assert len(result) == 2
+        assert [call["action"] for call in result] == ["action1", "action2"]
 
     def test_parse_invalid_format(self):
         """Test parsing invalid format raises error."""
         response = {"invalid": "format"}
-        with pytest.raises(ValueError, match="Invalid AI response format"):
+        with pytest.raises(ValueError, match=_INVALID_FORMAT_RE):
             parse_ai_response(response)
 
     def test_parse_empty_params(self):
@@ -198,6 +264,10 @@ class TestParseAIResponse:
         assert result == [{"action": "simple_action"}]
 
 
+@pytest.mark.skipif(
+    not (TOON_AVAILABLE and hasattr(toon, "compare_formats")),
+    reason="python-toon compare_formats not available",
+)
 class TestEstimateTokenSavings:
     """Tests for estimate_token_savings function."""
 
@@ -208,26 +278,17 @@ class TestEstimateTokenSavings:
             .add_purpose("Be helpful")
             .add_self({"key": "value"}, key="data")
         )
-        try:
-            result = estimate_token_savings(holon)
-            assert isinstance(result, dict)
-            # toon.compare_formats should return comparison stats
-        except (ImportError, AttributeError):
-            # python-toon may not have compare_formats
-            pytest.skip("python-toon compare_formats not available")
+        result = estimate_token_savings(holon)
+        assert isinstance(result, dict)
 
 
 class TestRoundTrip:
     """Tests for serialization round-trips."""
 
-    def test_serialize_deserialize_actions(self):
-        """Test that serialized actions can be parsed back."""
-        def add(a: int, b: int) -> int:
-            return a + b
-
-        holon = Holon().add_action(add, name="add", purpose="Add numbers")
-        serialized = serialize_for_ai(holon, format="json")
-        data = json.loads(serialized)
+    def test_serialize_deserialize_actions(self, arith_holon, arith_holon_data):
+        """Test that serialized action names can be dispatched back."""
+        holon = arith_holon
+        data = arith_holon_data
 
         # Simulate AI response calling the action
         ai_response = {
@@ -242,48 +303,39 @@ class TestRoundTrip:
         result = holon.dispatch_many(calls)
         assert result == [8]
 
-    def test_full_workflow(self):
+    @pytest.mark.parametrize("ai_response,expected", [
+        (
+            {
+                "actions": [
+                    {"action": "log_message", "params": {"message": "Hello", "level": "info"}},
+                    {"action": "log_message", "params": {"message": "Error!", "level": "error"}},
+                    {"action": "get_status", "params": {}},
+                ]
+            },
+            [
+                {"message": "Hello", "level": "info"},
+                {"message": "Error!", "level": "error"},
+                {"status": "ok", "logs": 2},
+            ],
+        ),
+        (
+            {"action": "log_message", "params": {"message": "Only"}},
+            [{"message": "Only", "level": "info"}],
+        ),
+        (
+            {"actions": [{"action": "get_status"}]},
+            [{"status": "ok", "logs": 0}],
+        ),
+    ], ids=["batch", "single", "status-only"])
+    def test_full_workflow(self, logger_holon, logs, ai_response, expected):
         """Test complete workflow: build -> serialize -> parse -> dispatch."""
-        results_log = []
-
-        def log_message(message: str, level: str = "info") -> dict:
-            """Log a message."""
-            entry = {"message": message, "level": level}
-            results_log.append(entry)
-            return entry
-
-        def get_status() -> dict:
-            """Get system status."""
-            return {"status": "ok", "logs": len(results_log)}
-
-        holon = (
-            Holon()
-            .add_purpose("Log messages and track status")
-            .add_self(lambda: {"log_count": len(results_log)}, key="state")
-            .add_action(log_message, name="log_message", purpose="Log a message")
-            .add_action(get_status, name="get_status", purpose="Get current status")
-        )
-
-        # Serialize for AI
-        serialized = serialize_for_ai(holon, format="json")
-        data = json.loads(serialized)
-
+        # Build the view the AI would receive
+        data = logger_holon.to_dict()
         assert len(data["actions"]) == 2
-
-        # Simulate AI response with multiple actions
-        ai_response = {
-            "actions": [
-                {"action": "log_message", "params": {"message": "Hello", "level": "info"}},
-                {"action": "log_message", "params": {"message": "Error!", "level": "error"}},
-                {"action": "get_status", "params": {}},
-            ]
-        }
+        assert data["self"]["state"] == {"log_count": 0}
 
         # Parse and dispatch
         calls = parse_ai_response(ai_response)
-        results = holon.dispatch_many(calls)
-
-        assert len(results) == 3
-        assert results[0] == {"message": "Hello", "level": "info"}
-        assert results[1] == {"message": "Error!", "level": "error"}
-        assert results[2] == {"status": "ok", "logs": 2}
+        results = logger_holon.dispatch_many(calls)
+        assert results == expected
+        assert logs == [r for r in results if "message" in r]
@@ -4,40 +4,176 @@ Tests for the storage layer.
 Uses SQLite in-memory for all tests.
 """
 
+import subprocess
+import sys
+
 import pytest
 from datetime import datetime, timezone, timedelta
 
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
 from holonic_engine import HolonicObject, Heartbeat
 from holonic_engine.storage import SQLStorage
+from holonic_engine.storage.schema import metadata
 
+# Durability settings are pointless for a throwaway in-memory test DB
+_TEST_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
 
-@pytest.fixture
-def storage():
-    """Create an in-memory SQLite storage for testing."""
+
+def _apply_test_pragmas(dbapi_conn, connection_record):
+    cursor = dbapi_conn.cursor()
+    for pragma in _TEST_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _message(message_id, sender_id, recipient_ids, content):
+    return {
+        "message_id": message_id,
+        "sender_id": sender_id,
+        "recipient_ids": recipient_ids,
+        "content": content,
+    }
+
+
+@pytest.fixture(scope="session")
+def _session_storage():
+    """
+    One in-memory SQLite storage with the schema created once per session.
+
+    Under pytest-xdist each worker process builds its own, so storage test
+    classes can run on different workers without sharing rows.
+    """
     store = SQLStorage("sqlite:///:memory:")
     store.connect()
-    store.create_tables()
+    event.listen(store.engine, "connect", _apply_test_pragmas)
+    store.create_tables(checkfirst=False)
     yield store
     store.disconnect()
 
 
+@pytest.fixture
+def storage(_session_storage):
+    """The shared in-memory storage, emptied after each test."""
+    yield _session_storage
+    with _session_storage.engine.begin() as conn:
+        for table in reversed(metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+@pytest.fixture
+def query_log(storage):
+    """List of SQL statements executed on storage while the test runs."""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(storage.engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(storage.engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def saved_hobj(storage):
+    """A fresh HolonicObject already persisted to storage."""
+    hobj = HolonicObject()
+    hobj.knowledge_set("value", 1)
+    storage.save_full(hobj)
+    return hobj
+
+
+@pytest.fixture
+def heartbeat_for(saved_hobj):
+    """Factory for a processed Heartbeat over saved_hobj (or another hobj)."""
+
+    def _mk(time=None, hobj=None, actions=()):
+        hobj = hobj or saved_hobj
+        heartbeat = Heartbeat(heartbeat_time=time or datetime.now(timezone.utc))
+        heartbeat.add_holonicobject(hobj)
+        heartbeat.build_prompt()
+        heartbeat.process_response_dict({hobj.id: {"actions": list(actions)}})
+        return heartbeat
+
+    return _mk
+
+
+class TestLazyStorageImport:
+    """Tests for the package-level lazy storage exports."""
+
+    @pytest.mark.slow
+    def test_package_import_defers_sqlalchemy(self):
+        """Test that importing holonic_engine loads sqlalchemy only on first storage access."""
+        code = (
+            "import sys, holonic_engine\n"
+            "assert 'sqlalchemy' not in sys.modules\n"
+            "assert holonic_engine.SQLStorage.__name__ == 'SQLStorage'\n"
+            "assert 'sqlalchemy' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
 class TestSQLStorageConnection:
     """Tests for connection management."""
 
     def test_connect_disconnect(self):
         """Test basic connect/disconnect."""
         store = SQLStorage("sqlite:///:memory:")
+        assert not store.is_connected
         store.connect()
-        assert store._engine is not None
+        assert store.is_connected
         store.disconnect()
-        assert store._engine is None
+        assert not store.is_connected
 
     def test_context_manager(self):
         """Test context manager usage."""
         with SQLStorage("sqlite:///:memory:") as store:
             store.create_tables()
-            assert store._engine is not None
-        assert store._engine is None
+            assert store.is_connected
+        assert not store.is_connected
+
+    def test_create_tables_without_checkfirst(self):
+        """Test checkfirst=False creates the schema without probing tables."""
+        statements = []
+        with SQLStorage("sqlite:///:memory:") as store:
+            event.listen(
+                store.engine,
+                "before_cursor_execute",
+                lambda conn, cursor, statement, *args: statements.append(statement),
+            )
+            store.create_tables(checkfirst=False)
+
+        assert not any("PRAGMA" in s and "table_info" in s for s in statements)
+        assert sum(s.lstrip().startswith("CREATE TABLE") for s in statements) == len(metadata.tables)
+
+    def test_create_tables_matches_metadata(self):
+        """Test the cached SQLite DDL is idempotent and builds the metadata schema."""
+        query = "SELECT type, name FROM sqlite_master ORDER BY name"
+        with SQLStorage("sqlite:///:memory:") as cached, SQLStorage("sqlite:///:memory:") as reference:
+            cached.create_tables()
+            cached.create_tables()
+            metadata.create_all(reference.engine)
+            with cached.engine.connect() as a, reference.engine.connect() as b:
+                assert a.exec_driver_sql(query).fetchall() == b.exec_driver_sql(query).fetchall()
+
+    def test_create_tables_without_checkfirst_rejects_existing(self):
+        """Test checkfirst=False on SQLite issues plain CREATE statements."""
+        with SQLStorage("sqlite:///:memory:") as store:
+            store.create_tables(checkfirst=False)
+            with pytest.raises(OperationalError, match="already exists"):
+                store.create_tables(checkfirst=False)
+
+    def test_accepts_extra_attributes(self):
+        """Test callers can attach attributes, e.g. for instrumentation."""
+        store = SQLStorage()
+        store.instrumented = True
+        assert store.instrumented
 
     def test_engine_requires_connect(self):
         """Test that engine property requires connection."""
@@ -46,6 +182,30 @@ class TestSQLStorageConnection:
             _ = store.engine
 
 
+class TestBulk:
+    """Tests for batching storage calls into one transaction."""
+
+    def test_bulk_commits_on_exit(self, storage):
+        """Test writes inside bulk() are visible inside and after the block."""
+        with storage.bulk():
+            storage.save_message("msg-1", "hobj-1", ["hobj-2"], "One")
+            storage.save_message("msg-2", "hobj-1", ["hobj-2"], "Two")
+            assert len(storage.get_messages("hobj-1", direction="sent")) == 2
+
+        assert len(storage.get_messages("hobj-1", direction="sent")) == 2
+
+    def test_bulk_rolls_back_on_error(self, storage):
+        """Test an exception inside bulk() discards every write in the block."""
+        with pytest.raises(RuntimeError):
+            with storage.bulk():
+                storage.save_telemetry_snapshot({"value": 1})
+                with storage.bulk():
+                    storage.save_telemetry_snapshot({"value": 2})
+                raise RuntimeError("boom")
+
+        assert storage.get_telemetry_snapshots() == []
+
+
 class TestHolonPersistence:
     """Tests for Holon (type/template) persistence."""
 
@@ -338,6 +498,41 @@ class TestTreePersistence:
         child_names = {c["knowledge"]["name"] for c in tree["children"]}
         assert child_names == {"child1", "child2"}
 
+    def test_load_subtree(self, storage):
+        """Test loading from an inner node returns only its descendants."""
+        root = HolonicObject()
+        child = root.create_child()
+        child.knowledge_set("name", "child")
+        root.create_child()
+        grandchild = child.create_child()
+        grandchild.knowledge_set("name", "grandchild")
+        grandchild.create_child()
+
+        storage.save_tree(root)
+
+        tree = storage.load_tree(child.id)
+
+        assert tree["knowledge"]["name"] == "child"
+        assert tree["holon"]["id"] == child.id
+        assert [c["id"] for c in tree["children"]] == [grandchild.id]
+        assert len(tree["children"][0]["children"]) == 1
+        assert storage.load_tree("nonexistent") is None
+
+    @pytest.mark.parametrize("depth", [1, 4])
+    def test_load_tree_query_count_is_constant(self, storage, query_log, depth):
+        """Test load_tree issues the same number of queries for any tree depth."""
+        root = HolonicObject()
+        node = root
+        for _ in range(depth):
+            node.create_child()
+            node = node.create_child()
+        storage.save_tree(root)
+        query_log.clear()
+
+        storage.load_tree(root.id)
+
+        assert len(query_log) == 2
+
     def test_restore_hobj(self, storage):
         """Test restoring a single hobj."""
         original = HolonicObject()
@@ -390,32 +585,15 @@ class TestTreePersistence:
 class TestHeartbeatPersistence:
     """Tests for heartbeat history."""
 
-    def test_save_heartbeat(self, storage):
+    def test_save_heartbeat(self, storage, heartbeat_for):
         """Test saving a heartbeat."""
-        hobj = HolonicObject()
-        storage.save_full(hobj)
-
-        heartbeat = Heartbeat(heartbeat_time=datetime.now(timezone.utc))
-        heartbeat.add_holonicobject(hobj)
-        heartbeat.build_prompt()
-        heartbeat.process_response(f'{{"{hobj.id}": {{"actions": []}}}}')
-
-        heartbeat_id = storage.save_heartbeat(heartbeat)
+        heartbeat_id = storage.save_heartbeat(heartbeat_for())
 
         assert heartbeat_id > 0
 
-    def test_get_heartbeat(self, storage):
+    def test_get_heartbeat(self, storage, saved_hobj, heartbeat_for):
         """Test getting a specific heartbeat."""
-        hobj = HolonicObject()
-        hobj.knowledge_set("value", 1)
-        storage.save_full(hobj)
-
-        now = datetime.now(timezone.utc)
-        heartbeat = Heartbeat(heartbeat_time=now)
-        heartbeat.add_holonicobject(hobj)
-        heartbeat.build_prompt()
-        heartbeat.process_response(f'{{"{hobj.id}": {{"actions": [{{"action": "test"}}]}}}}')
-
+        heartbeat = heartbeat_for(actions=[{"action": "test"}])
         heartbeat_id = storage.save_heartbeat(heartbeat)
 
         loaded = storage.get_heartbeat(heartbeat_id)
@@ -423,78 +601,61 @@ class TestHeartbeatPersistence:
         assert loaded is not None
         assert loaded["hobj_count"] == 1
         assert len(loaded["hobjs"]) == 1
-        assert loaded["hobjs"][0]["hobj_id"] == hobj.id
+        assert loaded["hobjs"][0]["hobj_id"] == saved_hobj.id
 
-    def test_get_heartbeats_list(self, storage):
+    def test_get_heartbeats_list(self, storage, heartbeat_for):
         """Test getting heartbeat list."""
-        hobj = HolonicObject()
-        storage.save_full(hobj)
-
-        for i in range(3):
-            hb = Heartbeat(heartbeat_time=datetime.now(timezone.utc))
-            hb.add_holonicobject(hobj)
-            hb.build_prompt()
-            hb.process_response(f'{{"{hobj.id}": {{"actions": []}}}}')
-            storage.save_heartbeat(hb)
+        with storage.bulk():
+            for i in range(3):
+                storage.save_heartbeat(heartbeat_for())
 
         heartbeats = storage.get_heartbeats(limit=10)
         assert len(heartbeats) == 3
 
-    def test_get_heartbeats_filtered(self, storage):
+    def test_get_heartbeats_filtered(self, storage, heartbeat_for):
         """Test filtering heartbeats by time."""
-        hobj = HolonicObject()
-        storage.save_full(hobj)
-
         now = datetime.now(timezone.utc)
         old_time = now - timedelta(hours=1)
 
-        # Old heartbeat
-        hb1 = Heartbeat(heartbeat_time=old_time)
-        hb1.add_holonicobject(hobj)
-        hb1.build_prompt()
-        hb1.process_response(f'{{"{hobj.id}": {{"actions": []}}}}')
-        storage.save_heartbeat(hb1)
-
-        # New heartbeat
-        hb2 = Heartbeat(heartbeat_time=now)
-        hb2.add_holonicobject(hobj)
-        hb2.build_prompt()
-        hb2.process_response(f'{{"{hobj.id}": {{"actions": []}}}}')
-        storage.save_heartbeat(hb2)
+        storage.save_heartbeat(heartbeat_for(old_time))
+        storage.save_heartbeat(heartbeat_for(now))
 
         # Filter for recent only
         recent = storage.get_heartbeats(since=now - timedelta(minutes=5))
         assert len(recent) == 1
 
-    def test_get_hobj_heartbeats(self, storage):
+    def test_get_hobj_heartbeats(self, storage, saved_hobj, heartbeat_for):
         """Test getting heartbeats for specific hobj."""
-        hobj1 = HolonicObject()
-        hobj2 = HolonicObject()
-        storage.save_full(hobj1)
-        storage.save_full(hobj2)
+        other = HolonicObject()
+        storage.save_full(other)
 
-        # Heartbeat with hobj1 only
-        hb1 = Heartbeat(heartbeat_time=datetime.now(timezone.utc))
-        hb1.add_holonicobject(hobj1)
-        hb1.build_prompt()
-        hb1.process_response(f'{{"{hobj1.id}": {{"actions": []}}}}')
-        storage.save_heartbeat(hb1)
+        storage.save_heartbeat(heartbeat_for())
+        storage.save_heartbeat(heartbeat_for(hobj=other))
 
-        # Heartbeat with hobj2 only
-        hb2 = Heartbeat(heartbeat_time=datetime.now(timezone.utc))
-        hb2.add_holonicobject(hobj2)
-        hb2.build_prompt()
-        hb2.process_response(f'{{"{hobj2.id}": {{"actions": []}}}}')
-        storage.save_heartbeat(hb2)
-
-        # Should only get hobj1's heartbeat
-        hobj1_heartbeats = storage.get_hobj_heartbeats(hobj1.id)
-        assert len(hobj1_heartbeats) == 1
+        # Should only get saved_hobj's heartbeat
+        hobj_heartbeats = storage.get_hobj_heartbeats(saved_hobj.id)
+        assert len(hobj_heartbeats) == 1
 
 
 class TestMessagePersistence:
     """Tests for message history."""
 
+    def test_save_messages_single_insert(self, storage, query_log):
+        """Test save_messages writes a batch with one INSERT statement."""
+        storage.save_messages([
+            _message(f"msg-{i}", "hobj-1", ["hobj-2"], f"Message {i}")
+            for i in range(5)
+        ])
+
+        inserts = [q for q in query_log if q.startswith("INSERT")]
+        assert len(inserts) == 1
+        assert len(storage.get_messages("hobj-1", direction="sent")) == 5
+
+    def test_save_messages_empty(self, storage, query_log):
+        """Test saving an empty batch touches nothing."""
+        storage.save_messages([])
+        assert query_log == []
+
     def test_save_message(self, storage):
         """Test saving a message."""
         storage.save_message(
@@ -513,25 +674,31 @@ class TestMessagePersistence:
 
     def test_get_messages_sent(self, storage):
         """Test getting sent messages."""
-        storage.save_message("msg-1", "hobj-1", ["hobj-2"], "Message 1")
-        storage.save_message("msg-2", "hobj-1", ["hobj-3"], "Message 2")
-        storage.save_message("msg-3", "hobj-2", ["hobj-1"], "Reply")
+        storage.save_messages([
+            _message("msg-1", "hobj-1", ["hobj-2"], "Message 1"),
+            _message("msg-2", "hobj-1", ["hobj-3"], "Message 2"),
+            _message("msg-3", "hobj-2", ["hobj-1"], "Reply"),
+        ])
 
         sent = storage.get_messages("hobj-1", direction="sent")
         assert len(sent) == 2
 
     def test_get_messages_received(self, storage):
         """Test getting received messages."""
-        storage.save_message("msg-1", "hobj-1", ["hobj-2"], "Message 1")
-        storage.save_message("msg-2", "hobj-3", ["hobj-2"], "Message 2")
+        storage.save_messages([
+            _message("msg-1", "hobj-1", ["hobj-2"], "Message 1"),
+            _message("msg-2", "hobj-3", ["hobj-2"], "Message 2"),
+        ])
 
         received = storage.get_messages("hobj-2", direction="received")
         assert len(received) == 2
 
     def test_get_messages_both(self, storage):
         """Test getting all messages."""
-        storage.save_message("msg-1", "hobj-1", ["hobj-2"], "Sent")
-        storage.save_message("msg-2", "hobj-2", ["hobj-1"], "Received")
+        storage.save_messages([
+            _message("msg-1", "hobj-1", ["hobj-2"], "Sent"),
+            _message("msg-2", "hobj-2", ["hobj-1"], "Received"),
+        ])
 
         all_msgs = storage.get_messages("hobj-1", direction="both")
         assert len(all_msgs) == 2
@@ -566,9 +733,9 @@ class TestTelemetryPersistence:
 
     def test_get_telemetry_snapshots(self, storage):
         """Test getting telemetry snapshots."""
-        storage.save_telemetry_snapshot({"value": 1})
-        storage.save_telemetry_snapshot({"value": 2})
-        storage.save_telemetry_snapshot({"value": 3})
+        with storage.bulk():
+            for value in (1, 2, 3):
+                storage.save_telemetry_snapshot({"value": value})
 
         snapshots = storage.get_telemetry_snapshots(limit=10)
         assert len(snapshots) == 3
@@ -578,14 +745,12 @@ class TestTelemetryPersistence:
 
     def test_get_telemetry_filtered(self, storage):
         """Test filtering telemetry by time."""
-        storage.save_telemetry_snapshot({"old": True})
-
-        from time import sleep
-        sleep(0.1)
-        cutoff = datetime.now(timezone.utc)
-        sleep(0.1)
-
-        storage.save_telemetry_snapshot({"new": True})
+        t0 = datetime.now(timezone.utc)
+        storage.save_telemetry_snapshot({"old": True}, timestamp=t0)
+        cutoff = t0 + timedelta(milliseconds=1)
+        storage.save_telemetry_snapshot(
+            {"new": True}, timestamp=t0 + timedelta(milliseconds=2)
+        )
 
         recent = storage.get_telemetry_snapshots(since=cutoff)
         assert len(recent) == 1
@@ -49,6 +49,18 @@ class TestTimingStats:
         assert stats.max_ms == 300.0
         assert stats.avg_ms == 200.0
 
+    def test_stddev(self):
+        """Test the running standard deviation matches a two-pass computation."""
+        samples = [12.0, 15.5, 9.25, 30.0, 18.0]
+        stats = TimingStats()
+        for ms in samples:
+            stats.record(ms)
+
+        mean = sum(samples) / len(samples)
+        expected = (sum((ms - mean) ** 2 for ms in samples) / len(samples)) ** 0.5
+        assert stats.stddev_ms == pytest.approx(expected)
+        assert TimingStats().stddev_ms == 0.0
+
     def test_to_dict(self):
         """Test converting to dictionary."""
         stats = TimingStats()
@@ -219,6 +231,30 @@ class TestHolonicTelemetry:
         # Should have the last 5 errors
         assert telemetry.errors[0]["message"] == "Error 5"
 
+    def test_error_limit_shrinks_existing_errors(self):
+        """Test lowering the limit keeps only the newest errors."""
+        telemetry = HolonicTelemetry()
+        for i in range(10):
+            telemetry.record_error("Error", f"Error {i}")
+
+        telemetry._max_errors = 3
+
+        assert [e["message"] for e in telemetry.errors] == ["Error 7", "Error 8", "Error 9"]
+        recent = telemetry.get_summary()["errors"]["recent"]
+        assert [e["message"] for e in recent] == ["Error 7", "Error 8", "Error 9"]
+
+    def test_errors_is_a_list(self):
+        """Test errors is returned as a list, so slicing keeps working."""
+        telemetry = HolonicTelemetry(max_errors=3)
+        for i in range(10):
+            telemetry.record_error("Error", f"Error {i}")
+
+        assert isinstance(telemetry.errors, list)
+        assert [e["message"] for e in telemetry.errors[-2:]] == ["Error 8", "Error 9"]
+
+        telemetry.errors = [{"message": f"Old {i}"} for i in range(5)]
+        assert [e["message"] for e in telemetry.errors] == ["Old 2", "Old 3", "Old 4"]
+
     def test_get_summary(self):
         """Test getting telemetry summary."""
         telemetry = HolonicTelemetry()
@@ -282,6 +318,25 @@ class TestTimer:
 
         assert timer.duration_ms >= 10.0
 
+    def test_timer_uses_integer_clock(self):
+        """Test the timer keeps an integer ns start and has no instance dict."""
+        with Timer() as timer:
+            pass
+
+        assert isinstance(timer.start_ns, int)
+        assert not hasattr(timer, "__dict__")
+
+    def test_timer_start_time_seconds(self):
+        """Test start_time still reports the start in perf_counter seconds."""
+        import time
+
+        before = time.perf_counter()
+        with Timer() as timer:
+            pass
+
+        assert timer.start_time == timer.start_ns / 1e9
+        assert abs(timer.start_time - before) < 1.0
+
     def test_timer_as_context_manager(self):
         """Test timer as context manager."""
         with Timer() as timer:
@@ -290,6 +345,15 @@ class TestTimer:
         assert timer.duration_ms >= 0
 
 
+class TestSlots:
+    """Tests that telemetry records carry no per-instance dict."""
+
+    @pytest.mark.parametrize("cls", [TimingStats, CounterStats, HolonicTelemetry, Timer])
+    def test_slotted(self, cls):
+        """Test instances have no __dict__."""
+        assert not hasattr(cls(), "__dict__")
+
+
 class TestGlobalTelemetry:
     """Tests for global telemetry functions."""
 
@@ -2,9 +2,26 @@
 Tests for token counting functionality.
 """
 
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import tiktoken
 
-from holonic_engine import TokenCounter, count_tokens, tokens_available
+from holonic_engine import (
+    TokenCounter,
+    count_tokens,
+    count_tokens_async,
+    count_tokens_batch,
+    count_tokens_batch_async,
+    tokens_available,
+)
+from holonic_engine import tokens, tokens_hf
+from holonic_engine.serialization import _dumps
 
 
 class TestTokensAvailable:
@@ -30,6 +47,54 @@ class TestTokenCounter:
         count = TokenCounter.count("")
         assert count == 0
 
+    @pytest.mark.parametrize("text", [None, b"", []])
+    def test_count_rejects_falsy_non_str(self, text):
+        """Test falsy non-str input raises TypeError instead of counting as empty."""
+        with pytest.raises(TypeError, match="text must be str"):
+            TokenCounter.count(text)
+
+    @pytest.mark.parametrize("text", [b"bytes", ["list"]])
+    def test_count_rejects_non_str(self, byte_encoding, text):
+        """Test other non-str input is rejected by the encoder."""
+        with pytest.raises(TypeError):
+            TokenCounter.count(text)
+
+    def test_token_counter_no_dict(self):
+        """Test the counters carry no per-instance __dict__."""
+        assert not hasattr(TokenCounter(), "__dict__")
+        assert not hasattr(tokens_hf.HFTokenCounter(), "__dict__")
+
+    def test_count_rejects_huge_input(self):
+        """Test text over max_chars raises before reaching tiktoken."""
+        with pytest.raises(ValueError, match="max_chars"):
+            TokenCounter.count("x" * (TokenCounter.max_chars + 1))
+
+    def test_count_max_chars_configurable(self, fake_encoding, monkeypatch):
+        """Test max_chars can be lowered and text at the limit is still counted."""
+        monkeypatch.setattr(TokenCounter, "max_chars", 8)
+        assert TokenCounter.count("x" * 8) == 3
+        with pytest.raises(ValueError):
+            TokenCounter.count("x" * 9)
+
+    @pytest.mark.parametrize("call", [
+        lambda: TokenCounter.count_batch(["ok", "x" * 9]),
+        lambda: TokenCounter.count_json({"text": "x" * 9}),
+        lambda: TokenCounter.count_json({"text": "x" * 9}, exact=False),
+    ], ids=["count_batch", "count_json", "count_json_chunked"])
+    def test_max_chars_applies_to_every_entry_point(self, fake_encoding, monkeypatch, call):
+        """Test batch and JSON counting enforce max_chars too."""
+        monkeypatch.setattr(TokenCounter, "max_chars", 8)
+        with pytest.raises(ValueError, match="max_chars"):
+            call()
+
+    def test_count_empty_skips_encoder(self, monkeypatch):
+        """Test the empty string is counted without loading an encoder."""
+        def fail(*args, **kwargs):
+            raise AssertionError("get_encoder should not be called")
+
+        monkeypatch.setattr(TokenCounter, "get_encoder", fail)
+        assert TokenCounter.count("") == 0
+
     def test_count_with_model(self):
         """Test counting with specific model."""
         text = "This is a test message for token counting."
@@ -77,6 +142,304 @@ class TestTokenCounter:
         assert enc is not None
 
 
+class _FakeEncoding:
+    """Offline stand-in for a tiktoken Encoding: one token per 4 chars, plus one."""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = []
+
+    def encode(self, text, **kwargs):
+        self.calls.append("encode")
+        return [0] * (len(text) // 4 + 1) if text else []
+
+    def encode_ordinary(self, text):
+        self.calls.append("encode_ordinary")
+        return [0] * (len(text) // 4 + 1) if text else []
+
+    def encode_ordinary_batch(self, texts, *, num_threads=8):
+        return [self.encode_ordinary(text) for text in texts]
+
+
+@pytest.fixture
+def fake_encoding(monkeypatch):
+    """Route TokenCounter through _FakeEncoding; returns the list of loaded names."""
+    loaded = []
+
+    def fake_get_encoding(enc_name):
+        loaded.append(enc_name)
+        return _FakeEncoding(enc_name)
+
+    monkeypatch.setattr(tokens, "_get_encoding", fake_get_encoding)
+    monkeypatch.setattr(TokenCounter, "_encoders", {})
+    monkeypatch.setattr(TokenCounter, "_resolved", {})
+    monkeypatch.setattr(tokens, "_json_counts", OrderedDict())
+    return loaded
+
+
+class TestEncodingSeam:
+    """Tests for the _get_encoding loader used by TokenCounter."""
+
+    def test_encoder_loaded_through_get_encoding(self, fake_encoding):
+        """Test that TokenCounter loads encoders via _get_encoding once per name."""
+        assert TokenCounter.count("abcdefgh", encoding="cl100k_base") == 3
+        assert TokenCounter.count("abcd", encoding="cl100k_base") == 2
+        assert fake_encoding == ["cl100k_base"]
+
+    def test_cache_bounded_by_encoding_name(self, fake_encoding):
+        """Test that many model names share the encoders of their encodings."""
+        for i in range(40):
+            TokenCounter.get_encoder(model=f"unknown-model-{i}")
+        TokenCounter.get_encoder(model="gpt-4")
+
+        assert sorted(TokenCounter._encoders) == ["cl100k_base", "o200k_base"]
+
+    def test_warmup_populates_cache(self, fake_encoding):
+        """Test warmup loads the default encodings so later lookups hit the cache."""
+        TokenCounter.warmup()
+        assert fake_encoding == ["o200k_base", "cl100k_base"]
+
+        TokenCounter.get_encoder(encoding="o200k_base")
+        TokenCounter.count("Hello", model="gpt-4")
+        assert fake_encoding == ["o200k_base", "cl100k_base"]
+
+    def test_get_encoder_thread_safe(self, monkeypatch):
+        """Test racing first calls share one encoder and load it once."""
+        loaded = []
+
+        def slow_get_encoding(enc_name):
+            loaded.append(enc_name)
+            time.sleep(0.05)
+            return _FakeEncoding(enc_name)
+
+        monkeypatch.setattr(tokens, "_get_encoding", slow_get_encoding)
+        monkeypatch.setattr(TokenCounter, "_encoders", {})
+        monkeypatch.setattr(TokenCounter, "_resolved", {})
+        barrier = threading.Barrier(16)
+
+        def get():
+            barrier.wait()
+            return TokenCounter.get_encoder(encoding="cl100k_base")
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            encoders = list(pool.map(lambda _: get(), range(16)))
+
+        assert all(encoder is encoders[0] for encoder in encoders)
+        assert loaded == ["cl100k_base"]
+
+    def test_get_encoder_case_insensitive_after_warm(self, fake_encoding, monkeypatch):
+        """Test model names are normalized once, then served from the resolved cache."""
+        assert TokenCounter.get_encoder(model="GPT-4") is TokenCounter.get_encoder(model="gpt-4")
+        assert TokenCounter.get_encoder(model=" gpt-4o ").name == "o200k_base"
+
+        def fail(model):
+            raise AssertionError("warm lookups should not resolve model names")
+
+        monkeypatch.setattr(tokens, "_encoding_for_model", fail)
+        assert TokenCounter.get_encoder(model="GPT-4") is TokenCounter.get_encoder(model="gpt-4")
+
+    def test_resolved_cache_capped(self, fake_encoding, monkeypatch):
+        """Test the resolved-name cache stops growing at its cap."""
+        monkeypatch.setattr(TokenCounter, "_RESOLVED_MAX", 10)
+        for i in range(40):
+            TokenCounter.get_encoder(model=f"unknown-model-{i}")
+        assert len(TokenCounter._resolved) <= 11
+
+    def test_clear_cache(self, fake_encoding):
+        """Test clear_cache forces encoders to be loaded again."""
+        first = TokenCounter.get_encoder(encoding="cl100k_base")
+        TokenCounter.clear_cache()
+        second = TokenCounter.get_encoder(encoding="cl100k_base")
+
+        assert first is not second
+        assert fake_encoding == ["cl100k_base", "cl100k_base"]
+
+
+class TestCountBatch:
+    """Tests for batched token counting."""
+
+    def test_count_batch_matches_scalar(self, fake_encoding):
+        """Test batch counts equal one count_tokens call per text, in order."""
+        texts = ["", "Hi", "Hello, world!", "x" * 41]
+        assert count_tokens_batch(texts) == [count_tokens(t) for t in texts]
+
+    def test_count_batch_large(self, fake_encoding):
+        """Test a 1000-text batch resolves the encoder once."""
+        texts = [f"message number {i}" for i in range(1000)]
+        counts = TokenCounter.count_batch(texts, model="gpt-4")
+        assert len(counts) == 1000
+        assert fake_encoding == ["cl100k_base"]
+
+    def test_count_batch_real_encoder(self):
+        """Test batch counts match scalar counts with tiktoken itself."""
+        texts = ["Hello", "Hello! @#$%^&*() 你好", '{"a": "b"}']
+        assert count_tokens_batch(texts) == [count_tokens(t) for t in texts]
+
+
+class TestCountSeries:
+    """Tests for counting a NumPy array or pandas Series of strings."""
+
+    def test_count_series_matches_scalar(self, fake_encoding):
+        """Test 256 array counts equal per-string counts."""
+        np = pytest.importorskip("numpy")
+        texts = [f"text {i} " * (i % 7) for i in range(256)]
+        counts = TokenCounter.count_series(np.array(texts, dtype=object))
+        assert counts.tolist() == [count_tokens(text) for text in texts]
+
+    def test_count_series_returns_ndarray(self, fake_encoding):
+        """Test the result is a 1-D int64 array, including for empty input."""
+        np = pytest.importorskip("numpy")
+        counts = TokenCounter.count_series(np.array(["a", "bb", "ccc"]))
+        assert isinstance(counts, np.ndarray)
+        assert counts.dtype == np.int64
+        assert counts.shape == (3,)
+
+        empty = TokenCounter.count_series(np.array([], dtype=object))
+        assert empty.dtype == np.int64
+        assert empty.shape == (0,)
+
+    def test_count_series_pandas(self, fake_encoding):
+        """Test a pandas Series counts like its values."""
+        pd = pytest.importorskip("pandas")
+        series = pd.Series(["Hello", "Hello, world!"])
+        assert TokenCounter.count_series(series).tolist() == [count_tokens("Hello"), count_tokens("Hello, world!")]
+
+    def test_count_series_without_numpy(self, monkeypatch):
+        """Test count_series raises ImportError when numpy is missing."""
+        monkeypatch.setattr(tokens, "NUMPY_AVAILABLE", False)
+        with pytest.raises(ImportError):
+            TokenCounter.count_series(["Hello"])
+
+
+class TestSpecialTokens:
+    """Tests for how special-token markers are counted."""
+
+    def test_encode_ordinary_path(self, fake_encoding):
+        """Test plain counting uses encode_ordinary and allow_special uses encode."""
+        encoder = TokenCounter.get_encoder()
+        TokenCounter.count("Hello, world!")
+        TokenCounter.count("Hello, world!", allow_special=True)
+        assert encoder.calls == ["encode_ordinary", "encode"]
+
+    def test_special_marker_counted_as_text(self):
+        """Test special-token markers are counted as text unless allowed."""
+        text = "end<|endoftext|>"
+        assert count_tokens(text) > count_tokens(text, allow_special=True)
+
+
+@pytest.fixture
+def byte_encoding(monkeypatch):
+    """A real, offline tiktoken Encoding with one token per UTF-8 byte."""
+    encoding = tiktoken.Encoding(
+        "bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={"<|endoftext|>": 256},
+    )
+    monkeypatch.setattr(tokens, "_get_encoding", lambda enc_name: encoding)
+    monkeypatch.setattr(TokenCounter, "_encoders", {})
+    monkeypatch.setattr(TokenCounter, "_resolved", {})
+    monkeypatch.setattr(tokens, "_json_counts", OrderedDict())
+    return encoding
+
+
+class TestOrdinaryCounting:
+    """Tests that plain counts match tiktoken's encode_ordinary."""
+
+    @pytest.mark.parametrize("text", [
+        "Hello, world!",
+        "end<|endoftext|>" * 20,
+        "a\ud800b" * 100,
+        "你好 " * 100,
+    ])
+    def test_matches_encode_ordinary(self, byte_encoding, text):
+        """Test counts equal len(encode_ordinary), including markers and lone surrogates."""
+        assert count_tokens(text) == len(byte_encoding.encode_ordinary(text))
+
+
+class TestChunkedCountJson:
+    """Tests for the streamed, approximate count_json path."""
+
+    def test_chunks_cut_at_structure(self):
+        """Test chunks rejoin to the compact JSON and end on structural characters."""
+        data = {"rows": [{"id": i, "name": f"row {i}", "tags": ["a", "b"]} for i in range(2000)]}
+        chunks = list(tokens._iter_json_chunks(data, target=1000))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        assert all(chunk[-1] in ",}]" for chunk in chunks[:-1])
+
+    def test_count_json_large_close_to_exact(self, byte_encoding):
+        """Test the chunked count of a ~1MB dict is within 2% of the exact count."""
+        data = {f"key{i}": {"text": "lorem ipsum dolor " * 3, "n": i} for i in range(12000)}
+
+        exact = TokenCounter.count_json(data)
+        approx = TokenCounter.count_json(data, exact=False)
+
+        assert exact > 1_000_000
+        assert abs(approx - exact) / exact < 0.02
+
+
+class TestAsyncCounting:
+    """Tests for the event-loop-friendly counting functions."""
+
+    async def test_count_tokens_async(self, fake_encoding):
+        """Test async counts match sync counts and run off the loop thread."""
+        encoder = TokenCounter.get_encoder()
+        threads = []
+        encode_ordinary = encoder.encode_ordinary
+
+        def recording_encode_ordinary(text):
+            threads.append(threading.get_ident())
+            return encode_ordinary(text)
+
+        encoder.encode_ordinary = recording_encode_ordinary
+        texts = [f"message {i} " * i for i in range(1, 101)]
+
+        counts = await asyncio.gather(*(count_tokens_async(t) for t in texts))
+
+        assert counts == [count_tokens(t) for t in texts]
+        assert threading.get_ident() not in threads[:100]
+
+    async def test_count_tokens_batch_async(self, fake_encoding):
+        """Test the async batch matches the sync batch."""
+        texts = ["", "Hi", "Hello, world!"]
+        assert await count_tokens_batch_async(texts, model="gpt-4") == count_tokens_batch(texts, model="gpt-4")
+
+
+class TestCountJson:
+    """Tests for the text count_json tokenizes."""
+
+    def test_count_json_is_compact_utf8(self, fake_encoding):
+        """Test count_json counts the compact, non-ASCII-escaped JSON text."""
+        data = {"name": "你好", "items": [1, 2, 3], "nested": {"k": None}}
+        compact = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        assert TokenCounter.count_json(data) == count_tokens(compact)
+        assert TokenCounter.count_json(data) < count_tokens(json.dumps(data))
+
+    def test_count_json_cached(self, fake_encoding):
+        """Test a repeated dict is tokenized once per encoder."""
+        encoder = TokenCounter.get_encoder()
+        TokenCounter.count_json({"cached": "fragment"})
+        TokenCounter.count_json({"cached": "fragment"})
+        assert encoder.calls == ["encode_ordinary"]
+
+        TokenCounter.count_json({"cached": "fragment"}, encoding="cl100k_base")
+        assert TokenCounter.get_encoder(encoding="cl100k_base").calls == ["encode_ordinary"]
+
+    def test_count_json_cache_holds_digests(self, fake_encoding, monkeypatch):
+        """Test the count_json cache keeps fixed-size keys and stays bounded."""
+        monkeypatch.setattr(tokens, "_JSON_COUNTS_MAX", 4)
+        for i in range(10):
+            TokenCounter.count_json({"payload": "x" * 10000, "i": i})
+
+        assert len(tokens._json_counts) == 4
+        assert all(name == "o200k_base" and len(digest) == 16 for name, digest in tokens._json_counts)
+
+        TokenCounter.clear_cache()
+        assert not tokens._json_counts
+
+
 class TestCountTokensFunction:
     """Tests for the count_tokens convenience function."""
 
@@ -107,8 +470,7 @@ class TestTokenCountingAccuracy:
 
     def test_longer_text_more_tokens(self):
         """Test that longer text has more tokens."""
-        short = count_tokens("Hi")
-        long = count_tokens("Hello, this is a much longer sentence with many words.")
+        short, long = TokenCounter.count_batch(["Hi", "Hello, this is a much longer sentence with many words."])
         assert long > short
 
     def test_special_characters(self):
@@ -128,31 +490,119 @@ def hello_world():
 
     def test_json_structure(self):
         """Test that JSON structure tokens are counted."""
-        simple = TokenCounter.count_json({"a": "b"})
-        complex = TokenCounter.count_json({
+        simple_data = {"a": "b"}
+        complex_data = {
             "a": "b",
             "c": {"d": "e", "f": [1, 2, 3]},
             "g": "longer string value"
-        })
+        }
+        simple = TokenCounter.count_json(simple_data)
+        complex = TokenCounter.count_json(complex_data)
         assert complex > simple
+        assert [simple, complex] == count_tokens_batch([_dumps(simple_data), _dumps(complex_data)])
+        assert simple == count_tokens('{"a":"b"}')
+
+
+ACCURACY_TEXTS = [
+    "Hello",
+    "Hi",
+    "Hello, this is a much longer sentence with many words.",
+    "Hello! @#$%^&*() 你好",
+    """
+def hello_world():
+    print("Hello, World!")
+    return True
+""",
+    '{"a":"b"}',
+]
+
+
+class TestCountBytes:
+    """Tests for counting UTF-8 bytes."""
+
+    @pytest.mark.parametrize("text", ACCURACY_TEXTS)
+    def test_count_bytes_matches_str(self, byte_encoding, text):
+        """Test bytes, bytearray and memoryview count the same as the decoded str."""
+        data = text.encode("utf-8")
+        expected = count_tokens(data.decode("utf-8"))
+        assert TokenCounter.count_bytes(data) == expected
+        assert TokenCounter.count_bytes(bytearray(data)) == expected
+        assert TokenCounter.count_bytes(memoryview(data)) == expected
+
+    def test_count_bytes_rejects_invalid_utf8(self, byte_encoding):
+        """Test invalid UTF-8 raises instead of being replaced."""
+        with pytest.raises(UnicodeDecodeError):
+            TokenCounter.count_bytes(b"abc\xff")
+
+    def test_count_bytes_rejects_str(self, byte_encoding):
+        """Test a str is rejected."""
+        with pytest.raises(TypeError):
+            TokenCounter.count_bytes("Hello")
+
+
+class TestHFBackend:
+    """Tests for the optional Hugging Face tokenizers backend."""
+
+    def test_unknown_backend(self):
+        """Test an unknown backend name is rejected."""
+        with pytest.raises(ValueError):
+            TokenCounter.count("Hello", backend="sentencepiece")
+
+    def test_hf_unavailable(self, monkeypatch):
+        """Test the hf backend raises ImportError without tokenizers."""
+        monkeypatch.setattr(tokens_hf, "TOKENIZERS_AVAILABLE", False)
+        monkeypatch.setattr(tokens_hf.HFTokenCounter, "_tokenizers", {})
+        with pytest.raises(ImportError):
+            TokenCounter.count("Hello", backend="hf")
+
+    def test_hf_backend_matches_roughly(self):
+        """Test hf counts stay within 5% of tiktoken on a code snippet."""
+        pytest.importorskip("tokenizers")
+        code = """
+def hello_world():
+    print("Hello, World!")
+    return True
+"""
+        tiktoken_count = TokenCounter.count(code, model="gpt-4o")
+        hf_count, = TokenCounter.count_batch([code], backend="hf")
+        assert abs(hf_count - tiktoken_count) / tiktoken_count < 0.05
+
+
+@pytest.fixture(scope="module")
+def sample_text():
+    """Short text shared by the model encoding tests."""
+    return "Test"
+
+
+def _assert_model_maps_to_encoding(model, encoding, text):
+    """Assert model resolves to encoding's encoder and counts text with it."""
+    encoder = TokenCounter.get_encoder(encoding=encoding)
+    assert TokenCounter.get_encoder(model=model) is encoder
+    assert TokenCounter.count(text, model=model) == len(encoder.encode_ordinary(text))
 
 
 class TestModelEncodings:
     """Tests for model-to-encoding mappings."""
 
-    def test_gpt4o_encoding(self):
-        """Test GPT-4o uses o200k_base."""
-        text = "Test"
-        count = TokenCounter.count(text, model="gpt-4o")
-        count_direct = TokenCounter.count(text, encoding="o200k_base")
-        assert count == count_direct
-
-    def test_gpt4_encoding(self):
-        """Test GPT-4 uses cl100k_base."""
-        text = "Test"
-        count = TokenCounter.count(text, model="gpt-4")
-        count_direct = TokenCounter.count(text, encoding="cl100k_base")
-        assert count == count_direct
+    @pytest.mark.parametrize("model, encoding", [
+        ("gpt-4o", "o200k_base"),
+        ("gpt-4", "cl100k_base"),
+    ])
+    def test_model_encoding(self, model, encoding, sample_text):
+        """Test GPT-4o uses o200k_base and GPT-4 uses cl100k_base."""
+        _assert_model_maps_to_encoding(model, encoding, sample_text)
+
+    @pytest.mark.parametrize("model, expected", [
+        ("gpt-4o", "o200k_base"),
+        ("gpt-4o-2024-08-06", "o200k_base"),
+        ("gpt-4-0613", "cl100k_base"),
+        ("gpt-3.5-turbo-0125", "cl100k_base"),
+        ("claude-3-haiku", "cl100k_base"),
+        ("unknown-model-xyz", "o200k_base"),
+    ])
+    def test_model_resolution(self, fake_encoding, model, expected):
+        """Test exact, dated-variant and unknown model names resolve to an encoding."""
+        assert TokenCounter.get_encoder(model=model).name == expected
 
     def test_unknown_model_uses_default(self):
         """Test unknown model falls back to default encoding."""